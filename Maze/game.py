@@ -1,7 +1,5 @@
 import math
 import heapq
-import numpy as np
-import matplotlib.pyplot as plt
 from typing import Tuple, List, Dict, Optional
 
 # Direction vectors: Up, Right, Down, Left
@@ -44,8 +42,30 @@ def reconstruct_path(parents, end_state):
     return [state for state, _ in path]
 
 
-def astar_search(maze, start, goal, start_orient=0, verbose=True):
-    """A* algorithm with constrained movement."""
+def console_tracer(event, position, orient, g, f, **details):
+    """Print search events in the POP/PUSH log format."""
+    r, c = position
+    if event == "pop":
+        print(
+            f"POP: Pos=({r},{c}) Dir={DIR_NAMES[orient]} g={g:.2f} h={details['h']:.2f} f={f:.2f}"
+        )
+    elif event == "push":
+        print(
+            f"  PUSH: ({r},{c}) Dir={DIR_NAMES[orient]} Action={details['action']} g={g} h={details['h']:.2f} f={f:.2f}"
+        )
+    elif event == "goal":
+        print("\nGOAL reached! Reconstructing path...\n")
+
+
+def astar_search(maze, start, goal, start_orient=0, verbose=True, tracer=None):
+    """A* algorithm with constrained movement.
+
+    ``tracer(event, position, orient, g, f, **details)`` receives "pop",
+    "push" and "goal" events; ``verbose`` without a tracer prints them with
+    ``console_tracer``.
+    """
+    if tracer is None and verbose:
+        tracer = console_tracer
     rows, cols = len(maze), len(maze[0])
     start_state = (start[0], start[1], start_orient)
     goal_r, goal_c = goal
@@ -61,15 +81,14 @@ def astar_search(maze, start, goal, start_orient=0, verbose=True):
         f, current = heapq.heappop(open_list)
         r, c, orient = current
         g_curr = g[current]
-        h_curr = heuristic(r, c, goal_r, goal_c)
-        if verbose:
-            print(
-                f"POP: Pos=({r},{c}) Dir={DIR_NAMES[orient]} g={g_curr:.2f} h={h_curr:.2f} f={f:.2f}"
-            )
+        if tracer is not None:
+            h_curr = heuristic(r, c, goal_r, goal_c)
+            tracer("pop", (r, c), orient, g_curr, f, h=h_curr)
 
         # Goal check
         if (r, c) == (goal_r, goal_c):
-            print("\nGOAL reached! Reconstructing path...\n")
+            if tracer is not None:
+                tracer("goal", (r, c), orient, g_curr, f)
             return reconstruct_path(parents, current)
 
         closed.add(current)
@@ -84,17 +103,20 @@ def astar_search(maze, start, goal, start_orient=0, verbose=True):
                 h = heuristic(next_state[0], next_state[1], goal_r, goal_c)
                 f_new = tentative_g + h
                 heapq.heappush(open_list, (f_new, next_state))
-                if verbose:
+                if tracer is not None:
                     r2, c2, o2 = next_state
-                    print(
-                        f"  PUSH: ({r2},{c2}) Dir={DIR_NAMES[o2]} Action={action} g={tentative_g} h={h:.2f} f={f_new:.2f}"
-                    )
-    print("No path found under the movement constraints.")
+                    tracer("push", (r2, c2), o2, tentative_g, f_new, h=h, action=action)
+    if verbose:
+        print("No path found under the movement constraints.")
     return None
 
 
 def visualize(maze, path, start, goal, filename="maze_solution.png"):
     """Plot maze and overlay the found path."""
+    # Plotting libraries load only when a plot is asked for.
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     maze_array = np.array(maze)
     plt.imshow(maze_array, cmap="binary_r")
     if path:
@@ -1,7 +1,5 @@
 import heapq
 import math
-import matplotlib.pyplot as plt
-import numpy as np
 
 
 class Node:
@@ -41,7 +39,24 @@ def is_valid_move(maze, pos):
     return 0 <= r < rows and 0 <= c < cols and maze[r][c] == 0
 
 
-def solve_maze_a_star(maze, start_pos, end_pos):
+def console_tracer():
+    """Tracer that prints every pop, like this solver always used to."""
+    step_count = 0
+
+    def trace(event, position, direction, g_cost, f_cost, **details):
+        nonlocal step_count
+        if event == "pop":
+            print(
+                f"Step {step_count}: Current Position: {position}, Facing: {list(DIRECTIONS.keys())[direction]}"
+            )
+            step_count += 1
+
+    return trace
+
+
+def solve_maze_a_star(maze, start_pos, end_pos, tracer=None):
+    """A* search; ``tracer(event, position, direction, g_cost, f_cost)`` is
+    called on "pop", "push", "closed_skip" and "goal" events when given."""
     rows, cols = len(maze), len(maze[0])
 
     start_direction = 3
@@ -54,17 +69,27 @@ def solve_maze_a_star(maze, start_pos, end_pos):
 
     closed_list = set()
 
-    step_count = 0
-
     while open_list:
         current_node = heapq.heappop(open_list)
 
-        print(
-            f"Step {step_count}: Current Position: {current_node.position}, Facing: {list(DIRECTIONS.keys())[current_node.direction]}"
-        )
-        step_count += 1
+        if tracer is not None:
+            tracer(
+                "pop",
+                current_node.position,
+                current_node.direction,
+                current_node.g_cost,
+                current_node.f_cost,
+            )
 
         if current_node.position == end_pos:
+            if tracer is not None:
+                tracer(
+                    "goal",
+                    current_node.position,
+                    current_node.direction,
+                    current_node.g_cost,
+                    current_node.f_cost,
+                )
             path = []
             while current_node:
                 path.append(current_node.position)
@@ -72,6 +97,14 @@ def solve_maze_a_star(maze, start_pos, end_pos):
             return path[::-1]
 
         if (current_node.position, current_node.direction) in closed_list:
+            if tracer is not None:
+                tracer(
+                    "closed_skip",
+                    current_node.position,
+                    current_node.direction,
+                    current_node.g_cost,
+                    current_node.f_cost,
+                )
             continue
         closed_list.add((current_node.position, current_node.direction))
 
@@ -85,6 +118,14 @@ def solve_maze_a_star(maze, start_pos, end_pos):
             )
             if (neighbor_f.position, neighbor_f.direction) not in closed_list:
                 heapq.heappush(open_list, neighbor_f)
+                if tracer is not None:
+                    tracer(
+                        "push",
+                        neighbor_f.position,
+                        neighbor_f.direction,
+                        neighbor_f.g_cost,
+                        neighbor_f.f_cost,
+                    )
 
         next_direction_r = (current_node.direction + 1) % 4
         dr_r, dc_r = DIRECTIONS[next_direction_r]
@@ -99,6 +140,14 @@ def solve_maze_a_star(maze, start_pos, end_pos):
             )
             if (neighbor_r.position, neighbor_r.direction) not in closed_list:
                 heapq.heappush(open_list, neighbor_r)
+                if tracer is not None:
+                    tracer(
+                        "push",
+                        neighbor_r.position,
+                        neighbor_r.direction,
+                        neighbor_r.g_cost,
+                        neighbor_r.f_cost,
+                    )
 
         next_direction_l = (current_node.direction - 1 + 4) % 4
         dr_l, dc_l = DIRECTIONS[next_direction_l]
@@ -113,12 +162,26 @@ def solve_maze_a_star(maze, start_pos, end_pos):
             )
             if (neighbor_l.position, neighbor_l.direction) not in closed_list:
                 heapq.heappush(open_list, neighbor_l)
+                if tracer is not None:
+                    tracer(
+                        "push",
+                        neighbor_l.position,
+                        neighbor_l.direction,
+                        neighbor_l.g_cost,
+                        neighbor_l.f_cost,
+                    )
 
     return None
 
 
 def visualize_maze(maze, path, start_pos, end_pos):
-    fig, ax = plt.subplots(figsize=(len(maze[0]), len(maze)))
+    # Plotting libraries load only when a plot is asked for.
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    # One inch per cell, shrunk so the figure stays at most 12 inches a side.
+    scale = min(1.0, 12 / max(len(maze), len(maze[0])))
+    fig, ax = plt.subplots(figsize=(len(maze[0]) * scale, len(maze) * scale))
 
     maze_display = np.array(maze)
     ax.imshow(maze_display, cmap="binary", origin="upper")
@@ -127,7 +190,12 @@ def visualize_maze(maze, path, start_pos, end_pos):
         path_rows = [p[0] for p in path]
         path_cols = [p[1] for p in path]
         ax.plot(
-            path_cols, path_rows, color="red", linewidth=2, marker="o", markersize=4
+            path_cols,
+            path_rows,
+            color="red",
+            linewidth=2,
+            marker="o" if len(path) <= 200 else None,
+            markersize=4,
         )
 
     ax.plot(
@@ -173,7 +241,9 @@ if __name__ == "__main__":
     print(
         f"Solving maze from {start_point} to {end_point} with complex movement constraints..."
     )
-    found_path = solve_maze_a_star(maze, start_point, end_point)
+    found_path = solve_maze_a_star(
+        maze, start_point, end_point, tracer=console_tracer()
+    )
 
     if found_path:
         print("\nPath Found! Visualizing the solution...")
@@ -1,10 +1,24 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import tkinter as tk
-from tkinter import messagebox
 from queue import PriorityQueue
+from array import array
+import heapq
 import random
+import threading
+import time
+
+# The GUI stack is imported by _load_gui() on first use, so generating and
+# solving mazes never pays for matplotlib or tkinter.
+plt = tk = messagebox = FigureCanvasTkAgg = None
+
+
+def _load_gui():
+    global plt, tk, messagebox, FigureCanvasTkAgg
+    if tk is None:
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        import tkinter as tk
+        from tkinter import messagebox
+
 
 DIRECTIONS = {
     0: (-1, 0),
@@ -25,6 +39,50 @@ TURN_MAP = {
 }
 
 
+# Pops (or carved cells) between progress reports from a long-running job.
+PROGRESS_INTERVAL = 4096
+
+
+class Cancelled(Exception):
+    """Raised inside a background job after its cancel() was called."""
+
+
+class BackgroundJob:
+    """Runs ``work(report)`` on a daemon thread.
+
+    ``work`` calls ``report(done, total=None)`` now and then; that records
+    its progress and raises ``Cancelled`` once ``cancel()`` was called. The
+    Tk side polls ``done``, ``progress``, ``result`` and ``error`` from
+    ``master.after`` callbacks, so no widget is touched off the main thread.
+    """
+
+    def __init__(self, work):
+        self.progress = (0, None)
+        self.result = None
+        self.error = None
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(work,), daemon=True)
+        self._thread.start()
+
+    def _run(self, work):
+        try:
+            self.result = work(self.report)
+        except Exception as error:
+            self.error = error
+
+    def report(self, done, total=None):
+        self.progress = (done, total)
+        if self._cancel.is_set():
+            raise Cancelled()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def done(self):
+        return not self._thread.is_alive()
+
+
 # Heuristic function
 def h_euclidean(cell1_pos, cell2_pos):
     x1, y1 = cell1_pos
@@ -40,17 +98,23 @@ class RandomMazeGenerator:
         self.grid = np.ones((self.rows, self.cols), dtype=int)
 
     # Generates a maze using Randomized DFS algorithm.
-    def generate(self, start_r=None, start_c=None):
+    def generate(self, start_r=None, start_c=None, progress=None):
 
         if start_r is None:
             start_r = random.randint(0, self.rows - 1)
         if start_c is None:
             start_c = random.randint(0, self.cols - 1)
 
+        # Carved cells are exactly the visited ones, so the grid itself is
+        # the visited set. grid[r, c] indexes without building a row view.
+        grid = self.grid
         stack = [(start_r, start_c)]
-        visited = set()
-        visited.add((start_r, start_c))
-        self.grid[start_r][start_c] = 0
+        grid[start_r, start_c] = 0
+        # Every cell two steps apart from the start gets carved.
+        total = len(range(start_r % 2, self.rows, 2)) * len(
+            range(start_c % 2, self.cols, 2)
+        )
+        carved = 1
 
         while stack:
             current_r, current_c = stack[-1]
@@ -59,11 +123,7 @@ class RandomMazeGenerator:
             # Check 4 directions for neighbors that are 2 steps away (to ensure walls in between)
             for dr, dc in [(-2, 0), (2, 0), (0, -2), (0, 2)]:
                 nr, nc = current_r + dr, current_c + dc
-                if (
-                    0 <= nr < self.rows
-                    and 0 <= nc < self.cols
-                    and (nr, nc) not in visited
-                ):
+                if 0 <= nr < self.rows and 0 <= nc < self.cols and grid[nr, nc]:
                     unvisited_neighbors.append(
                         ((nr, nc), (current_r + dr // 2, current_c + dc // 2))
                     )
@@ -71,10 +131,12 @@ class RandomMazeGenerator:
             if unvisited_neighbors:
                 (next_r, next_c), (wall_r, wall_c) = random.choice(unvisited_neighbors)
 
-                self.grid[wall_r][wall_c] = 0
-                self.grid[next_r][next_c] = 0
-                visited.add((next_r, next_c))
+                grid[wall_r, wall_c] = 0
+                grid[next_r, next_c] = 0
                 stack.append((next_r, next_c))
+                carved += 1
+                if progress is not None and carved % PROGRESS_INTERVAL == 0:
+                    progress(carved, total)
             else:
                 stack.pop()
 
@@ -127,7 +189,26 @@ class MazeSolver:
 
         return neighbors
 
-    def solve_maze_a_star(self):
+    def solve_maze_a_star(self, store="dense", progress=None, record=None):
+        """A* from the start node; returns the list of cells or None.
+
+        ``store`` picks where g-scores live: ``"dense"`` pre-fills dicts for
+        every (cell, direction) state, ``"sparse"`` keeps only the states
+        the search reaches, and ``"array"`` uses flat integer arrays. All
+        three return the same path; the last two use far less memory.
+        ``progress(popped)``, if given, is called every PROGRESS_INTERVAL
+        pops (see ``BackgroundJob.report``). ``record``, if given (e.g. an
+        ``array("i")``), gets the cell index ``r * cols + c`` of every
+        popped state appended in pop order, for ``SearchPlayback``.
+        """
+        if store == "sparse":
+            return self._solve_sparse(progress, record)
+        if store == "array":
+            return self._solve_array(progress, record)
+        if store != "dense":
+            raise ValueError(
+                f"Unknown store {store!r}. Use 'dense', 'sparse' or 'array'."
+            )
 
         open_set = PriorityQueue()
         open_set.put((0, self.start_node))  # (f_score, node)
@@ -150,10 +231,16 @@ class MazeSolver:
 
         g_score[self.start_node] = 0
         f_score[self.start_node] = h_euclidean(self.start_pos, self.end_pos)
+        popped = 0
 
         while not open_set.empty():
             current_f, current_node = open_set.get()
             current_pos, current_dir = current_node
+            popped += 1
+            if progress is not None and popped % PROGRESS_INTERVAL == 0:
+                progress(popped)
+            if record is not None:
+                record.append(current_pos[0] * self.cols + current_pos[1])
 
             if current_pos == self.end_pos:
                 path = []
@@ -179,14 +266,178 @@ class MazeSolver:
 
         return None
 
+    def _solve_sparse(self, progress=None, record=None):
+        # Unreached states are simply absent from g_score; f is only ever
+        # needed as the queue key, so it is not stored.
+        open_set = [(0, self.start_node)]
+        came_from = {}
+        g_score = {self.start_node: 0}
+        inf = float("inf")
+        popped = 0
+
+        while open_set:
+            current_f, current_node = heapq.heappop(open_set)
+            current_pos, current_dir = current_node
+            popped += 1
+            if progress is not None and popped % PROGRESS_INTERVAL == 0:
+                progress(popped)
+            if record is not None:
+                record.append(current_pos[0] * self.cols + current_pos[1])
+
+            if current_pos == self.end_pos:
+                path = []
+                current_path_node = current_node
+                while current_path_node != self.start_node:
+                    path.append(current_path_node[0])
+                    current_path_node = came_from[current_path_node]
+                path.append(self.start_node[0])
+                return path[::-1]
+
+            tentative_g_score = g_score[current_node] + 1
+            for next_full_node, action_desc in self.get_neighbors(current_node):
+                if tentative_g_score < g_score.get(next_full_node, inf):
+                    came_from[next_full_node] = current_node
+                    g_score[next_full_node] = tentative_g_score
+                    heapq.heappush(
+                        open_set,
+                        (
+                            tentative_g_score
+                            + h_euclidean(next_full_node[0], self.end_pos),
+                            next_full_node,
+                        ),
+                    )
+
+        return None
+
+    def _solve_array(self, progress=None, record=None):
+        # State ((r, c), d) is index (r * cols + c) * 4 + d; index order is
+        # tuple order, so the heap breaks ties exactly as the dense store.
+        rows, cols = self.rows, self.cols
+        unreached = 2**31 - 1
+        g_score = array("i", [unreached]) * (rows * cols * 4)
+        came_from = array("i", [-1]) * (rows * cols * 4)
+        # Flat list of plain ints: indexing it skips NumPy's per-element cost.
+        grid = np.asarray(self.maze_grid).ravel().tolist()
+        (start_r, start_c), start_dir = self.start_node
+        start = (start_r * cols + start_c) * 4 + start_dir
+        g_score[start] = 0
+        open_set = [(0, start)]
+        popped = 0
+
+        while open_set:
+            current_f, current = heapq.heappop(open_set)
+            popped += 1
+            if progress is not None and popped % PROGRESS_INTERVAL == 0:
+                progress(popped)
+            cell, current_dir = divmod(current, 4)
+            if record is not None:
+                record.append(cell)
+            r, c = divmod(cell, cols)
+
+            if (r, c) == self.end_pos:
+                path = []
+                while current != start:
+                    path.append(divmod(current >> 2, cols))
+                    current = came_from[current]
+                path.append(self.start_pos)
+                return path[::-1]
+
+            tentative_g_score = g_score[current] + 1
+            # Forward, turn right, turn left: the order of get_neighbors.
+            for next_dir in (
+                current_dir,
+                TURN_MAP[(current_dir, "R")],
+                TURN_MAP[(current_dir, "L")],
+            ):
+                dr, dc = DIRECTIONS[next_dir]
+                next_r, next_c = r + dr, c + dc
+                if not (0 <= next_r < rows and 0 <= next_c < cols):
+                    continue
+                next_cell = next_r * cols + next_c
+                if grid[next_cell] != 0:
+                    continue
+                next_state = next_cell * 4 + next_dir
+                if tentative_g_score < g_score[next_state]:
+                    came_from[next_state] = current
+                    g_score[next_state] = tentative_g_score
+                    heapq.heappush(
+                        open_set,
+                        (
+                            tentative_g_score
+                            + h_euclidean((next_r, next_c), self.end_pos),
+                            next_state,
+                        ),
+                    )
+
+        return None
+
+
+def generate_maze_with_endpoints(rows, cols, progress=None):
+    """A new maze plus two distinct random walkable cells: (grid, start, end)."""
+    grid = RandomMazeGenerator(rows, cols).generate(progress=progress)
+    walkable_cells = np.argwhere(grid == 0)
+    if len(walkable_cells) < 2:
+        raise ValueError("Maze too small or no walkable path to place start/end.")
+    start_i, end_i = random.sample(range(len(walkable_cells)), 2)
+    start_pos = tuple(int(v) for v in walkable_cells[start_i])
+    end_pos = tuple(int(v) for v in walkable_cells[end_i])
+    return grid, start_pos, end_pos
+
+
+# Display values: the maze's 0 (open) and 1 (wall), plus explored cells.
+EXPLORED = 2
+# Search playback: delay between frames, target length, slowest reveal rate.
+FRAME_MS = 20
+PLAYBACK_SECONDS = 10
+MIN_CELLS_PER_SECOND = 3000
+
+
+class SearchPlayback:
+    """A recorded search revealed over time on a display grid.
+
+    ``order`` is the popped cell indices from ``solve_maze_a_star(record=)``;
+    only each cell's first pop is kept. Progress follows the wall clock, not
+    the frame count, so slow frames show more cells each: the whole search
+    plays in about PLAYBACK_SECONDS, never slower than MIN_CELLS_PER_SECOND.
+    """
+
+    def __init__(self, grid, order):
+        self.display = np.array(grid, dtype=np.uint8)
+        cells, first = np.unique(np.asarray(order, dtype=np.int64), return_index=True)
+        cells = cells[np.argsort(first)]
+        self.rows, self.cols = np.divmod(cells, self.display.shape[1])
+        self.total = len(cells)
+        self.shown = 0
+
+    def step(self, elapsed):
+        """Show the cells due ``elapsed`` seconds in; False once all are."""
+        due = max(elapsed * MIN_CELLS_PER_SECOND, elapsed / PLAYBACK_SECONDS * self.total)
+        stop = min(int(due), self.total)
+        if stop > self.shown:
+            shown = slice(self.shown, stop)
+            self.display[self.rows[shown], self.cols[shown]] = EXPLORED
+            self.shown = stop
+        return self.shown < self.total
+
+
+# Smallest and largest grid side offered by the size box.
+MIN_GRID_SIZE = 5
+MAX_GRID_SIZE = 2001
+# Milliseconds between checks on a running background job.
+POLL_MS = 50
+
 
 class MazeApp:
-    def __init__(self, master):
+    def __init__(self, master, size=21, store="sparse"):
+        _load_gui()
         self.master = master
         master.title("Modern A* Maze Solver")
 
-        self.rows = 21
-        self.cols = 21
+        self.rows = size
+        self.cols = size
+        self.store = store
+        self.job = None
+        self.playback = None
         self.maze_grid = None
         self.path = None
         self.start_pos = None
@@ -198,6 +449,7 @@ class MazeApp:
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.master)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+        self.canvas.mpl_connect("draw_event", self.capture_background)
 
         self.button_frame = tk.Frame(master, bg="#000000")
         self.button_frame.pack(side=tk.BOTTOM, fill=tk.X)
@@ -238,43 +490,146 @@ class MazeApp:
         )
         self.clear_button.pack(side=tk.LEFT, padx=10, pady=10, expand=True)
 
-        self.generate_and_plot_maze()
+        self.animate_button = tk.Button(
+            self.button_frame,
+            text="Animate Search",
+            command=self.animate_search,
+            font=("Arial", 12, "bold"),
+            bg="#DAA520",
+            fg="white",
+            relief=tk.RAISED,
+            bd=3,
+        )
+        self.animate_button.pack(side=tk.LEFT, padx=10, pady=10, expand=True)
 
-    def generate_and_plot_maze(self):
-        generator = RandomMazeGenerator(self.rows, self.cols)
-        self.maze_grid = generator.generate()
-        self.path = None
+        self.cancel_button = tk.Button(
+            self.button_frame,
+            text="Cancel",
+            command=self.cancel_job,
+            font=("Arial", 12, "bold"),
+            bg="#696969",
+            fg="white",
+            relief=tk.RAISED,
+            bd=3,
+            state=tk.DISABLED,
+        )
+        self.cancel_button.pack(side=tk.LEFT, padx=10, pady=10, expand=True)
+
+        self.size_frame = tk.Frame(self.button_frame, bg="#000000")
+        self.size_frame.pack(side=tk.LEFT, padx=10, pady=10)
+        tk.Label(
+            self.size_frame, text="Size:", font=("Arial", 12), bg="#000000", fg="white"
+        ).pack(side=tk.LEFT)
+        self.size_var = tk.StringVar(value=str(self.rows))
+        self.size_box = tk.Spinbox(
+            self.size_frame,
+            from_=MIN_GRID_SIZE,
+            to=MAX_GRID_SIZE,
+            increment=2,
+            width=6,
+            textvariable=self.size_var,
+            font=("Arial", 12),
+        )
+        self.size_box.pack(side=tk.LEFT)
 
-        walkable_cells = [
-            (r, c)
-            for r in range(self.rows)
-            for c in range(self.cols)
-            if self.maze_grid[r][c] == 0
-        ]
+        self.status = tk.Label(
+            master, text="", anchor="w", font=("Arial", 10), bg="#000000", fg="white"
+        )
+        self.status.pack(side=tk.BOTTOM, fill=tk.X)
 
-        if len(walkable_cells) < 2:
+        self.generate_and_plot_maze()
+
+    def grid_size(self):
+        """The size box value as ``(rows, cols)``, or None after an error box."""
+        try:
+            size = int(self.size_var.get())
+        except ValueError:
+            size = 0
+        if not MIN_GRID_SIZE <= size <= MAX_GRID_SIZE:
             messagebox.showerror(
-                "Error", "Maze too small or no walkable path to place start/end."
+                "Error",
+                f"Size must be a whole number from {MIN_GRID_SIZE} to {MAX_GRID_SIZE}.",
             )
+            return None
+        return size, size
+
+    def run_job(self, label, work, on_done):
+        """Run ``work(report)`` in the background, then ``on_done(result)``."""
+        self.job = BackgroundJob(work)
+        self.job_label = label
+        self.job_done = on_done
+        self.set_busy(True)
+        self.status.config(text=f"{label}...")
+        self.master.after(POLL_MS, self.poll_job)
+
+    def poll_job(self):
+        job = self.job
+        if not job.done:
+            done, total = job.progress
+            text = f"{self.job_label}... {done:,}"
+            if total:
+                text += f" of {total:,}"
+            self.status.config(text=text)
+            self.master.after(POLL_MS, self.poll_job)
             return
 
-        self.start_pos = random.choice(walkable_cells)
+        self.job = None
+        self.set_busy(False)
+        if isinstance(job.error, Cancelled):
+            self.status.config(text=f"{self.job_label} cancelled.")
+        elif job.error is not None:
+            self.status.config(text=f"{self.job_label} failed.")
+            messagebox.showerror("Error", str(job.error))
+        else:
+            self.status.config(text="")
+            self.job_done(job.result)
+
+    def cancel_job(self):
+        if self.playback is not None:
+            self.finish_playback(cancelled=True)
+        elif self.job is not None:
+            self.job.cancel()
+            self.status.config(text=f"Cancelling {self.job_label.lower()}...")
+
+    def set_busy(self, busy):
+        idle_state = tk.DISABLED if busy else tk.NORMAL
+        for widget in (
+            self.generate_button,
+            self.solve_button,
+            self.animate_button,
+            self.clear_button,
+            self.size_box,
+        ):
+            widget.config(state=idle_state)
+        self.cancel_button.config(state=tk.NORMAL if busy else tk.DISABLED)
 
-        self.end_pos = random.choice(walkable_cells)
-        while self.end_pos == self.start_pos:
-            self.end_pos = random.choice(walkable_cells)
+    def generate_and_plot_maze(self):
+        size = self.grid_size()
+        if size is None:
+            return
+        rows, cols = size
+        self.run_job(
+            f"Generating a {rows}x{cols} maze",
+            lambda report: generate_maze_with_endpoints(rows, cols, report),
+            self.maze_generated,
+        )
 
+    def maze_generated(self, result):
+        self.maze_grid, self.start_pos, self.end_pos = result
+        self.rows, self.cols = self.maze_grid.shape
+        self.path = None
         self.plot_maze()
 
-    def plot_maze(self):
+    def plot_maze(self, display=None):
+        """Full redraw; ``display`` may add EXPLORED cells to the maze grid."""
         self.ax.clear()
 
-        cmap = plt.cm.colors.ListedColormap(["#EEEEEE", "#333333"])
-        bounds = [-0.5, 0.5, 1.5]
+        cmap = plt.cm.colors.ListedColormap(["#EEEEEE", "#333333", "#9FD8EF"])
+        bounds = [-0.5, 0.5, 1.5, 2.5]
         norm = plt.cm.colors.BoundaryNorm(bounds, cmap.N)
 
-        self.ax.imshow(
-            self.maze_grid,
+        self.maze_image = self.ax.imshow(
+            self.maze_grid if display is None else display,
             cmap=cmap,
             norm=norm,
             origin="upper",
@@ -287,7 +642,7 @@ class MazeApp:
         self.ax.set_xticklabels([])
         self.ax.set_yticklabels([])
 
-        self.ax.plot(
+        (self.start_marker,) = self.ax.plot(
             self.start_pos[1],
             self.start_pos[0],
             marker=">",
@@ -297,7 +652,7 @@ class MazeApp:
             markeredgewidth=1.5,
             markeredgecolor="black",
         )
-        self.ax.plot(
+        (self.end_marker,) = self.ax.plot(
             self.end_pos[1],
             self.end_pos[0],
             marker="X",
@@ -342,23 +697,108 @@ class MazeApp:
             return
 
         solver = MazeSolver(self.maze_grid, self.start_pos, self.end_pos)
-        self.path = solver.solve_maze_a_star()
+        store = self.store
+        self.run_job(
+            "Solving",
+            lambda report: solver.solve_maze_a_star(store, progress=report),
+            self.path_found,
+        )
 
+    def path_found(self, path, display=None):
+        self.path = path
         if self.path:
             print("\nPath found! Length:", len(self.path))
-            self.plot_maze()
+            self.plot_maze(display)
         else:
             messagebox.showinfo(
                 "No Path", "No path could be found between the start and end points."
             )
-            self.plot_maze()
+            self.plot_maze(display)
+
+    def animate_search(self):
+        if self.maze_grid is None:
+            messagebox.showwarning("Warning", "Please generate a maze first!")
+            return
+
+        solver = MazeSolver(self.maze_grid, self.start_pos, self.end_pos)
+        store = self.store
+
+        def search(report):
+            order = array("i")
+            path = solver.solve_maze_a_star(store, progress=report, record=order)
+            return path, order
+
+        self.run_job("Searching", search, self.play_search)
+
+    def play_search(self, result):
+        """Replay the recorded search by blitting one persistent image."""
+        self.playback_path, order = result
+        self.path = None
+        self.plot_maze()
+        self.playback = SearchPlayback(self.maze_grid, order)
+        self.playback_start = time.perf_counter()
+        # Animated artists are left out of canvas.draw(); the background
+        # grabbed after it is restored each frame before they are redrawn.
+        self.animated = (self.maze_image, self.start_marker, self.end_marker)
+        for artist in self.animated:
+            artist.set_animated(True)
+        self.canvas.draw()
+        self.set_busy(True)
+        self.master.after(FRAME_MS, self.playback_frame)
+
+    def capture_background(self, event):
+        # Runs after every full draw, including resizes mid-playback.
+        if self.playback is not None:
+            self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+
+    def playback_frame(self):
+        playback = self.playback
+        if playback is None:
+            return
+        more = playback.step(time.perf_counter() - self.playback_start)
+        self.maze_image.set_data(playback.display)
+        self.canvas.restore_region(self.background)
+        for artist in self.animated:
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
+        self.status.config(
+            text=f"Explored {playback.shown:,} of {playback.total:,} cells"
+        )
+        if more:
+            self.master.after(FRAME_MS, self.playback_frame)
+        else:
+            self.finish_playback()
+
+    def finish_playback(self, cancelled=False):
+        display = self.playback.display
+        self.playback = None
+        for artist in self.animated:
+            artist.set_animated(False)
+        self.set_busy(False)
+        if cancelled:
+            self.status.config(text="Playback cancelled.")
+            self.plot_maze(display)
+            return
+        self.path_found(self.playback_path, display)
 
     def clear_path(self):
+        if self.maze_grid is None:
+            return
         self.path = None
         self.plot_maze()
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Modern A* Maze Solver")
+    parser.add_argument("--size", type=int, default=21, help="rows and columns")
+    parser.add_argument(
+        "--store", choices=("dense", "sparse", "array"), default="sparse"
+    )
+    args = parser.parse_args()
+
+    _load_gui()
     root = tk.Tk()
-    app = MazeApp(root)
+    app = MazeApp(root, size=args.size, store=args.store)
     root.mainloop()
@@ -1,5 +1,8 @@
 from pyamaze import maze, agent, textLabel
 from queue import PriorityQueue
+from array import array
+import heapq
+import weakref
 
 
 def h(cell1, cell2):
@@ -8,7 +11,125 @@ def h(cell1, cell2):
     return abs(x1 - x2) + abs(y1 - y2)
 
 
-def aStar(m):
+# Bit per open side in ArrayMaze.open_sides.
+OPEN_BITS = {"N": 1, "E": 2, "S": 4, "W": 8}
+
+
+class ArrayMaze:
+    """``m.maze_map`` decoded once into flat arrays for ``aStar_array``.
+
+    Cell ``(r, c)`` (1-indexed) is index ``(r - 1) * cols + (c - 1)``, so
+    index order matches tuple order and ties break as in ``aStar``. The
+    g-score and parent arrays are reused by every search; a cell's entries
+    are only valid when ``mark`` holds the current search's generation, so
+    a search touches just the cells it visits.
+    """
+
+    def __init__(self, m):
+        self.rows, self.cols = m.rows, m.cols
+        n = self.rows * self.cols
+        self.open_sides = bytearray(n)
+        for (r, c), sides in m.maze_map.items():
+            bits = 0
+            for direction, bit in OPEN_BITS.items():
+                if sides[direction]:
+                    bits |= bit
+            self.open_sides[(r - 1) * self.cols + (c - 1)] = bits
+        self.g_score = array("i", [0]) * n
+        self.came_from = array("i", [0]) * n
+        self.mark = array("I", [0]) * n
+        self.generation = 0
+
+    def next_generation(self):
+        self.generation += 1
+        if self.generation > 2**32 - 1:
+            self.mark = array("I", [0]) * len(self.mark)
+            self.generation = 1
+        return self.generation
+
+
+_array_mazes = weakref.WeakKeyDictionary()
+
+
+def array_maze(m):
+    """The cached ``ArrayMaze`` of ``m``; rebuild it with ``ArrayMaze(m)``
+    after changing ``m.maze_map``."""
+    compiled = _array_mazes.get(m)
+    if compiled is None:
+        compiled = _array_mazes[m] = ArrayMaze(m)
+    return compiled
+
+
+def aStar_array(m):
+    """``aStar`` over an ``ArrayMaze`` with ``heapq``; same path dict."""
+    compiled = array_maze(m)
+    cols = compiled.cols
+    open_sides = compiled.open_sides
+    g_score = compiled.g_score
+    came_from = compiled.came_from
+    mark = compiled.mark
+    generation = compiled.next_generation()
+
+    start = compiled.rows * cols - 1
+    end = 0
+    end_r, end_c = divmod(end, cols)
+    # (open side bit, index step, row step, column step), in "ESNW" order.
+    moves = (
+        (OPEN_BITS["E"], 1, 0, 1),
+        (OPEN_BITS["S"], cols, 1, 0),
+        (OPEN_BITS["N"], -cols, -1, 0),
+        (OPEN_BITS["W"], -1, 0, -1),
+    )
+
+    g_score[start] = 0
+    mark[start] = generation
+    start_r, start_c = divmod(start, cols)
+    open_set = [(abs(start_r - end_r) + abs(start_c - end_c), start)]
+
+    while open_set:
+        current_f_score, current = heapq.heappop(open_set)
+
+        if current == end:
+            path = {}
+            while current != start:
+                prev = came_from[current]
+                prev_r, prev_c = divmod(prev, cols)
+                current_r, current_c = divmod(current, cols)
+                path[(prev_r + 1, prev_c + 1)] = (current_r + 1, current_c + 1)
+                current = prev
+            return path
+
+        sides = open_sides[current]
+        tentative_g_score = g_score[current] + 1
+        current_r, current_c = divmod(current, cols)
+        for bit, step, dr, dc in moves:
+            if sides & bit:
+                child = current + step
+                if mark[child] != generation or tentative_g_score < g_score[child]:
+                    mark[child] = generation
+                    came_from[child] = current
+                    g_score[child] = tentative_g_score
+                    f_score = (
+                        tentative_g_score
+                        + abs(current_r + dr - end_r)
+                        + abs(current_c + dc - end_c)
+                    )
+                    heapq.heappush(open_set, (f_score, child))
+
+    return {}
+
+
+def aStar(m, engine="queue"):
+    """A* from the bottom-right cell to ``(1, 1)``; returns ``{cell: next}``.
+
+    ``engine="array"`` runs ``aStar_array``, which decodes ``maze_map``
+    once per maze and avoids the per-cell dicts and queue locks.
+    """
+    if engine == "array":
+        return aStar_array(m)
+    if engine != "queue":
+        raise ValueError(f"Unknown engine {engine!r}. Use 'queue' or 'array'.")
+
     start = (m.rows, m.cols)
     end = (1, 1)
 
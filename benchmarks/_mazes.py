@@ -0,0 +1,64 @@
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_DIR = os.path.join(ROOT, "maze_solver_project")
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+
+def dfs_maze(rows, cols, seed=0):
+    """Seeded randomized-DFS maze; cells on odd coordinates, 0 = path, 1 = wall."""
+    rng = random.Random(seed)
+    maze = [[1] * cols for _ in range(rows)]
+    maze[1][1] = 0
+    stack = [(1, 1)]
+    while stack:
+        r, c = stack[-1]
+        neighbors = [
+            (r + dr, c + dc)
+            for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < r + dr < rows - 1
+            and 0 < c + dc < cols - 1
+            and maze[r + dr][c + dc] == 1
+        ]
+        if neighbors:
+            nr, nc = rng.choice(neighbors)
+            maze[(r + nr) // 2][(c + nc) // 2] = 0
+            maze[nr][nc] = 0
+            stack.append((nr, nc))
+        else:
+            stack.pop()
+    return maze
+
+
+def random_queries(maze, count, seed=0):
+    """Seeded (start_pos, start_facing_direction, end_pos) queries on open cells."""
+    rng = random.Random(seed)
+    cells = [
+        (r, c)
+        for r in range(len(maze))
+        for c in range(len(maze[0]))
+        if maze[r][c] == 0
+    ]
+    queries = []
+    for _ in range(count):
+        start_pos, end_pos = rng.sample(cells, 2)
+        queries.append((start_pos, rng.randrange(4), end_pos))
+    return queries
+
+
+def generator_maze(rows, cols, seed=0, start=None):
+    """Maze from the tkinter app's RandomMazeGenerator, seeded via ``random``.
+
+    ``start`` fixes the carving origin, e.g. ``(0, 0)`` to keep both corners
+    of an odd-sized maze open.
+    """
+    generator_dir = os.path.join(ROOT, "aStar", "numpy_matplotlib_queue_tkinter")
+    if generator_dir not in sys.path:
+        sys.path.insert(0, generator_dir)
+    from aStar import RandomMazeGenerator
+
+    random.seed(seed)
+    return RandomMazeGenerator(rows, cols).generate(*(start or (None, None)))
@@ -0,0 +1,77 @@
+"""Expanded states and wall time for each compiled engine on DFS mazes.
+
+Usage: python benchmarks/bench_engines.py [--sizes 201 801] [--queries 20]
+       [--engines array jps bidirectional] [--braid 0.1]
+"""
+
+import argparse
+import random
+import time
+
+from _mazes import dfs_maze, random_queries
+
+from compiled_maze import CompiledMaze
+from maze_solver import COMPILED_ENGINES, SearchBuffers, _compiled_engine
+
+
+def braid(maze, fraction, seed):
+    """Knock out a fraction of interior walls so the maze has loops."""
+    rng = random.Random(seed)
+    for r in range(1, len(maze) - 1):
+        for c in range(1, len(maze[0]) - 1):
+            if maze[r][c] == 1 and rng.random() < fraction:
+                maze[r][c] = 0
+    return maze
+
+
+def run(compiled, queries, engine):
+    search = _compiled_engine(engine)
+    buffers = SearchBuffers(compiled.n_states)
+    expanded = forward = backward = 0
+    lengths = []
+    start = time.perf_counter()
+    for start_pos, start_direction, end_pos in queries:
+        path = search(compiled, start_pos, start_direction, end_pos, buffers)
+        expanded += buffers.expanded
+        if engine == "bidirectional":
+            forward += buffers.expanded_forward
+            backward += buffers.expanded_backward
+        lengths.append(len(path) if path else None)
+    elapsed = time.perf_counter() - start
+    return expanded, elapsed, lengths, (forward, backward)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[201, 801])
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument(
+        "--engines", nargs="+", choices=COMPILED_ENGINES, default=list(COMPILED_ENGINES)
+    )
+    parser.add_argument(
+        "--braid", type=float, default=0.0, help="fraction of walls to remove"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        maze = braid(dfs_maze(size, size, args.seed), args.braid, args.seed)
+        compiled = CompiledMaze(maze)
+        queries = random_queries(maze, args.queries, args.seed)
+
+        print(f"\nMaze {size}x{size}, braid {args.braid:.0%}, {len(queries)} queries")
+        print(f"  {'engine':<14} {'expanded':>10} {'time (s)':>10}")
+        baseline = None
+        for engine in args.engines:
+            expanded, elapsed, lengths, split = run(compiled, queries, engine)
+            if baseline is None:
+                baseline = (engine, lengths)
+            assert lengths == baseline[1], f"{engine} disagrees with {baseline[0]}"
+            line = f"  {engine:<14} {expanded:>10} {elapsed:>10.3f}"
+            if engine == "bidirectional":
+                line += f"   (forward {split[0]}, backward {split[1]})"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Mazes per second: RandomMazeGenerator vs the vectorized generators.
+
+Usage: python benchmarks/bench_generators.py [--size 101] [--count 200]
+"""
+
+import argparse
+import time
+
+from _mazes import generator_maze
+
+from generators import GENERATORS, generate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=101)
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{args.count} mazes of {args.size}x{args.size}")
+    print(f"  {'generator':<22} {'time (s)':>10} {'mazes/s':>10}")
+
+    # The DFS generator builds one maze at a time; time a slice and scale.
+    sample = max(1, args.count // 20)
+    start = time.perf_counter()
+    for i in range(sample):
+        generator_maze(args.size, args.size, args.seed + i)
+    elapsed = (time.perf_counter() - start) * args.count / sample
+    print(f"  {'RandomMazeGenerator':<22} {elapsed:>10.3f} {args.count / elapsed:>10.0f}")
+
+    for name in GENERATORS:
+        start = time.perf_counter()
+        generate(args.size, args.size, name, seed=args.seed, count=args.count)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<22} {elapsed:>10.3f} {args.count / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
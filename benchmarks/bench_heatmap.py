@@ -0,0 +1,95 @@
+"""Overhead of HeatmapRecorder per engine, with optional heatmap export.
+
+Usage: python benchmarks/bench_heatmap.py [--size 201] [--queries 20]
+       [--output-dir heatmaps]
+
+Solves the same queries untraced and with a HeatmapRecorder attached, and
+reports the slowdown. With ``--output-dir`` the corner-to-corner search of
+every engine is saved as ``<engine>.npz`` plus expansion and first-pop
+heatmap PNGs.
+"""
+
+import argparse
+import os
+import time
+
+from _mazes import generator_maze, random_queries
+
+from heatmap import HeatmapRecorder
+from maze_solver import COMPILED_ENGINES, solve_maze_a_star
+
+ENGINES = ("node",) + COMPILED_ENGINES
+
+
+def _recorder(maze, engine):
+    return HeatmapRecorder(
+        len(maze), len(maze[0]), initial_open=5 if engine == "bidirectional" else 1
+    )
+
+
+def timed(maze, queries, engine, traced):
+    start = time.perf_counter()
+    for query in queries:
+        tracer = _recorder(maze, engine) if traced else None
+        solve_maze_a_star(maze, *query, verbose=False, engine=engine, tracer=tracer)
+    return time.perf_counter() - start
+
+
+def export(maze, engine, out_dir):
+    from visualization import visualize_heatmap
+
+    size = len(maze)
+    recorder = _recorder(maze, engine)
+    path = solve_maze_a_star(
+        maze, (0, 0), 1, (size - 1, size - 1), False, engine, tracer=recorder
+    )
+    recorder.save(os.path.join(out_dir, f"{engine}.npz"))
+    visualize_heatmap(
+        recorder.expansion_counts(),
+        maze,
+        path,
+        title=f"{engine}: expansions",
+        filename=os.path.join(out_dir, f"{engine}_expansions.png"),
+    )
+    visualize_heatmap(
+        recorder.first_pop_times(),
+        maze,
+        path,
+        title=f"{engine}: first pop",
+        label="seconds",
+        filename=os.path.join(out_dir, f"{engine}_first_pop.png"),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=201)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--output-dir")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    maze = generator_maze(args.size, args.size, args.seed, start=(0, 0)).tolist()
+    queries = random_queries(maze, args.queries, args.seed)
+
+    print(f"Maze {args.size}x{args.size}, {len(queries)} queries")
+    print(f"  {'engine':<14} {'plain (s)':>10} {'traced (s)':>11} {'overhead':>9}")
+    for engine in ENGINES:
+        plain = timed(maze, queries, engine, traced=False)
+        traced = timed(maze, queries, engine, traced=True)
+        print(
+            f"  {engine:<14} {plain:>10.3f} {traced:>11.3f} {traced / plain - 1:>8.0%}"
+        )
+
+    if args.output_dir:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        os.makedirs(args.output_dir, exist_ok=True)
+        for engine in ENGINES:
+            export(maze, engine, args.output_dir)
+        print(f"heatmaps written to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Node-expansion report for each heuristic on RandomMazeGenerator mazes.
+
+Usage: python benchmarks/bench_heuristics.py [--sizes 21 51 101 201] [--queries 50]
+"""
+
+import argparse
+import time
+
+from _mazes import generator_maze, random_queries
+
+from compiled_maze import CompiledMaze
+from heuristics import HEURISTICS, LandmarkHeuristic
+from maze_solver import SearchBuffers, _array_search
+
+
+def run(compiled, queries, heuristic):
+    buffers = SearchBuffers(compiled.n_states)
+    expanded = 0
+    lengths = []
+    start = time.perf_counter()
+    for start_pos, start_direction, end_pos in queries:
+        path = _array_search(
+            compiled,
+            start_pos,
+            start_direction,
+            end_pos,
+            buffers,
+            heuristic=heuristic,
+        )
+        expanded += buffers.expanded
+        lengths.append(len(path) if path else None)
+    return expanded, time.perf_counter() - start, lengths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[21, 51, 101, 201])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--landmarks", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        maze = generator_maze(size, size, args.seed)
+        compiled = CompiledMaze(maze)
+        queries = random_queries(maze, args.queries, args.seed)
+
+        build_start = time.perf_counter()
+        landmark = LandmarkHeuristic(maze, count=args.landmarks)
+        build_time = time.perf_counter() - build_start
+
+        heuristics = dict(HEURISTICS)
+        heuristics[f"landmark x{len(landmark.landmarks)}"] = landmark
+
+        print(f"\nMaze {size}x{size}, {len(queries)} queries")
+        print(f"  landmark build: {build_time:.3f} s")
+        print(f"  {'heuristic':<14} {'expanded':>10} {'vs euclid':>10} {'time (s)':>10}")
+        baseline = None
+        for name, heuristic in heuristics.items():
+            expanded, elapsed, lengths = run(compiled, queries, heuristic)
+            if baseline is None:
+                baseline = (expanded, lengths)
+            assert lengths == baseline[1], f"{name} changed path lengths"
+            ratio = expanded / baseline[0] if baseline[0] else 1.0
+            print(f"  {name:<14} {expanded:>10} {ratio:>9.0%} {elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
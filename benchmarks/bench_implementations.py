@@ -0,0 +1,367 @@
+"""Wall time, expansions, peak open list and peak RSS of every A* in the repo.
+
+Usage: python benchmarks/bench_implementations.py [--sizes 21 101 401]
+       [--queries 10] [--engines node array game ...] [--output results.json]
+
+Each (size, engine) pair runs in a fresh process so its peak RSS is its own.
+Every query is solved twice: once untouched for the wall time, and once with
+counters attached (a tracer, a counting PriorityQueue or a counting heapq)
+for the expansion and open-list figures. Sizes up to 4001 work, but the
+default ("dense") tkinter solver builds g/f dictionaries over every state on
+each solve, so keep it to the smaller sizes with ``--engines``; comparing it
+with ``tkinter-sparse`` and ``tkinter-array`` shows the peak RSS those
+stores save.
+"""
+
+import argparse
+import heapq
+import importlib.util
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from queue import PriorityQueue
+
+from _mazes import ROOT, generator_maze, random_queries
+
+# The solvers on the forward/turn-right/turn-left movement model.
+CONSTRAINED_ENGINES = (
+    "node",
+    "array",
+    "jps",
+    "bidirectional",
+    "maze",
+    "game",
+    "tkinter",
+    "tkinter-sparse",
+    "tkinter-array",
+)
+# pyamaze's aStar moves freely between neighbours and always solves the
+# bottom-right to top-left corner query, so it is checked against BFS.
+PYAMAZE_ENGINES = ("pyamaze", "pyamaze-array")
+ENGINES = CONSTRAINED_ENGINES + PYAMAZE_ENGINES
+
+# maze.solve_maze_a_star always starts facing West.
+START_DIRECTION = 3
+
+
+def load_module(relative_path, name):
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(ROOT, relative_path)
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class CountingTracer:
+    """Counts expansions and the open-list high-water mark from trace events.
+
+    An ``open_size`` detail, when an engine sends one, replaces the count.
+    """
+
+    def __init__(self, seeds=1):
+        self.open = self.peak_open = seeds
+        self.expanded = 0
+
+    def __call__(self, event, position, direction, g_cost, f_cost, **details):
+        if event == "push":
+            self.open = details.get("open_size", self.open + 1)
+            if self.open > self.peak_open:
+                self.peak_open = self.open
+        elif event == "pop":
+            self.open = details.get("open_size", self.open - 1)
+            self.expanded += 1
+        elif event == "closed_skip":
+            self.expanded -= 1
+
+
+class CountingQueue(PriorityQueue):
+    """PriorityQueue recording gets and its largest size into ``stats``."""
+
+    stats = None
+
+    def _put(self, item):
+        super()._put(item)
+        if len(self.queue) > self.stats.peak_open:
+            self.stats.peak_open = len(self.queue)
+
+    def _get(self):
+        self.stats.expanded += 1
+        return super()._get()
+
+
+class CountingHeapq:
+    """Stand-in for the ``heapq`` module recording pops and peak heap size."""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def heappush(self, heap, item):
+        heapq.heappush(heap, item)
+        if len(heap) > self.stats.peak_open:
+            self.stats.peak_open = len(heap)
+
+    def heappop(self, heap):
+        self.stats.expanded += 1
+        return heapq.heappop(heap)
+
+
+class GridMap:
+    """The ``rows``/``cols``/``grid``/``maze_map`` view of a grid pyamaze uses.
+
+    Cells are 1-indexed; a direction is open when both cells are paths.
+    """
+
+    def __init__(self, grid):
+        self.rows, self.cols = len(grid), len(grid[0])
+        self.grid = []
+        self.maze_map = {}
+        for r in range(self.rows):
+            for c in range(self.cols):
+                cell = (r + 1, c + 1)
+                self.grid.append(cell)
+                self.maze_map[cell] = {
+                    name: int(
+                        grid[r][c] == 0
+                        and 0 <= r + dr < self.rows
+                        and 0 <= c + dc < self.cols
+                        and grid[r + dr][c + dc] == 0
+                    )
+                    for name, (dr, dc) in (
+                        ("E", (0, 1)),
+                        ("W", (0, -1)),
+                        ("N", (-1, 0)),
+                        ("S", (1, 0)),
+                    )
+                }
+
+
+def prepare(engine, grid):
+    """Returns ``solve(query, counter)`` for ``engine`` and its seed count.
+
+    ``counter`` is None for timed runs and a stats object for counted runs.
+    """
+    if engine in ("node", "array", "jps", "bidirectional"):
+        from compiled_maze import CompiledMaze
+        from maze_solver import solve_maze_a_star
+
+        maze = grid.tolist()
+        if engine != "node":
+            maze = CompiledMaze(maze)
+
+        def solve(query, counter):
+            return solve_maze_a_star(
+                maze, *query, verbose=False, engine=engine, tracer=counter
+            )
+
+        return solve, 5 if engine == "bidirectional" else 1
+
+    if engine == "maze":
+        module = load_module(os.path.join("Maze", "maze.py"), "maze_demo")
+        maze = grid.tolist()
+
+        def solve(query, counter):
+            return module.solve_maze_a_star(maze, query[0], query[2], tracer=counter)
+
+        return solve, 1
+
+    if engine == "game":
+        module = load_module(os.path.join("Maze", "game.py"), "game_demo")
+        maze = grid.tolist()
+
+        def solve(query, counter):
+            path = module.astar_search(
+                maze, query[0], query[2], query[1], verbose=False, tracer=counter
+            )
+            # astar_search leaves the start state off its path.
+            return None if path is None else [query[0]] + path
+
+        return solve, 1
+
+    if engine.startswith("tkinter"):
+        store = engine.partition("-")[2] or "dense"
+        module = load_module(
+            os.path.join("aStar", "numpy_matplotlib_queue_tkinter", "aStar.py"),
+            "tkinter_astar",
+        )
+
+        def solve(query, counter):
+            module.PriorityQueue = PriorityQueue if counter is None else CountingQueue
+            module.heapq = heapq if counter is None else CountingHeapq(counter)
+            CountingQueue.stats = counter
+            # The app hands the solver its NumPy grid directly.
+            solver = module.MazeSolver(grid, query[0], query[2], query[1])
+            return solver.solve_maze_a_star(store)
+
+        return solve, 1
+
+    module = load_module(
+        os.path.join("aStar", "queue_pyamaze", "aStar.py"), "pyamaze_astar"
+    )
+    maze = GridMap(grid.tolist())
+
+    def solve(query, counter):
+        if engine == "pyamaze-array":
+            module.heapq = heapq if counter is None else CountingHeapq(counter)
+            path = module.aStar(maze, engine="array")
+        else:
+            module.PriorityQueue = PriorityQueue if counter is None else CountingQueue
+            CountingQueue.stats = counter
+            path = module.aStar(maze)
+        return [None] * (len(path) + 1) if path else None
+
+    return solve, 1
+
+
+def run_engine(engine, grid_file, queries):
+    """Benchmark one engine in this (fresh) process; returns a result dict."""
+    import numpy as np
+
+    grid = np.load(grid_file)
+    try:
+        begin = time.perf_counter()
+        solve, seeds = prepare(engine, grid)
+        setup = time.perf_counter() - begin
+    except ImportError as error:
+        return {"engine": engine, "skipped": str(error)}
+    rss_baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    wall = 0.0
+    lengths = []
+    for query in queries:
+        begin = time.perf_counter()
+        path = solve(query, None)
+        wall += time.perf_counter() - begin
+        lengths.append(len(path) if path else None)
+
+    expanded = peak_open = 0
+    for query in queries:
+        counter = CountingTracer(seeds)
+        solve(query, counter)
+        expanded += counter.expanded
+        peak_open = max(peak_open, counter.peak_open)
+
+    return {
+        "engine": engine,
+        "queries": len(queries),
+        "solved": sum(length is not None for length in lengths),
+        "setup_seconds": round(setup, 6),
+        "wall_seconds": round(wall, 6),
+        "expanded": expanded,
+        "peak_open": peak_open,
+        "rss_baseline_kb": rss_baseline,
+        "rss_peak_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "lengths": lengths,
+    }
+
+
+def bfs_length(grid, start_pos, end_pos):
+    """Cells on a shortest free-turning path, or None."""
+    rows, cols = len(grid), len(grid[0])
+    distance = {start_pos: 1}
+    queue = deque([start_pos])
+    while queue:
+        r, c = queue.popleft()
+        if (r, c) == end_pos:
+            return distance[end_pos]
+        for dr, dc in ((-1, 0), (0, 1), (1, 0), (0, -1)):
+            nr, nc = r + dr, c + dc
+            if (
+                0 <= nr < rows
+                and 0 <= nc < cols
+                and grid[nr][nc] == 0
+                and (nr, nc) not in distance
+            ):
+                distance[nr, nc] = distance[r, c] + 1
+                queue.append((nr, nc))
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[21, 101, 401])
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_implementations.json")
+    args = parser.parse_args()
+
+    import numpy as np
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": [],
+    }
+    failed = False
+    context = get_context("spawn")
+
+    with tempfile.TemporaryDirectory() as scratch:
+        for size in args.sizes:
+            # Carving from (0, 0) keeps both corners open for pyamaze's query.
+            grid = np.asarray(generator_maze(size, size, args.seed, start=(0, 0)))
+            grid_file = os.path.join(scratch, f"maze_{size}.npy")
+            np.save(grid_file, grid)
+            corner = ((size - 1, size - 1), START_DIRECTION, (0, 0))
+            queries = [corner] + [
+                (start_pos, START_DIRECTION, end_pos)
+                for start_pos, _, end_pos in random_queries(
+                    grid.tolist(), args.queries - 1, args.seed
+                )
+            ]
+
+            print(f"\nMaze {size}x{size}, {len(queries)} queries")
+            print(
+                f"  {'engine':<14} {'time (s)':>10} {'expanded':>10} "
+                f"{'peak open':>10} {'peak RSS (MB)':>14}"
+            )
+            reference = None
+            for engine in args.engines:
+                engine_queries = [corner] if engine in PYAMAZE_ENGINES else queries
+                try:
+                    with ProcessPoolExecutor(1, mp_context=context) as pool:
+                        result = pool.submit(
+                            run_engine, engine, grid_file, engine_queries
+                        ).result()
+                except BrokenProcessPool:
+                    result = {"engine": engine, "error": "worker process died"}
+                result["size"] = size
+
+                if "lengths" in result:
+                    lengths = result.pop("lengths")
+                    if engine in PYAMAZE_ENGINES:
+                        expected = [bfs_length(grid, corner[0], corner[2])]
+                    else:
+                        if reference is None:
+                            reference = lengths
+                        expected = reference
+                    result["lengths_agree"] = lengths == expected
+                    failed |= not result["lengths_agree"]
+                    print(
+                        f"  {engine:<14} {result['wall_seconds']:>10.3f} "
+                        f"{result['expanded']:>10} {result['peak_open']:>10} "
+                        f"{result['rss_peak_kb'] / 1024:>14.1f}"
+                        + ("" if result["lengths_agree"] else "   LENGTHS DIFFER")
+                    )
+                else:
+                    reason = result.get("skipped") or result.get("error")
+                    print(f"  {engine:<14} skipped: {reason}")
+                report["results"].append(result)
+
+    with open(args.output, "w") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"\nWrote {args.output}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Cold-start import time of the solver modules, and what they drag in.
+
+Usage: python benchmarks/bench_import_time.py [--repeat 7] [--budget-ms 250]
+
+Each module is imported in a fresh interpreter; the reported time is the
+median over ``--repeat`` runs minus that of an interpreter that imports
+nothing. The script exits with status 1 when a module loads matplotlib or
+tkinter, or takes longer than ``--budget-ms``, so it can guard startup in CI.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from _mazes import PROJECT_DIR, ROOT
+
+GUI_MODULES = ("matplotlib", "tkinter")
+
+# (label, directory put on sys.path, module)
+TARGETS = (
+    ("maze_solver", PROJECT_DIR, "maze_solver"),
+    ("batch", PROJECT_DIR, "batch"),
+    ("batch_cli", PROJECT_DIR, "batch_cli"),
+    ("main", PROJECT_DIR, "main"),
+    ("Maze/game", os.path.join(ROOT, "Maze"), "game"),
+    ("Maze/maze", os.path.join(ROOT, "Maze"), "maze"),
+    ("tkinter aStar", os.path.join(ROOT, "aStar", "numpy_matplotlib_queue_tkinter"), "aStar"),
+)
+
+_PROBE = """\
+import sys
+sys.path.insert(0, {path!r})
+import {module}
+print(",".join(name for name in {gui!r} if name in sys.modules))
+"""
+
+
+def _run(code):
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return time.perf_counter() - start, result.stdout.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=250.0)
+    args = parser.parse_args()
+
+    baseline = statistics.median(_run("pass")[0] for _ in range(args.repeat))
+    print(f"interpreter startup {baseline * 1000:.1f} ms (subtracted below)")
+    print(f"  {'module':<16} {'import (ms)':>12}  GUI modules loaded")
+
+    failed = False
+    for label, path, module in TARGETS:
+        code = _PROBE.format(path=path, module=module, gui=GUI_MODULES)
+        times = []
+        for _ in range(args.repeat):
+            elapsed, loaded = _run(code)
+            times.append(elapsed)
+        import_ms = max(0.0, statistics.median(times) - baseline) * 1000
+        over = import_ms > args.budget_ms
+        failed = failed or over or bool(loaded)
+        note = loaded or "-"
+        if over:
+            note += f"  (over the {args.budget_ms:.0f} ms budget)"
+        print(f"  {label:<16} {import_ms:>12.1f}  {note}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
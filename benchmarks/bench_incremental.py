@@ -0,0 +1,78 @@
+"""Replanning with IncrementalPlanner vs a cold solve after each cell edit.
+
+Usage: python benchmarks/bench_incremental.py [--size 301] [--edits 20]
+"""
+
+import argparse
+import random
+import time
+
+from _mazes import dfs_maze, random_queries
+
+from incremental import IncrementalPlanner
+from maze_solver import solve_maze_a_star
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=301)
+    parser.add_argument("--edits", type=int, default=20)
+    parser.add_argument(
+        "--braid", type=float, default=0.1, help="fraction of walls to remove"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    maze = dfs_maze(args.size, args.size, args.seed)
+    for r in range(1, args.size - 1):
+        for c in range(1, args.size - 1):
+            if maze[r][c] == 1 and rng.random() < args.braid:
+                maze[r][c] = 0
+
+    # Use the longest solvable query of a small sample.
+    best = 0
+    for query in random_queries(maze, 20, args.seed):
+        found = solve_maze_a_star(maze, *query, verbose=False, engine="array")
+        if found and len(found) > best:
+            best = len(found)
+            start_pos, start_direction, end_pos = query
+
+    planner = IncrementalPlanner(maze, start_pos, start_direction, end_pos)
+    begin = time.perf_counter()
+    path = planner.plan()
+    print(f"Maze {args.size}x{args.size}, path of {len(path)} cells")
+    print(f"initial plan: {time.perf_counter() - begin:.3f} s")
+
+    # Alternate edits on the current path (forcing repairs) and anywhere.
+    incremental_time = cold_time = 0.0
+    for i in range(args.edits):
+        if i % 2:
+            r, c = path[rng.randrange(1, len(path) - 1)]
+        else:
+            r, c = rng.randrange(1, args.size - 1), rng.randrange(1, args.size - 1)
+        if (r, c) in (start_pos, end_pos):
+            continue
+        planner.set_cell(r, c, 1 - planner.maze[r][c])
+
+        begin = time.perf_counter()
+        new_path = planner.plan()
+        incremental_time += time.perf_counter() - begin
+
+        begin = time.perf_counter()
+        cold_path = solve_maze_a_star(
+            planner.maze, start_pos, start_direction, end_pos, False, "array"
+        )
+        cold_time += time.perf_counter() - begin
+
+        assert (new_path and len(new_path)) == (cold_path and len(cold_path))
+        if new_path:
+            path = new_path
+
+    print(f"{args.edits} edits, replan total: {incremental_time:.3f} s")
+    print(f"{args.edits} edits, cold total:   {cold_time:.3f} s")
+    print(f"speedup: {cold_time / max(incremental_time, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Images per second: raster PNG/PPM export of solved mazes, serial vs parallel.
+
+Usage: python benchmarks/bench_raster.py [--size 201] [--count 500]
+       [--workers 1 4] [--scale 2] [--large 2001]
+
+Solves the corner-to-corner query on ``--count`` Eller mazes, then writes
+one image per maze to a temporary directory. ``--large`` also times a single
+render of a big maze, which the matplotlib plot could not draw at one inch
+per cell.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import _mazes  # noqa: F401  (puts maze_solver_project on sys.path)
+
+from batch import solve_many
+from generators import generate
+from raster import export_images, render, save_image
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=201)
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--scale", type=int, default=2)
+    parser.add_argument("--large", type=int, default=2001)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    size = args.size
+    mazes = generate(size, size, seed=args.seed, count=args.count)
+    query = ((1, 1), 1, (size - 2, size - 2))
+    paths = [solve_many(maze, [query])[0] for maze in mazes]
+    print(f"{args.count} solved {size}x{size} mazes, {args.scale} px per cell")
+    print(f"  {'format':<6} {'workers':>8} {'time (s)':>10} {'images/s':>10}")
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        for extension in (".png", ".ppm"):
+            for workers in args.workers:
+                jobs = (
+                    (
+                        os.path.join(out_dir, f"maze{i}{extension}"),
+                        maze,
+                        path,
+                        query[0],
+                        query[2],
+                    )
+                    for i, (maze, path) in enumerate(zip(mazes, paths))
+                )
+                start = time.perf_counter()
+                written = sum(1 for _ in export_images(jobs, workers, args.scale))
+                elapsed = time.perf_counter() - start
+                print(
+                    f"  {extension[1:]:<6} {workers:>8} {elapsed:>10.3f}"
+                    f" {written / elapsed:>10.0f}"
+                )
+
+        if args.large:
+            size = args.large
+            maze = generate(size, size, seed=args.seed)
+            path = solve_many(maze, [((1, 1), 1, (size - 2, size - 2))])[0]
+            start = time.perf_counter()
+            image = render(maze, path, (1, 1), (size - 2, size - 2), args.scale)
+            save_image(os.path.join(out_dir, "large.png"), image)
+            elapsed = time.perf_counter() - start
+            print(
+                f"one {size}x{size} maze -> {image.shape[1]}x{image.shape[0]} PNG"
+                f" in {elapsed:.3f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare solve_many against calling solve_maze_a_star once per query.
+
+Usage: python benchmarks/bench_solve_many.py [--size 201] [--queries 200] [--workers N]
+"""
+
+import argparse
+import time
+
+from _mazes import dfs_maze, random_queries
+
+from batch import solve_many
+from maze_solver import solve_maze_a_star
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.3f} s")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=201)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--workers", type=int, default=0, help="also time solve_many with N processes"
+    )
+    args = parser.parse_args()
+
+    maze = dfs_maze(args.size, args.size, args.seed)
+    queries = random_queries(maze, args.queries, args.seed)
+    print(f"Maze {args.size}x{args.size}, {len(queries)} queries")
+
+    node_paths, node_time = timed(
+        "loop, engine='node'",
+        lambda: [
+            solve_maze_a_star(maze, s, d, e, verbose=False) for s, d, e in queries
+        ],
+    )
+    array_paths, array_time = timed(
+        "loop, engine='array'",
+        lambda: [
+            solve_maze_a_star(maze, s, d, e, verbose=False, engine="array")
+            for s, d, e in queries
+        ],
+    )
+    batch_paths, batch_time = timed("solve_many", lambda: solve_many(maze, queries))
+    checked = [array_paths, batch_paths]
+    if args.workers > 1:
+        parallel_paths, parallel_time = timed(
+            f"solve_many, workers={args.workers}",
+            lambda: solve_many(maze, queries, workers=args.workers),
+        )
+        checked.append(parallel_paths)
+
+    for paths in checked:
+        assert [len(p) if p else None for p in paths] == [
+            len(p) if p else None for p in node_paths
+        ], "path lengths disagree"
+
+    print(f"solve_many speedup vs node loop:  {node_time / batch_time:6.1f}x")
+    print(f"solve_many speedup vs array loop: {array_time / batch_time:6.1f}x")
+    if args.workers > 1:
+        print(
+            f"workers={args.workers} speedup vs solve_many: {batch_time / parallel_time:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
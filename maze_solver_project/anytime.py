@@ -0,0 +1,206 @@
+"""Anytime Repairing A* (ARA*) over a ``CompiledMaze``.
+
+Weighted A* (f = g + w * h) finds a path quickly whose cost is at most w
+times the shortest. ARA* runs it with a falling weight and keeps the
+g-values between runs: only states whose cost improved since they were
+expanded are searched again, so each better path costs far less than a
+fresh search.
+"""
+
+import heapq
+import time
+
+from heuristics import get_heuristic
+
+# Pops between deadline checks.
+_CLOCK_INTERVAL = 256
+
+
+def iter_ara_star(
+    compiled,
+    start_pos,
+    start_facing_direction,
+    end_pos,
+    heuristic=None,
+    initial_weight=3.0,
+    weight_step=0.5,
+    deadline=None,
+    tracer=None,
+):
+    """Yield ``(path, bound)`` each time a weighted search improves the path.
+
+    ``bound`` is the proven suboptimality factor: the path costs at most
+    ``bound`` times a shortest one. The weight falls by ``weight_step`` per
+    search down to 1, and the results stop once the bound reaches 1 or the
+    ``time.perf_counter()`` value ``deadline`` passes. A search cut short by
+    the deadline keeps the bound of the last completed one, scaled by any
+    improvement since. Searches that find no cheaper path yield nothing,
+    except that the last one repeats the path if it tightened the bound.
+    The first search always completes, so a reachable end always gives at
+    least one result; an unreachable end gives none. ``heuristic`` must be
+    admissible for the bounds to hold.
+    """
+    if initial_weight < 1:
+        raise ValueError(f"initial_weight must be at least 1, got {initial_weight}.")
+    if weight_step <= 0:
+        raise ValueError(f"weight_step must be positive, got {weight_step}.")
+    heuristic = get_heuristic(heuristic)
+    cols = compiled.cols
+    offsets = compiled.offsets_view
+    targets = compiled.targets_view
+    end_cell = end_pos[0] * cols + end_pos[1]
+    clock = time.perf_counter
+
+    start = compiled.state_index(start_pos, start_facing_direction)
+    if start >> 2 == end_cell:
+        yield [start_pos], 1.0
+        return
+
+    cell_estimates = {}
+
+    def estimate(idx):
+        cell = idx >> 2
+        value = cell_estimates.get(cell)
+        if value is None:
+            value = cell_estimates[cell] = heuristic(divmod(cell, cols), end_pos)
+        return value
+
+    inf = float("inf")
+    g_cost = {start: 0}
+    parent = {start: -1}
+    weight = float(initial_weight)
+    # Open states and their current keys; heap entries whose key no longer
+    # matches are stale and skipped.
+    open_keys = {start: weight * estimate(start)}
+    open_list = [(open_keys[start], 0, start)]
+    push_count = 1
+    closed = set()
+    # Closed states whose g improved during the current search.
+    inconsistent = set()
+    # Goal states are never pushed: reaching one records it here.
+    goal = -1
+    goal_cost = inf
+    pops = 0
+    # Bound proven by the last search that ran to completion, and the path
+    # cost it was proven for.
+    proven_bound = proven_cost = None
+    yielded_cost = yielded_bound = inf
+
+    while True:
+        timed_out = False
+        while open_list:
+            key, _, idx = open_list[0]
+            if open_keys.get(idx) != key:
+                heapq.heappop(open_list)
+                if tracer is not None:
+                    # A stale entry, as the array engine reports its duplicates.
+                    position = divmod(idx >> 2, cols)
+                    g_stale = g_cost[idx]
+                    size = len(open_keys)
+                    tracer("pop", position, idx & 3, g_stale, key, open_size=size)
+                    tracer("closed_skip", position, idx & 3, g_stale, key)
+                continue
+            if goal_cost <= key:
+                break
+            pops += 1
+            if (
+                deadline is not None
+                and proven_bound is not None
+                and pops % _CLOCK_INTERVAL == 0
+                and clock() > deadline
+            ):
+                timed_out = True
+                break
+
+            heapq.heappop(open_list)
+            del open_keys[idx]
+            closed.add(idx)
+            g_next = g_cost[idx] + 1
+            if tracer is not None:
+                tracer(
+                    "pop",
+                    divmod(idx >> 2, cols),
+                    idx & 3,
+                    g_next - 1,
+                    key,
+                    open_size=len(open_keys),
+                )
+
+            for k in range(offsets[idx], offsets[idx + 1]):
+                next_idx = targets[k]
+                if g_next >= g_cost.get(next_idx, inf):
+                    continue
+                g_cost[next_idx] = g_next
+                parent[next_idx] = idx
+                if next_idx >> 2 == end_cell:
+                    if g_next < goal_cost:
+                        goal_cost = g_next
+                        goal = next_idx
+                elif next_idx in closed:
+                    inconsistent.add(next_idx)
+                else:
+                    next_key = g_next + weight * estimate(next_idx)
+                    open_keys[next_idx] = next_key
+                    heapq.heappush(open_list, (next_key, push_count, next_idx))
+                    push_count += 1
+                    if tracer is not None:
+                        tracer(
+                            "push",
+                            divmod(next_idx >> 2, cols),
+                            next_idx & 3,
+                            g_next,
+                            next_key,
+                            open_size=len(open_keys),
+                        )
+
+        if goal == -1:
+            return
+        if tracer is not None:
+            tracer("goal", end_pos, goal & 3, goal_cost, goal_cost)
+
+        if timed_out:
+            # An interrupted search proves nothing about its weight; the
+            # optimum is still at least proven_cost / proven_bound.
+            bound = max(1.0, goal_cost * proven_bound / proven_cost)
+        else:
+            # Every shorter path must pass through an open or inconsistent
+            # state, so the smallest unweighted f among them bounds the optimum.
+            lower = goal_cost
+            for idx in open_keys.keys() | inconsistent:
+                f_cost = g_cost[idx] + estimate(idx)
+                if f_cost < lower:
+                    lower = f_cost
+            bound = proven_bound = max(1.0, min(weight, goal_cost / lower))
+            proven_cost = goal_cost
+        done = bound <= 1 or timed_out or (deadline is not None and clock() > deadline)
+
+        if goal_cost < yielded_cost or (done and bound < yielded_bound):
+            path = []
+            idx = goal
+            while idx != -1:
+                path.append(divmod(idx >> 2, cols))
+                idx = parent[idx]
+            yielded_cost, yielded_bound = goal_cost, bound
+            yield path[::-1], bound
+        if done:
+            return
+
+        weight = max(1.0, weight - weight_step)
+        open_keys = {idx: g_cost[idx] + weight * estimate(idx) for idx in open_keys}
+        for idx in inconsistent:
+            if idx not in open_keys:
+                open_keys[idx] = key = g_cost[idx] + weight * estimate(idx)
+                if tracer is not None:
+                    tracer(
+                        "push",
+                        divmod(idx >> 2, cols),
+                        idx & 3,
+                        g_cost[idx],
+                        key,
+                        open_size=len(open_keys),
+                    )
+        open_list = [(key, i, idx) for i, (idx, key) in enumerate(open_keys.items())]
+        heapq.heapify(open_list)
+        push_count = len(open_list)
+        inconsistent.clear()
+        closed.clear()
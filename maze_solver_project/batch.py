@@ -0,0 +1,184 @@
+from itertools import islice
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from compiled_maze import CompiledMaze
+from maze_solver import SearchBuffers, _compiled_engine
+
+
+def iter_solve_many(
+    maze, queries, workers=1, chunk_size=None, heuristic=None, engine="array"
+):
+    """Yield ``(query_index, path)`` for each query as soon as it is solved.
+
+    Each query is a ``(start_pos, start_facing_direction, end_pos)`` tuple.
+    The maze is compiled once and the search buffers are shared by every
+    query, so per-query cost is only the search itself.
+
+    With ``workers > 1`` the queries are split into chunks and fanned out to
+    a process pool. The maze is compiled once and its grid and successor
+    table are copied into shared memory; every worker attaches views to
+    them instead of receiving a pickled copy or compiling its own. Only the
+    search buffers are per worker. Results then arrive in completion order,
+    not query order.
+
+    ``heuristic`` is passed to the search; see ``heuristics.py``. ``engine``
+    is ``"array"`` (plain A*), ``"jps"`` (corridor-skipping A*) or
+    ``"bidirectional"`` (A* from both ends).
+    """
+    search = _compiled_engine(engine)
+    if workers > 1:
+        yield from _iter_solve_parallel(
+            maze, queries, workers, chunk_size, heuristic, engine
+        )
+        return
+
+    compiled = maze if isinstance(maze, CompiledMaze) else CompiledMaze(maze)
+    buffers = SearchBuffers(compiled.n_states)
+    for i, (start_pos, start_facing_direction, end_pos) in enumerate(queries):
+        yield i, search(
+            compiled,
+            start_pos,
+            start_facing_direction,
+            end_pos,
+            buffers,
+            heuristic=heuristic,
+        )
+
+
+def solve_many(
+    maze, queries, workers=1, chunk_size=None, heuristic=None, engine="array"
+):
+    """Solve every query against one maze; returns paths in query order."""
+    queries = list(queries)
+    paths = [None] * len(queries)
+    for i, path in iter_solve_many(
+        maze, queries, workers, chunk_size, heuristic, engine
+    ):
+        paths[i] = path
+    return paths
+
+
+# Per-process state set up once by _init_worker.
+_worker_shm = None
+_worker_compiled = None
+_worker_buffers = None
+_worker_heuristic = None
+_worker_search = None
+
+
+def _shared_tables(compiled, engine):
+    """The arrays workers read: the grid and successor table, plus the
+    predecessor table for the bidirectional engine."""
+    tables = {
+        "grid": compiled.grid,
+        "offsets": compiled.offsets,
+        "targets": compiled.targets,
+    }
+    if engine == "bidirectional":
+        tables["rev_offsets"], tables["rev_sources"] = compiled.predecessor_table()
+    return tables
+
+
+def _shared_layout(tables):
+    """``(name, dtype, shape, byte offset)`` of each array in the segment."""
+    layout = []
+    position = 0
+    for name, array in tables.items():
+        # Keep every array aligned for its item size.
+        position = -(-position // 8) * 8
+        layout.append((name, array.dtype.str, array.shape, position))
+        position += array.nbytes
+    return layout, max(position, 1)
+
+
+def _shared_arrays(buf, layout):
+    return {
+        name: np.ndarray(shape, dtype=dtype, buffer=buf, offset=position)
+        for name, dtype, shape, position in layout
+    }
+
+
+def _iter_solve_parallel(maze, queries, workers, chunk_size, heuristic, engine):
+    compiled = maze if isinstance(maze, CompiledMaze) else CompiledMaze(maze)
+    tables = _shared_tables(compiled, engine)
+    del compiled
+    layout, size = _shared_layout(tables)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        shared = _shared_arrays(shm.buf, layout)
+        for name, array in shared.items():
+            array[...] = tables[name]
+        # The segment holds the only copy the pool needs.
+        del shared, array, tables
+
+        if chunk_size is None:
+            if not hasattr(queries, "__len__"):
+                queries = list(queries)
+            chunk_size = max(1, min(256, len(queries) // (workers * 4)))
+
+        with Pool(
+            workers,
+            initializer=_init_worker,
+            initargs=(shm.name, layout, heuristic, engine),
+        ) as pool:
+            for results in pool.imap_unordered(
+                _solve_chunk, _chunked(enumerate(queries), chunk_size)
+            ):
+                yield from results
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _chunked(items, size):
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _attach_shared_memory(name):
+    try:
+        # Python 3.13+: attaching must not hand ownership to this process.
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(shm_name, layout, heuristic, engine):
+    global _worker_shm, _worker_compiled, _worker_buffers
+    global _worker_heuristic, _worker_search
+    _worker_shm = _attach_shared_memory(shm_name)
+    shared = _shared_arrays(_worker_shm.buf, layout)
+    predecessors = None
+    if "rev_offsets" in shared:
+        predecessors = (shared["rev_offsets"], shared["rev_sources"])
+    _worker_compiled = CompiledMaze(
+        shared["grid"],
+        tables=(shared["offsets"], shared["targets"]),
+        predecessors=predecessors,
+    )
+    _worker_buffers = SearchBuffers(_worker_compiled.n_states)
+    _worker_heuristic = heuristic
+    _worker_search = _compiled_engine(engine)
+
+
+def _solve_chunk(chunk):
+    return [
+        (
+            i,
+            _worker_search(
+                _worker_compiled,
+                start_pos,
+                start_facing_direction,
+                end_pos,
+                _worker_buffers,
+                heuristic=_worker_heuristic,
+            ),
+        )
+        for i, (start_pos, start_facing_direction, end_pos) in chunk
+    ]
@@ -0,0 +1,257 @@
+"""Non-interactive batch solving for ``main.py --batch``.
+
+Queries are read from a file or stdin as CSV (header
+``start_r,start_c,direction,end_r,end_c`` plus an optional ``id``) or JSONL
+(``{"start": [r, c], "direction": d, "end": [r, c], "id": ...}``); the
+direction is 0-3 or a name such as ``"North"``. One JSON result per query is
+streamed to stdout, in input order, and a throughput summary goes to
+stderr. A result's ``cost`` is the number of moves, as in
+``SearchResult.cost``; its ``path`` lists ``cost + 1`` cells. Nothing here
+imports matplotlib.
+"""
+
+import csv
+import json
+import sys
+import threading
+import time
+from collections import deque
+from itertools import chain
+
+from maze_solver import DIRECTION_NAMES, is_valid_move
+
+_DIRECTIONS_BY_NAME = {name.lower(): key for key, name in DIRECTION_NAMES.items()}
+
+
+class _Entry:
+    __slots__ = ("index", "id", "query", "error", "cached", "path")
+
+    def __init__(self, index, query_id=None, query=None, error=None):
+        self.index = index
+        self.id = query_id
+        self.query = query
+        self.error = error
+        self.cached = False
+        self.path = None
+
+
+def _direction(value):
+    if isinstance(value, str) and value.strip().lower() in _DIRECTIONS_BY_NAME:
+        return _DIRECTIONS_BY_NAME[value.strip().lower()]
+    direction = int(value)
+    if direction not in DIRECTION_NAMES:
+        raise ValueError(f"direction must be 0-3, got {direction}")
+    return direction
+
+
+def _query(start, direction, end):
+    start_r, start_c = start
+    end_r, end_c = end
+    return (int(start_r), int(start_c)), _direction(direction), (int(end_r), int(end_c))
+
+
+def _parse_csv(lines):
+    for row in csv.DictReader(lines):
+        try:
+            query = _query(
+                (row["start_r"], row["start_c"]),
+                row["direction"],
+                (row["end_r"], row["end_c"]),
+            )
+        except (KeyError, TypeError, ValueError) as error:
+            yield row.get("id"), None, f"malformed query: {error}"
+        else:
+            yield row.get("id"), query, None
+
+
+def _parse_jsonl(lines):
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            query_id = record.get("id")
+            query = _query(record["start"], record["direction"], record["end"])
+        except (AttributeError, KeyError, TypeError, ValueError) as error:
+            yield None, None, f"malformed query: {error}"
+        else:
+            yield query_id, query, None
+
+
+def read_queries(lines, fmt=None):
+    """Yield ``(query_id, query, error)`` for every record in ``lines``.
+
+    ``query`` is ``(start_pos, start_facing_direction, end_pos)``, or None
+    with an ``error`` message for a malformed record. ``fmt`` is ``"csv"``
+    or ``"jsonl"``; by default it is sniffed from the first non-blank line.
+    """
+    lines = iter(lines)
+    first = next((line for line in lines if line.strip()), None)
+    if first is None:
+        return
+    if fmt is None:
+        fmt = "jsonl" if first.lstrip().startswith("{") else "csv"
+    parse = _parse_jsonl if fmt == "jsonl" else _parse_csv
+    yield from parse(chain([first], lines))
+
+
+def _entries(maze, lines, fmt):
+    for index, (query_id, query, error) in enumerate(read_queries(lines, fmt)):
+        if error is None:
+            start_pos, _, end_pos = query
+            if not is_valid_move(maze, start_pos):
+                error = "start is a wall or out of bounds"
+            elif not is_valid_move(maze, end_pos):
+                error = "end is a wall or out of bounds"
+        yield _Entry(index, query_id, query, error)
+
+
+def _record(entry, with_path):
+    record = {"index": entry.index}
+    if entry.id is not None:
+        record["id"] = entry.id
+    if entry.query is not None:
+        start_pos, direction, end_pos = entry.query
+        record.update(start=list(start_pos), direction=direction, end=list(end_pos))
+    if entry.error is not None:
+        record["error"] = entry.error
+        return record
+    path = entry.path
+    record["cost"] = None if path is None else len(path) - 1
+    if with_path:
+        record["path"] = None if path is None else [list(pos) for pos in path]
+    if entry.cached:
+        record["cached"] = True
+    return record
+
+
+def _drain(queue):
+    """Yield and forget the items of a deque, so only unread ones are kept."""
+    while queue:
+        yield queue.popleft()
+
+
+def run_batch(
+    maze,
+    source,
+    fmt=None,
+    engine="array",
+    workers=1,
+    chunk_size=64,
+    heuristic=None,
+    cache=None,
+    with_path=True,
+    out=None,
+    err=None,
+):
+    """Solve every query in ``source`` and stream JSONL results to ``out``.
+
+    Results are written in input order, each with its input ``index``, and
+    an entry is dropped as soon as it is written. With ``workers > 1`` at
+    most ``4 * workers * chunk_size`` queries to solve are held between
+    being read and being written (malformed ones are not counted), so
+    memory is bounded by that window rather than the whole input. With a
+    ``SolutionCache`` the queries are read up front so cached ones are
+    answered before any search starts.
+    """
+    from batch import iter_solve_many
+
+    out = sys.stdout if out is None else out
+    err = sys.stderr if err is None else err
+    begin = time.perf_counter()
+    entries = _entries(maze, source, fmt)
+    maze_key = None
+    if cache is not None:
+        from solution_cache import maze_hash
+
+        maze_key = maze_hash(maze)
+        entries = deque(entries)
+        for entry in entries:
+            if entry.error is None:
+                entry.cached, entry.path = cache.lookup(maze_key, *entry.query, engine)
+        entries = _drain(entries)
+
+    # Results that skip the solver wait here, since the query generator may
+    # be drained by the process pool's feeder thread.
+    bypassed = deque()
+    # Solver job number -> entry, until its path arrives.
+    in_flight = {}
+    # The pool's feeder thread reads queries as fast as it can; each query
+    # to solve takes a slot until it is written. This cannot stall on a
+    # half-filled chunk: the oldest unwritten query is only in that chunk
+    # when every held slot is, and a chunk holds fewer than the window.
+    slots = window = None
+    stopped = False
+    if workers > 1:
+        if chunk_size is None:
+            chunk_size = 64
+        window = 4 * workers * chunk_size
+        slots = threading.Semaphore(window)
+
+    def solver_queries():
+        job = 0
+        for entry in entries:
+            if entry.error is not None or entry.cached:
+                bypassed.append(entry)
+            else:
+                if slots is not None:
+                    slots.acquire()
+                    if stopped:
+                        return
+                in_flight[job] = entry
+                job += 1
+                yield entry.query
+
+    counts = {"solved": 0, "unsolvable": 0, "invalid": 0, "cached": 0}
+    # Finished entries waiting for an earlier index to be written.
+    finished = {}
+    next_index = 0
+
+    def emit_ready():
+        nonlocal next_index
+        while bypassed:
+            entry = bypassed.popleft()
+            finished[entry.index] = entry
+        while next_index in finished:
+            entry = finished.pop(next_index)
+            next_index += 1
+            if entry.error is not None:
+                counts["invalid"] += 1
+            else:
+                counts["solved" if entry.path is not None else "unsolvable"] += 1
+                counts["cached"] += entry.cached
+            out.write(json.dumps(_record(entry, with_path)) + "\n")
+            if slots is not None and entry.error is None and not entry.cached:
+                slots.release()
+
+    results = iter_solve_many(
+        maze, solver_queries(), workers, chunk_size, heuristic, engine
+    )
+    try:
+        for i, path in results:
+            entry = in_flight.pop(i)
+            entry.path = path
+            if cache is not None:
+                cache.store(maze_key, *entry.query, engine, path)
+            finished[entry.index] = entry
+            emit_ready()
+    finally:
+        # Unblock the feeder so the pool can shut down on an error.
+        stopped = True
+        if slots is not None:
+            slots.release(window)
+        results.close()
+    emit_ready()
+    out.flush()
+
+    elapsed = time.perf_counter() - begin
+    # Cached answers count in every total; "cached" is a share of them.
+    total = counts["solved"] + counts["unsolvable"] + counts["invalid"]
+    err.write(
+        f"{total} queries in {elapsed:.3f} s ({total / max(elapsed, 1e-9):.1f}/s),"
+        f" engine={engine}, workers={workers}: {counts['solved']} solved,"
+        f" {counts['unsolvable']} without a path, {counts['invalid']} invalid"
+        + (f" ({counts['cached']} answered from cache)" if cache is not None else "")
+        + "\n"
+    )
+    return counts
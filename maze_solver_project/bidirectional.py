@@ -0,0 +1,212 @@
+import heapq
+import math
+
+from heuristics import EuclideanHeuristic, get_heuristic
+
+
+def bidirectional_search(
+    compiled,
+    start_pos,
+    start_facing_direction,
+    end_pos,
+    buffers,
+    tracer=None,
+    heuristic=None,
+):
+    """Bidirectional A* over the (cell, orientation) states of a ``CompiledMaze``.
+
+    The forward search starts from ``(start_pos, start_facing_direction)``;
+    the backward search starts from all four arrival orientations at
+    ``end_pos`` and walks the reversed forward/turn-right/turn-left moves.
+    Both order their open lists by the average potential
+    ``p(v) = (h(v, end) - h(start, v)) / 2``: the forward key is ``g + p``
+    and the backward key ``g - p``. With a consistent heuristic this is one
+    consistent potential for both sides, so the best meeting cost ``mu``
+    is optimal as soon as the two smallest keys add up to it. Each step
+    expands the side with fewer open states.
+
+    Expansion counts are left in ``buffers.expanded_forward`` and
+    ``buffers.expanded_backward`` (``buffers.expanded`` is their sum).
+    Traced events carry ``side="forward"`` or ``side="backward"``, and
+    their f-cost is the side's key.
+    """
+    heuristic = get_heuristic(heuristic)
+    cols = compiled.cols
+    start_r, start_c = start_pos
+    end_r, end_c = end_pos
+    end_cell = end_r * cols + end_c
+    buffers.expanded = buffers.expanded_forward = buffers.expanded_backward = 0
+
+    if start_r * cols + start_c == end_cell:
+        return [start_pos]
+
+    # The default Euclidean potential is inlined below; others are called.
+    sqrt = math.sqrt
+    if isinstance(heuristic, EuclideanHeuristic):
+        estimate = None
+    else:
+        estimate = heuristic
+
+    def potential(r, c):
+        if estimate is None:
+            to_end = sqrt((r - end_r) ** 2 + (c - end_c) ** 2)
+            from_start = sqrt((r - start_r) ** 2 + (c - start_c) ** 2)
+        else:
+            to_end = estimate((r, c), end_pos)
+            from_start = estimate(start_pos, (r, c))
+        return (to_end - from_start) / 2
+
+    rev_offsets, rev_sources = compiled.predecessor_table()
+    forward = _Side("forward", buffers, compiled.offsets_view, compiled.targets_view)
+    backward = _Side("backward", buffers.reverse, rev_offsets.data, rev_sources.data)
+
+    forward.seed(
+        compiled.state_index(start_pos, start_facing_direction),
+        potential(start_r, start_c),
+    )
+    end_key = -potential(end_r, end_c)
+    for direction in range(4):
+        backward.seed(compiled.state_index(end_pos, direction), end_key)
+
+    # Each side's lists as one tuple, unpacked when the side takes a step.
+    forward_state = forward.state() + backward.meeting_state()
+    backward_state = backward.state() + forward.meeting_state()
+    forward_open = forward.open_list
+    backward_open = backward.open_list
+    # Open states per side, without the stale heap entries left by re-pushes.
+    open_counts = [1, 4]
+    expanded = [0, 0]
+    push_count = 5
+
+    best_cost = float("inf")
+    meeting = -1
+
+    while forward_open and backward_open:
+        # Stale heap entries only make these keys smaller, so the test
+        # never stops early.
+        if forward_open[0][0] + backward_open[0][0] >= best_cost:
+            break
+
+        s = 0 if open_counts[0] <= open_counts[1] else 1
+        (
+            name,
+            open_list,
+            g_cost,
+            parent,
+            mark,
+            open_mark,
+            offsets,
+            targets,
+            sign,
+            other_g,
+            other_mark,
+            other_open,
+        ) = (forward_state, backward_state)[s]
+        closed_mark = open_mark + 1
+
+        key, _, idx = heapq.heappop(open_list)
+        if tracer is not None:
+            position = divmod(idx >> 2, cols)
+            tracer("pop", position, idx & 3, g_cost[idx], key, side=name)
+            if mark[idx] == closed_mark:
+                tracer("closed_skip", position, idx & 3, g_cost[idx], key, side=name)
+        if mark[idx] == closed_mark:
+            continue
+        mark[idx] = closed_mark
+        opened = -1
+        expanded[s] += 1
+
+        g_next = g_cost[idx] + 1
+        for k in range(offsets[idx], offsets[idx + 1]):
+            next_idx = targets[k]
+            next_mark = mark[next_idx]
+            if next_mark == closed_mark:
+                continue
+            if next_mark == open_mark:
+                if g_cost[next_idx] <= g_next:
+                    continue
+            else:
+                opened += 1
+            g_cost[next_idx] = g_next
+            parent[next_idx] = idx
+            mark[next_idx] = open_mark
+            next_r, next_c = divmod(next_idx >> 2, cols)
+            if estimate is None:
+                next_p = (
+                    sqrt((next_r - end_r) ** 2 + (next_c - end_c) ** 2)
+                    - sqrt((next_r - start_r) ** 2 + (next_c - start_c) ** 2)
+                ) / 2
+            else:
+                next_p = potential(next_r, next_c)
+            next_key = g_next + sign * next_p
+            heapq.heappush(open_list, (next_key, push_count, next_idx))
+            push_count += 1
+            if tracer is not None:
+                tracer(
+                    "push", (next_r, next_c), next_idx & 3, g_next, next_key, side=name
+                )
+            if other_mark[next_idx] >= other_open:
+                total = g_next + other_g[next_idx]
+                if total < best_cost:
+                    best_cost = total
+                    meeting = next_idx
+        open_counts[s] += opened
+
+    buffers.expanded_forward, buffers.expanded_backward = expanded
+    buffers.expanded = expanded[0] + expanded[1]
+
+    if meeting == -1:
+        return None
+    if tracer is not None:
+        tracer("goal", divmod(meeting >> 2, cols), meeting & 3, best_cost, best_cost)
+
+    path = []
+    idx = meeting
+    while idx != -1:
+        path.append(divmod(idx >> 2, cols))
+        idx = forward.parent[idx]
+    path.reverse()
+    idx = backward.parent[meeting]
+    while idx != -1:
+        path.append(divmod(idx >> 2, cols))
+        idx = backward.parent[idx]
+    return path
+
+
+class _Side:
+    """Open list and per-state buffers for one direction of the search."""
+
+    def __init__(self, name, buffers, offsets, targets):
+        self.name = name
+        self.open_mark = 2 * buffers.next_generation()
+        self.g_cost = buffers.g_cost
+        self.parent = buffers.parent
+        self.mark = buffers.mark
+        self.offsets = offsets
+        self.targets = targets
+        # The forward side orders by g + p, the backward side by g - p.
+        self.sign = 1 if name == "forward" else -1
+        self.open_list = []
+
+    def seed(self, idx, key):
+        self.g_cost[idx] = 0
+        self.parent[idx] = -1
+        self.mark[idx] = self.open_mark
+        self.open_list.append((key, len(self.open_list), idx))
+
+    def state(self):
+        return (
+            self.name,
+            self.open_list,
+            self.g_cost,
+            self.parent,
+            self.mark,
+            self.open_mark,
+            self.offsets,
+            self.targets,
+            self.sign,
+        )
+
+    def meeting_state(self):
+        """What the other side needs to spot a meeting with this one."""
+        return self.g_cost, self.mark, self.open_mark
@@ -0,0 +1,124 @@
+import hashlib
+
+import numpy as np
+
+from maze_solver import DIRECTIONS_MAP
+
+
+class CompiledMaze:
+    """A maze grid plus a CSR successor table over (cell, orientation) states.
+
+    State ``idx = (r * cols + c) * 4 + direction``. The successors of ``idx``
+    are ``targets[offsets[idx]:offsets[idx + 1]]``, listed in the solver's
+    forward, turn-right, turn-left order; states on wall cells have none. Build it once per grid and pass it
+    to ``solve_maze_a_star`` in place of the raw maze.
+    """
+
+    def __init__(self, maze, tables=None, predecessors=None):
+        self.grid = np.ascontiguousarray(maze, dtype=np.uint8)
+        self.rows, self.cols = self.grid.shape
+        self.n_states = self.rows * self.cols * 4
+        # ``tables`` and ``predecessors`` reuse an already built
+        # ``(offsets, targets)`` pair and ``predecessor_table()``, e.g. views
+        # of ones held in shared memory.
+        if tables is None:
+            tables = _build_successor_table(self.grid)
+        self.offsets, self.targets = tables
+
+        # Zero-copy int views; indexing these is much cheaper than indexing
+        # the NumPy arrays element by element from Python.
+        self.offsets_view = self.offsets.data
+        self.targets_view = self.targets.data
+
+        self._fingerprint = None
+        self._predecessors = predecessors
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, r):
+        return self.grid[r]
+
+    def state_index(self, pos, direction):
+        return (pos[0] * self.cols + pos[1]) * 4 + direction
+
+    def state_of(self, idx):
+        return divmod(idx >> 2, self.cols), idx & 3
+
+    def successors(self, idx):
+        return self.targets[self.offsets[idx] : self.offsets[idx + 1]]
+
+    @property
+    def fingerprint(self):
+        """Content hash of the grid; equal grids share a fingerprint."""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(f"{self.rows}x{self.cols}".encode())
+            digest.update(self.grid.tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def predecessor_table(self):
+        """Reverse CSR table: states that reach ``idx`` in one F/R/L move.
+
+        Returns ``(rev_offsets, rev_sources)``; built on first use.
+        """
+        if self._predecessors is None:
+            sources = np.repeat(
+                np.arange(self.n_states, dtype=np.int32), np.diff(self.offsets)
+            )
+            order = np.argsort(self.targets, kind="stable")
+            rev_offsets = np.zeros(self.n_states + 1, dtype=np.int32)
+            np.cumsum(
+                np.bincount(self.targets, minlength=self.n_states),
+                out=rev_offsets[1:],
+            )
+            self._predecessors = (rev_offsets, sources[order])
+        return self._predecessors
+
+
+def step_mask(grid):
+    """``can_step[d, cell]``: ``cell`` and its neighbour in direction d are open.
+
+    Wall cells get no moves, so no search ever walks through wall states.
+    """
+    rows, cols = grid.shape
+    walkable = grid == 0
+    can_step = np.zeros((4, rows, cols), dtype=bool)
+    for d, (dr, dc) in DIRECTIONS_MAP.items():
+        can_step[
+            d, max(-dr, 0) : rows - max(dr, 0), max(-dc, 0) : cols - max(dc, 0)
+        ] = walkable[max(dr, 0) : rows - max(-dr, 0), max(dc, 0) : cols - max(-dc, 0)]
+    can_step &= walkable
+    return can_step.reshape(4, rows * cols)
+
+
+def _build_successor_table(grid):
+    rows, cols = grid.shape
+    n_cells = rows * cols
+    can_step = step_mask(grid)
+
+    # Forward keeps the direction, right turns +1, left turns -1.
+    moves = [(d, (d + 1) % 4, (d + 3) % 4) for d in range(4)]
+
+    counts = np.empty((n_cells, 4), dtype=np.uint8)
+    for d, (forward, right, left) in enumerate(moves):
+        np.add(can_step[forward], can_step[right], out=counts[:, d], dtype=np.uint8)
+        counts[:, d] += can_step[left]
+    offsets = np.zeros(n_cells * 4 + 1, dtype=np.int32)
+    np.cumsum(counts.ravel(), dtype=np.int32, out=offsets[1:])
+    del counts
+
+    # Fill one (direction, move) pair at a time so no temporary holds every
+    # state's three moves at once. ``slot`` is where each state's next
+    # successor goes.
+    targets = np.empty(offsets[-1], dtype=np.int32)
+    for d, move_directions in enumerate(moves):
+        slot = offsets[d:-1:4].copy()
+        for move_direction in move_directions:
+            open_step = can_step[move_direction]
+            cells = np.flatnonzero(open_step).astype(np.int32)
+            dr, dc = DIRECTIONS_MAP[move_direction]
+            targets[slot[cells]] = (cells + (dr * cols + dc)) * 4 + move_direction
+            slot += open_step
+    return offsets, targets
@@ -0,0 +1,146 @@
+"""Goal distance fields for many queries that share a destination.
+
+``goal_distance_field`` gives the exact moves-to-goal of every state from
+one backward search; ``GoalDistanceCache`` keeps those fields per goal so
+later queries only walk downhill.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from compiled_maze import CompiledMaze
+
+
+# Below this many states a frontier is expanded with a plain Python loop;
+# NumPy's per-call overhead only pays off on wide frontiers.
+_VECTORIZE_FRONTIER = 256
+
+
+def goal_distance_field(compiled, end_pos):
+    """Moves-to-goal for every (cell, orientation) state; -1 if unreachable.
+
+    Breadth-first search runs backwards from the four orientations at
+    ``end_pos`` over the reversed forward/turn-right/turn-left transitions,
+    one whole frontier at a time.
+    """
+    rev_offsets, rev_sources = compiled.predecessor_table()
+    rev_offsets_view = rev_offsets.data
+    rev_sources_view = rev_sources.data
+    dist = np.full(compiled.n_states, -1, dtype=np.int32)
+    dist_view = dist.data
+
+    goal_base = (end_pos[0] * compiled.cols + end_pos[1]) * 4
+    frontier = list(range(goal_base, goal_base + 4))
+    dist[frontier] = 0
+
+    level = 0
+    while len(frontier):
+        level += 1
+        if len(frontier) < _VECTORIZE_FRONTIER:
+            next_frontier = []
+            for idx in frontier:
+                for k in range(rev_offsets_view[idx], rev_offsets_view[idx + 1]):
+                    source = rev_sources_view[k]
+                    if dist_view[source] == -1:
+                        dist_view[source] = level
+                        next_frontier.append(source)
+            frontier = next_frontier
+            continue
+
+        frontier = np.asarray(frontier, dtype=np.int32)
+        starts = rev_offsets[frontier]
+        counts = rev_offsets[frontier + 1] - starts
+        # Flat positions of every predecessor slot of every frontier state.
+        slot = np.arange(int(counts.sum()), dtype=np.int64) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        candidates = rev_sources[np.repeat(starts, counts) + slot]
+        frontier = np.unique(candidates[dist[candidates] == -1])
+        dist[frontier] = level
+    return dist
+
+
+def follow_distance_field(compiled, dist, start_pos, start_facing_direction):
+    """Walk downhill through ``dist`` from the start state; O(path length)."""
+    idx = compiled.state_index(start_pos, start_facing_direction)
+    remaining = int(dist[idx])
+    if remaining < 0:
+        return None
+
+    offsets = compiled.offsets_view
+    targets = compiled.targets_view
+    dist_view = dist.data
+    path = [start_pos]
+    while remaining:
+        remaining -= 1
+        for k in range(offsets[idx], offsets[idx + 1]):
+            if dist_view[targets[k]] == remaining:
+                idx = targets[k]
+                break
+        path.append(divmod(idx >> 2, compiled.cols))
+    return path
+
+
+class GoalDistanceCache:
+    """LRU cache of goal distance fields keyed by (maze fingerprint, goal).
+
+    Entries are evicted least-recently-used first once their combined size
+    exceeds ``max_bytes``. A field larger than ``max_bytes`` on its own is
+    still used for the current query but is not kept.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def distance_field(self, compiled, end_pos):
+        key = (compiled.fingerprint, tuple(end_pos))
+        dist = self._entries.get(key)
+        if dist is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return dist
+
+        self.misses += 1
+        dist = goal_distance_field(compiled, end_pos)
+        if dist.nbytes <= self.max_bytes:
+            self._entries[key] = dist
+            self.current_bytes += dist.nbytes
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.nbytes
+                self.evictions += 1
+        return dist
+
+    def solve(self, maze, start_pos, start_facing_direction, end_pos):
+        """Shortest path like ``solve_maze_a_star``, served from the cache.
+
+        Pass a ``CompiledMaze`` to avoid recompiling the grid on every call.
+        """
+        compiled = maze if isinstance(maze, CompiledMaze) else CompiledMaze(maze)
+        dist = self.distance_field(compiled, end_pos)
+        return follow_distance_field(
+            compiled, dist, start_pos, start_facing_direction
+        )
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
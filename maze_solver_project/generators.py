@@ -0,0 +1,336 @@
+"""Seeded, vectorized perfect-maze generators.
+
+Every generator returns ``uint8`` grids in the solvers' layout: 1 = wall,
+0 = path, cells on odd coordinates inside a solid border, so ``rows`` and
+``cols`` must be odd. ``generate(..., count=N)`` builds N mazes at once into
+one ``(N, rows, cols)`` array; the same ``seed`` always gives the same mazes.
+"""
+
+import numpy as np
+
+from maze_solver import DIRECTIONS_MAP
+
+
+def _check_size(rows, cols):
+    if rows < 3 or cols < 3 or rows % 2 == 0 or cols % 2 == 0:
+        raise ValueError(f"Maze size must be odd and at least 3x3, got {rows}x{cols}.")
+
+
+def _blank(count, rows, cols):
+    grid = np.ones((count, rows, cols), dtype=np.uint8)
+    grid[:, 1::2, 1::2] = 0
+    return grid
+
+
+def _north_walls(grid):
+    """View of the wall above each cell, shaped like the cells."""
+    return grid[:, 0:-1:2, 1::2]
+
+
+def _east_walls(grid):
+    """View of the wall right of each cell, shaped like the cells."""
+    return grid[:, 1::2, 2::2]
+
+
+def binary_tree(rng, count, rows, cols):
+    """Each cell opens north or east; the top row and right column are forced."""
+    grid = _blank(count, rows, cols)
+    cell_rows, cell_cols = rows // 2, cols // 2
+    north = rng.random((count, cell_rows, cell_cols)) < 0.5
+    north[:, :, -1] = True
+    north[:, 0, :] = False
+    east = ~north
+    east[:, :, -1] = False
+    _north_walls(grid)[north] = 0
+    _east_walls(grid)[east] = 0
+    return grid
+
+
+def sidewinder(rng, count, rows, cols):
+    """Rows of east-running corridors, each with one random opening north."""
+    grid = _blank(count, rows, cols)
+    cell_rows, cell_cols = rows // 2, cols // 2
+    east = rng.random((count, cell_rows, cell_cols)) < 0.5
+    east[:, 0, :] = True
+    east[:, :, -1] = False
+
+    # A run starts at column 0 and after every cell that did not carve east.
+    starts = np.ones_like(east)
+    starts[:, :, 1:] = ~east[:, :, :-1]
+    starts[:, 0, :] = False
+    starts[:, 0, 0] = True
+    flat_starts = np.flatnonzero(starts)
+    lengths = np.diff(np.append(flat_starts, starts.size))
+    pick = flat_starts + (rng.random(flat_starts.size) * lengths).astype(np.int64)
+
+    north = np.zeros(east.size, dtype=bool)
+    north[pick] = True
+    north = north.reshape(east.shape)
+    north[:, 0, :] = False
+
+    _north_walls(grid)[north] = 0
+    _east_walls(grid)[east] = 0
+    return grid
+
+
+def _join_forest(n_labels, a, b):
+    """Accept a cycle-free subset of the set joins ``a[k] -- b[k]``.
+
+    Each round every component root hooks onto a smaller root through one of
+    its pending joins, so hooks (and the joins behind them) form a forest;
+    joins whose ends already share a root are dropped. Returns the accepted
+    mask and the final root of every label.
+    """
+    parent = np.arange(n_labels)
+    accepted = np.zeros(a.size, dtype=bool)
+    pending = np.arange(a.size)
+    while pending.size:
+        root_a = parent[a[pending]]
+        root_b = parent[b[pending]]
+        keep = root_a != root_b
+        pending, root_a, root_b = pending[keep], root_a[keep], root_b[keep]
+        if not pending.size:
+            break
+        high = np.maximum(root_a, root_b)
+        low = np.minimum(root_a, root_b)
+        high, first = np.unique(high, return_index=True)
+        parent[high] = low[first]
+        accepted[pending[first]] = True
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+    return accepted, parent
+
+
+def eller_rows(rows, cols, seed=None, count=None):
+    """Eller's algorithm, yielding the grid one row at a time.
+
+    Only the set labels of the current cell row are kept, so memory is
+    O(cols) however many rows are produced. Rows are ``(cols,)`` arrays, or
+    ``(count, cols)`` when building ``count`` mazes side by side.
+    """
+    _check_size(rows, cols)
+    rng = np.random.default_rng(seed)
+    n = 1 if count is None else count
+    cell_rows, cell_cols = rows // 2, cols // 2
+
+    def emit(row):
+        return row[0] if count is None else row
+
+    wall_row = np.ones((n, cols), dtype=np.uint8)
+    yield emit(wall_row)
+
+    labels = np.arange(n * cell_cols).reshape(n, cell_cols)
+    next_label = labels.size
+    for i in range(cell_rows):
+        last = i == cell_rows - 1
+
+        # Join horizontal neighbours from different sets, at random except on
+        # the last row, where every remaining set must be joined.
+        left, right = labels[:, :-1], labels[:, 1:]
+        candidates = left != right
+        if not last:
+            candidates &= rng.random(candidates.shape) < 0.5
+        _, compact = np.unique(labels, return_inverse=True)
+        compact = compact.reshape(labels.shape)
+        where = np.nonzero(candidates)
+        accepted, roots = _join_forest(
+            labels.size, compact[:, :-1][where], compact[:, 1:][where]
+        )
+        east = np.zeros(candidates.shape, dtype=bool)
+        east[where[0][accepted], where[1][accepted]] = True
+        labels = roots[compact]
+
+        cell_row = np.ones((n, cols), dtype=np.uint8)
+        cell_row[:, 1::2] = 0
+        cell_row[:, 2:-1:2][east] = 0
+        yield emit(cell_row)
+        if last:
+            break
+
+        # Every set carries on downward through at least one random cell.
+        down = rng.random(labels.shape) < 0.5
+        flat = labels.ravel()
+        order = np.lexsort((rng.random(flat.size), flat))
+        group_start = np.ones(flat.size, dtype=bool)
+        group_start[1:] = flat[order][1:] != flat[order][:-1]
+        down.ravel()[order[group_start]] = True
+
+        below = np.ones((n, cols), dtype=np.uint8)
+        below[:, 1::2][down] = 0
+        yield emit(below)
+
+        fresh = np.count_nonzero(~down)
+        labels = labels.copy()
+        labels[~down] = np.arange(next_label, next_label + fresh)
+        next_label += fresh
+
+    yield emit(wall_row)
+
+
+def eller(rng, count, rows, cols):
+    """Eller's algorithm over whole grids; see ``eller_rows``."""
+    grid = np.empty((count, rows, cols), dtype=np.uint8)
+    seed = int(rng.integers(2**63))
+    for r, row in enumerate(eller_rows(rows, cols, seed, count)):
+        grid[:, r] = row
+    return grid
+
+
+def _cell_neighbors(cell_rows, cell_cols):
+    """Flat cell coordinates and their neighbour table (-1 off the edge)."""
+    n_cells = cell_rows * cell_cols
+    r, c = np.divmod(np.arange(n_cells), cell_cols)
+    neighbor = np.full((n_cells, 4), -1, dtype=np.int64)
+    for direction, (dr, dc) in DIRECTIONS_MAP.items():
+        ok = (0 <= r + dr) & (r + dr < cell_rows) & (0 <= c + dc) & (c + dc < cell_cols)
+        neighbor[ok, direction] = ((r + dr) * cell_cols + c + dc)[ok]
+    return r, c, neighbor
+
+
+def _wilson_one(rng, rows, cols):
+    """Wilson's algorithm for a single maze, walking with plain Python ints."""
+    grid = _blank(1, rows, cols)[0]
+    cell_rows, cell_cols = rows // 2, cols // 2
+    n_cells = cell_rows * cell_cols
+    _, _, neighbor = _cell_neighbors(cell_rows, cell_cols)
+    options = [[n for n in row if n >= 0] for row in neighbor.tolist()]
+    order = rng.permutation(n_cells).tolist()
+
+    in_tree = bytearray(n_cells)
+    in_tree[order[0]] = 1
+    next_cell = [0] * n_cells
+    retraced = []
+    random = rng.random
+    for start in order[1:]:
+        if in_tree[start]:
+            continue
+        # Walk until the tree is hit, remembering only each cell's last exit:
+        # overwriting it erases any loop the walk made.
+        here = start
+        draws = random(1024).tolist()
+        k = 0
+        while not in_tree[here]:
+            if k == len(draws):
+                draws = random(1024).tolist()
+                k = 0
+            step = options[here]
+            there = step[int(draws[k] * len(step))]
+            k += 1
+            next_cell[here] = there
+            here = there
+        here = start
+        while not in_tree[here]:
+            in_tree[here] = 1
+            retraced.append(here)
+            here = next_cell[here]
+
+    # Open the wall between each retraced cell and the cell it walked to.
+    retraced = np.array(retraced, dtype=np.int64)
+    r, c = np.divmod(retraced, cell_cols)
+    nr, nc = np.divmod(np.array(next_cell, dtype=np.int64)[retraced], cell_cols)
+    grid[r + nr + 1, c + nc + 1] = 0
+    return grid
+
+
+def wilson(rng, count, rows, cols):
+    """Wilson's loop-erased random walks; a uniformly random spanning tree.
+
+    Each walk is sequential. A single maze walks in plain Python; a batch
+    steps all ``count`` walks together with NumPy, which pays off once there
+    are dozens of mazes.
+    """
+    if count < 32:
+        return np.stack([_wilson_one(rng, rows, cols) for _ in range(count)])
+
+    grid = np.ones((count, rows, cols), dtype=np.uint8)
+    cell_rows, cell_cols = rows // 2, cols // 2
+    n_cells = cell_rows * cell_cols
+    r, c, neighbor = _cell_neighbors(cell_rows, cell_cols)
+    # choices[cell, :degree[cell]] lists the legal directions.
+    degree = (neighbor >= 0).sum(axis=1)
+    choices = np.argsort(neighbor < 0, axis=1, kind="stable")
+    step_r = np.array([DIRECTIONS_MAP[d][0] for d in range(4)])
+    step_c = np.array([DIRECTIONS_MAP[d][1] for d in range(4)])
+
+    mazes = np.arange(count)
+    in_tree = np.zeros((count, n_cells), dtype=bool)
+    exit_direction = np.zeros((count, n_cells), dtype=np.int64)
+    order = np.argsort(rng.random((count, n_cells)), axis=1)
+    in_tree[mazes, order[:, 0]] = True
+    grid[mazes, 2 * r[order[:, 0]] + 1, 2 * c[order[:, 0]] + 1] = 0
+
+    # Per maze: the next unvisited candidate in ``order``, the walk's start
+    # and current cell, and whether it is walking (1), retracing (2) or
+    # looking for a new start (0).
+    cursor = np.ones(count, dtype=np.int64)
+    start = np.zeros(count, dtype=np.int64)
+    current = np.zeros(count, dtype=np.int64)
+    mode = np.zeros(count, dtype=np.int8)
+
+    while True:
+        seeking = np.flatnonzero(mode == 0)
+        if seeking.size:
+            seeking = seeking[cursor[seeking] < n_cells]
+            candidate = order[seeking, np.minimum(cursor[seeking], n_cells - 1)]
+            taken = in_tree[seeking, candidate]
+            cursor[seeking[taken]] += 1
+            begin = seeking[~taken]
+            start[begin] = current[begin] = candidate[~taken]
+            mode[begin] = 1
+            if not (mode != 0).any() and (cursor >= n_cells).all():
+                break
+
+        walking = np.flatnonzero(mode == 1)
+        if walking.size:
+            here = current[walking]
+            pick = (rng.random(walking.size) * degree[here]).astype(np.int64)
+            direction = choices[here, pick]
+            exit_direction[walking, here] = direction
+            there = neighbor[here, direction]
+            current[walking] = there
+            arrived = in_tree[walking, there]
+            done = walking[arrived]
+            current[done] = start[done]
+            mode[done] = 2
+
+        retracing = np.flatnonzero(mode == 2)
+        if retracing.size:
+            here = current[retracing]
+            direction = exit_direction[retracing, here]
+            in_tree[retracing, here] = True
+            grid[retracing, 2 * r[here] + 1, 2 * c[here] + 1] = 0
+            grid[
+                retracing,
+                2 * r[here] + 1 + step_r[direction],
+                2 * c[here] + 1 + step_c[direction],
+            ] = 0
+            there = neighbor[here, direction]
+            current[retracing] = there
+            mode[retracing[in_tree[retracing, there]]] = 0
+
+    return grid
+
+
+GENERATORS = {
+    "binary_tree": binary_tree,
+    "sidewinder": sidewinder,
+    "eller": eller,
+    "wilson": wilson,
+}
+
+
+def generate(rows, cols, algorithm="eller", seed=None, count=None):
+    """A ``(rows, cols)`` uint8 maze, or ``(count, rows, cols)`` of them."""
+    _check_size(rows, cols)
+    try:
+        build = GENERATORS[algorithm]
+    except KeyError:
+        raise ValueError(
+            f"Unknown algorithm {algorithm!r}. Use one of {sorted(GENERATORS)}."
+        ) from None
+    rng = np.random.default_rng(seed)
+    grid = build(rng, 1 if count is None else count, rows, cols)
+    return grid[0] if count is None else grid
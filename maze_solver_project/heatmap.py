@@ -0,0 +1,123 @@
+"""Where did the search spend its effort? Per-cell profiling as NumPy arrays.
+
+``HeatmapRecorder`` is a tracer (see ``tracing.py``), so it works with every
+``solve_maze_a_star`` engine and with ``Maze/maze.py``'s solver. While the
+search runs it only updates dictionaries keyed by the states it touches;
+the arrays are built afterwards, so recording a search on a huge maze costs
+memory in proportion to the states explored, not to the grid.
+"""
+
+import time
+from collections import Counter
+
+import numpy as np
+
+
+class HeatmapRecorder:
+    """Records expansions, duplicate pops, first-pop times and frontier size.
+
+    ``initial_open`` is the open-list size before the first traced event:
+    1 for the single-start engines and 5 for ``"bidirectional"`` (the start
+    state plus the goal cell in all four directions). Events that carry an
+    ``open_size`` detail (ARA*) set the frontier size directly.
+    """
+
+    def __init__(self, rows, cols, initial_open=1, clock=time.perf_counter):
+        self.shape = (rows, cols)
+        self.expansions = Counter()
+        self.duplicates = Counter()
+        self.pushes = Counter()
+        # (position, direction) -> seconds from the first pop.
+        self.first_pop = {}
+        # Open-list size right after each pop, in pop order.
+        self.frontier = []
+        self.initial_open = initial_open
+        self._open = initial_open
+        self._clock = clock
+        self._start = None
+
+    def __call__(self, event, position, direction, g_cost, f_cost, **details):
+        if event == "pop":
+            now = self._clock()
+            if self._start is None:
+                self._start = now
+            self._open = details.get("open_size", self._open - 1)
+            self.frontier.append(self._open)
+            self.expansions[position] += 1
+            state = (position, direction)
+            if state not in self.first_pop:
+                self.first_pop[state] = now - self._start
+        elif event == "push":
+            self._open = details.get("open_size", self._open + 1)
+            self.pushes[position] += 1
+        elif event == "closed_skip":
+            # Already counted as a pop; it was not expanded again.
+            self.expansions[position] -= 1
+            self.duplicates[position] += 1
+
+    def _counts(self, counter):
+        grid = np.zeros(self.shape, dtype=np.int32)
+        if counter:
+            cells = np.array(list(counter), dtype=np.intp)
+            grid[cells[:, 0], cells[:, 1]] = list(counter.values())
+        return grid
+
+    def expansion_counts(self):
+        """``(rows, cols)`` int32: how often each cell was expanded."""
+        return self._counts(self.expansions)
+
+    def duplicate_counts(self):
+        """``(rows, cols)`` int32: stale pops skipped via the closed set."""
+        return self._counts(self.duplicates)
+
+    def push_counts(self):
+        """``(rows, cols)`` int32: how often each cell entered the open list."""
+        return self._counts(self.pushes)
+
+    def first_pop_times(self, by_direction=False):
+        """Seconds from the first pop until each cell (or state) was popped.
+
+        Returns ``(rows, cols)`` float64, the earliest time over the four
+        facing directions, or ``(rows, cols, 4)`` with ``by_direction``.
+        Cells never popped are NaN.
+        """
+        times = np.full(self.shape + (4,), np.nan)
+        if self.first_pop:
+            states = np.array(
+                [(r, c, d) for (r, c), d in self.first_pop], dtype=np.intp
+            )
+            times[states[:, 0], states[:, 1], states[:, 2]] = list(
+                self.first_pop.values()
+            )
+        if by_direction:
+            return times
+        popped = ~np.isnan(times).all(axis=2)
+        cell_times = np.full(self.shape, np.nan)
+        cell_times[popped] = np.nanmin(times[popped], axis=1)
+        return cell_times
+
+    def frontier_sizes(self):
+        """Open-list size after each pop, as an int64 array."""
+        return np.array(self.frontier, dtype=np.int64)
+
+    def arrays(self):
+        return {
+            "expansions": self.expansion_counts(),
+            "duplicates": self.duplicate_counts(),
+            "pushes": self.push_counts(),
+            "first_pop": self.first_pop_times(),
+            "frontier": self.frontier_sizes(),
+        }
+
+    def save(self, path):
+        """Write every array to a compressed ``.npz`` file for analysis."""
+        np.savez_compressed(path, **self.arrays())
+
+    def clear(self):
+        self.expansions.clear()
+        self.duplicates.clear()
+        self.pushes.clear()
+        self.first_pop.clear()
+        self.frontier.clear()
+        self._open = self.initial_open
+        self._start = None
@@ -0,0 +1,187 @@
+import math
+from array import array
+from collections import deque
+
+
+class Heuristic:
+    """Estimate of the moves left from ``pos`` to ``end_pos``.
+
+    ``admissible`` promises the estimate never exceeds the true number of
+    moves under the forward/turn-left/turn-right rules, so A* still returns
+    a shortest path. ``consistent`` promises it changes by at most 1 per
+    move, which the solvers rely on to never reopen a closed state.
+    """
+
+    name = None
+    admissible = True
+    consistent = True
+
+    def __call__(self, pos, end_pos):
+        raise NotImplementedError
+
+
+class EuclideanHeuristic(Heuristic):
+    """Straight-line distance; the solvers' original heuristic."""
+
+    name = "euclidean"
+
+    def __call__(self, pos, end_pos):
+        return math.sqrt((pos[0] - end_pos[0]) ** 2 + (pos[1] - end_pos[1]) ** 2)
+
+
+class ManhattanHeuristic(Heuristic):
+    """Row plus column difference.
+
+    Every move changes exactly one coordinate by 1, so this is a lower
+    bound, and it dominates both the Euclidean and octile estimates.
+    """
+
+    name = "manhattan"
+
+    def __call__(self, pos, end_pos):
+        return abs(pos[0] - end_pos[0]) + abs(pos[1] - end_pos[1])
+
+
+class OctileHeuristic(Heuristic):
+    """Octile distance; never above Manhattan on a 4-connected grid."""
+
+    name = "octile"
+
+    def __call__(self, pos, end_pos):
+        dr = abs(pos[0] - end_pos[0])
+        dc = abs(pos[1] - end_pos[1])
+        return max(dr, dc) + (math.sqrt(2) - 1) * min(dr, dc)
+
+
+class LandmarkHeuristic(Heuristic):
+    """ALT heuristic from breadth-first distances to a few landmark cells.
+
+    Distances are taken over open cells with unrestricted 4-neighbour moves.
+    The agent's forward/turn moves are a subset of those, so cell distances
+    never exceed the true remaining moves, and by the triangle inequality
+    ``|d(L, goal) - d(L, pos)|`` is an admissible, consistent lower bound
+    for every landmark ``L``. Landmarks are picked farthest-first.
+    """
+
+    name = "landmark"
+
+    def __init__(self, maze, count=4, first=None):
+        self.rows, self.cols = len(maze), len(maze[0])
+        walkable = bytearray(self.rows * self.cols)
+        for r in range(self.rows):
+            row = maze[r]
+            walkable[r * self.cols : (r + 1) * self.cols] = bytes(
+                1 if row[c] == 0 else 0 for c in range(self.cols)
+            )
+        self._walkable = walkable
+
+        self.landmarks = []
+        self.distances = []
+        self._goal = None
+        self._goal_distances = ()
+
+        if first is None:
+            first = walkable.find(1)
+            if first < 0:
+                return
+        else:
+            first = first[0] * self.cols + first[1]
+
+        # Start from the cell farthest from ``first``, then keep adding the
+        # cell farthest from every landmark chosen so far.
+        nearest = self._bfs(first)
+        for _ in range(count):
+            cell = max(range(len(nearest)), key=nearest.__getitem__)
+            if nearest[cell] <= 0:
+                break
+            dist = self._bfs(cell)
+            self.landmarks.append(divmod(cell, self.cols))
+            self.distances.append(dist)
+            if len(self.distances) == 1:
+                nearest = array("i", dist)
+            else:
+                for i, d in enumerate(dist):
+                    if d < nearest[i]:
+                        nearest[i] = d
+
+    def _bfs(self, source):
+        cols = self.cols
+        walkable = self._walkable
+        dist = array("i", [-1]) * len(walkable)
+        dist[source] = 0
+        queue = deque([source])
+        while queue:
+            cell = queue.popleft()
+            d = dist[cell] + 1
+            r, c = divmod(cell, cols)
+            for nxt, ok in (
+                (cell - cols, r > 0),
+                (cell + 1, c < cols - 1),
+                (cell + cols, r < self.rows - 1),
+                (cell - 1, c > 0),
+            ):
+                if ok and walkable[nxt] and dist[nxt] == -1:
+                    dist[nxt] = d
+                    queue.append(nxt)
+        return dist
+
+    def __call__(self, pos, end_pos):
+        if end_pos != self._goal:
+            goal_cell = end_pos[0] * self.cols + end_pos[1]
+            self._goal = end_pos
+            self._goal_distances = [
+                (dist[goal_cell], dist) for dist in self.distances
+            ]
+
+        cell = pos[0] * self.cols + pos[1]
+        best = 0
+        for goal_dist, dist in self._goal_distances:
+            d = dist[cell]
+            # A landmark that cannot reach both cells gives no bound.
+            if goal_dist >= 0 and d >= 0:
+                estimate = abs(goal_dist - d)
+                if estimate > best:
+                    best = estimate
+        return best
+
+
+class WeightedHeuristic(Heuristic):
+    """``weight`` times another heuristic, for weighted A* (f = g + w * h).
+
+    Inflating an admissible estimate makes the search greedier: it expands
+    fewer states, and the path it returns costs at most ``weight`` times
+    the shortest one.
+    """
+
+    def __init__(self, base, weight):
+        if weight < 1:
+            raise ValueError(f"weight must be at least 1, got {weight}.")
+        self.base = base
+        self.weight = weight
+        self.name = f"{getattr(base, 'name', None) or 'custom'} x{weight:g}"
+        self.admissible = weight == 1 and getattr(base, "admissible", False)
+        self.consistent = weight == 1 and getattr(base, "consistent", False)
+
+    def __call__(self, pos, end_pos):
+        return self.weight * self.base(pos, end_pos)
+
+
+HEURISTICS = {
+    "euclidean": EuclideanHeuristic(),
+    "manhattan": ManhattanHeuristic(),
+    "octile": OctileHeuristic(),
+}
+
+
+def get_heuristic(heuristic):
+    """Resolve ``None``, a registered name or a callable to a heuristic."""
+    if heuristic is None:
+        return HEURISTICS["euclidean"]
+    if isinstance(heuristic, str):
+        try:
+            return HEURISTICS[heuristic]
+        except KeyError:
+            raise ValueError(
+                f"Unknown heuristic {heuristic!r}. Use one of {sorted(HEURISTICS)} or a callable."
+            ) from None
+    return heuristic
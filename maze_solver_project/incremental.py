@@ -0,0 +1,211 @@
+import heapq
+
+from heuristics import get_heuristic
+from maze_solver import DIRECTIONS_MAP
+
+INF = float("inf")
+
+
+class IncrementalPlanner:
+    """Lifelong Planning A* (LPA*) for one start/goal pair on an editable maze.
+
+    The planner keeps its g/rhs values and priority queue between calls.
+    ``set_cell`` toggles a cell between path (0) and wall (1) and only marks
+    the four states entering that cell as inconsistent; the next ``plan``
+    repairs the search from there instead of starting over. States and moves
+    are the same as ``solve_maze_a_star``: ``(r, c, direction)`` with
+    forward, turn-right and turn-left moves, and the goal is reached in any
+    orientation.
+
+    ``maze`` is copied, so the caller's grid is never modified.
+    """
+
+    def __init__(
+        self, maze, start_pos, start_facing_direction, end_pos, heuristic=None
+    ):
+        self.maze = [list(row) for row in maze]
+        self.rows, self.cols = rows, cols = len(self.maze), len(self.maze[0])
+        self.start_pos = start_pos
+        self.end_pos = end_pos
+        self.heuristic = get_heuristic(heuristic)
+
+        self._start = self._index(start_pos, start_facing_direction)
+        # Virtual goal one step past every orientation at end_pos. A zero-cost
+        # step would tie its key with stale goal states and end planning early.
+        self._goal = rows * cols * 4
+        self._goal_base = self._index(end_pos, 0)
+
+        # Flat per-cell tables: whether the cell is open, which of its four
+        # neighbours lie inside the maze (bit per direction), and the cell
+        # index step for each direction.
+        self._open = bytearray(
+            1 if cell == 0 else 0 for row in self.maze for cell in row
+        )
+        self._inside = bytearray(rows * cols)
+        for r in range(rows):
+            for c in range(cols):
+                mask = 0
+                for direction, (dr, dc) in DIRECTIONS_MAP.items():
+                    if 0 <= r + dr < rows and 0 <= c + dc < cols:
+                        mask |= 1 << direction
+                self._inside[r * cols + c] = mask
+        self._step = [dr * cols + dc for dr, dc in map(DIRECTIONS_MAP.get, range(4))]
+
+        # g, rhs and the queued key of every state, the virtual goal last.
+        n_states = self._goal + 1
+        self._g = [INF] * n_states
+        self._rhs = [INF] * n_states
+        self._rhs[self._start] = 0
+        self._queued = [None] * n_states
+        # Heuristic per cell, filled in as cells are first queued; the
+        # virtual goal's entry is 0.
+        self._h = [None] * (rows * cols) + [0]
+        self._queue = []
+        self._push(self._start)
+
+        # States whose key was popped on the last plan() call.
+        self.expanded = 0
+
+    def _index(self, pos, direction):
+        return (pos[0] * self.cols + pos[1]) * 4 + direction
+
+    def _predecessors(self, idx):
+        if idx == self._goal:
+            yield from range(self._goal_base, self._goal_base + 4)
+            return
+        cell, direction = idx >> 2, idx & 3
+        # Enterable facing ``direction`` if open and the cell behind is inside.
+        if not self._open[cell] or not self._inside[cell] >> _BACK[direction] & 1:
+            return
+        prev = (cell - self._step[direction]) * 4
+        # Arrived facing ``direction`` by going forward, turning right or left.
+        yield prev + direction
+        yield prev + _LEFT[direction]
+        yield prev + _RIGHT[direction]
+
+    def _push(self, idx):
+        best = min(self._g[idx], self._rhs[idx])
+        cell = idx >> 2
+        h = self._h[cell]
+        if h is None:
+            h = self._h[cell] = self.heuristic(divmod(cell, self.cols), self.end_pos)
+        key = (best + h, best)
+        self._queued[idx] = key
+        heapq.heappush(self._queue, (key, idx))
+
+    def _update_vertex(self, idx):
+        g = self._g
+        if idx == self._start:
+            rhs = 0
+        elif idx == self._goal:
+            base = self._goal_base
+            rhs = min(g[base], g[base + 1], g[base + 2], g[base + 3]) + 1
+            self._rhs[idx] = rhs
+        else:
+            cell, direction = idx >> 2, idx & 3
+            if self._open[cell] and self._inside[cell] >> _BACK[direction] & 1:
+                prev = (cell - self._step[direction]) * 4
+                rhs = (
+                    min(
+                        g[prev + direction],
+                        g[prev + _LEFT[direction]],
+                        g[prev + _RIGHT[direction]],
+                    )
+                    + 1
+                )
+            else:
+                rhs = INF
+            self._rhs[idx] = rhs
+        if g[idx] != rhs:
+            self._push(idx)
+        else:
+            self._queued[idx] = None
+
+    def _compute_shortest_path(self):
+        goal = self._goal
+        goal_cell = self._goal_base >> 2
+        g, rhs, queued, queue = self._g, self._rhs, self._queued, self._queue
+        is_open, inside, step = self._open, self._inside, self._step
+        update = self._update_vertex
+        heappop = heapq.heappop
+        expanded = 0
+        while True:
+            # Drop entries whose state was re-queued or made consistent.
+            while queue and queued[queue[0][1]] != queue[0][0]:
+                heappop(queue)
+            if not queue:
+                break
+            goal_best = min(g[goal], rhs[goal])
+            if queue[0][0] >= (goal_best, goal_best) and rhs[goal] == g[goal]:
+                break
+            _, idx = heappop(queue)
+            queued[idx] = None
+            expanded += 1
+
+            if g[idx] > rhs[idx]:
+                g[idx] = rhs[idx]
+            else:
+                g[idx] = INF
+                update(idx)
+            if idx == goal:
+                continue
+            cell, direction = idx >> 2, idx & 3
+            if cell == goal_cell:
+                update(goal)
+            mask = inside[cell]
+            for next_direction in _TURNS[direction]:
+                if mask >> next_direction & 1:
+                    next_cell = cell + step[next_direction]
+                    if is_open[next_cell]:
+                        update(next_cell * 4 + next_direction)
+        self.expanded += expanded
+
+    def set_cell(self, r, c, value):
+        """Make ``(r, c)`` a path (0) or wall (1) cell for the next ``plan``.
+
+        Raises ``IndexError`` for a cell outside the maze; negative indices
+        are not counted from the end. Raises ``ValueError`` for the start
+        cell, which the search is rooted at.
+        """
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            raise IndexError(
+                f"cell ({r}, {c}) is outside the {self.rows}x{self.cols} maze"
+            )
+        if (r, c) == tuple(self.start_pos):
+            raise ValueError(
+                f"cell ({r}, {c}) is the start cell; create a new planner to move"
+                " or block the start"
+            )
+        if self.maze[r][c] == value:
+            return
+        self.maze[r][c] = value
+        base = r * self.cols + c
+        self._open[base] = 1 if value == 0 else 0
+        # Only moves *into* (r, c) depend on its value.
+        for idx in range(base * 4, base * 4 + 4):
+            self._update_vertex(idx)
+
+    def plan(self):
+        """Shortest path from start to goal on the current maze, or None."""
+        self.expanded = 0
+        self._compute_shortest_path()
+        if self._g[self._goal] == INF:
+            return None
+
+        # Walk back from the goal through the cheapest predecessor; every
+        # state on a shortest path is locally consistent once planning stops.
+        g = self._g
+        idx = self._goal
+        path = []
+        while idx != self._start:
+            idx = min(self._predecessors(idx), key=g.__getitem__)
+            path.append(divmod(idx >> 2, self.cols))
+        return path[::-1]
+
+
+# Facing after a forward, right or left move from each direction, and the
+# direction a move facing ``d`` came from.
+_TURNS = tuple((d, (d + 1) % 4, (d + 3) % 4) for d in range(4))
+_RIGHT = tuple((d + 1) % 4 for d in range(4))
+_LEFT = tuple((d + 3) % 4 for d in range(4))
+_BACK = tuple((d + 2) % 4 for d in range(4))
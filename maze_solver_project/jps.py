@@ -0,0 +1,143 @@
+import heapq
+
+from heuristics import get_heuristic
+
+
+def _jump(idx, end_cell, offsets, targets):
+    """Follow single-successor states from ``idx``; returns (state, steps).
+
+    Stops on the goal cell or on a state offering two or more moves. A chain
+    that dead-ends, or comes back round to ``idx`` without ever branching,
+    returns state -1. A forced chain cannot run into a loop that skips
+    ``idx``: the loop's entrance would be an extra open neighbour, which
+    gives the loop state there a second move.
+    """
+    first = idx
+    steps = 1
+    while idx >> 2 != end_cell:
+        lo = offsets[idx]
+        hi = offsets[idx + 1]
+        if hi - lo != 1:
+            if hi == lo:
+                return -1, steps
+            break
+        idx = targets[lo]
+        steps += 1
+        if idx == first:
+            return -1, steps
+    return idx, steps
+
+
+def jump_point_search(
+    compiled,
+    start_pos,
+    start_facing_direction,
+    end_pos,
+    buffers,
+    tracer=None,
+    heuristic=None,
+):
+    """A* over "decision" states of a ``CompiledMaze``.
+
+    A state with exactly one legal move -- a straight corridor, or a corner
+    where only one turn is open -- is never pushed: the search jumps through
+    it to the next state that offers a real choice, reaches the goal, or
+    dead-ends (those branches are dropped). Every path through a
+    single-move state is forced, so the result is still a shortest path.
+    """
+    heuristic = get_heuristic(heuristic)
+    cols = compiled.cols
+    offsets = compiled.offsets_view
+    targets = compiled.targets_view
+
+    open_mark = 2 * buffers.next_generation()
+    closed_mark = open_mark + 1
+    g_cost = buffers.g_cost
+    parent = buffers.parent
+    mark = buffers.mark
+
+    end_cell = end_pos[0] * cols + end_pos[1]
+
+    start_idx = compiled.state_index(start_pos, start_facing_direction)
+    g_cost[start_idx] = 0
+    parent[start_idx] = -1
+    mark[start_idx] = open_mark
+    open_list = [(heuristic(start_pos, end_pos), 0, start_idx)]
+    push_count = 1
+
+    buffers.expanded = 0
+
+    while open_list:
+        f_popped, _, idx = heapq.heappop(open_list)
+
+        if tracer is not None:
+            position = divmod(idx >> 2, cols)
+            tracer("pop", position, idx & 3, g_cost[idx], f_popped)
+            if idx >> 2 == end_cell:
+                tracer("goal", position, idx & 3, g_cost[idx], f_popped)
+            elif mark[idx] == closed_mark:
+                tracer("closed_skip", position, idx & 3, g_cost[idx], f_popped)
+
+        if idx >> 2 == end_cell:
+            return _reconstruct(compiled, idx, g_cost, parent, end_cell)
+
+        if mark[idx] == closed_mark:
+            continue
+        mark[idx] = closed_mark
+        buffers.expanded += 1
+
+        g_here = g_cost[idx]
+        for k in range(offsets[idx], offsets[idx + 1]):
+            next_idx, steps = _jump(targets[k], end_cell, offsets, targets)
+            if next_idx == -1:
+                continue
+            g_next = g_here + steps
+            next_mark = mark[next_idx]
+            if next_mark == closed_mark:
+                continue
+            if next_mark == open_mark and g_cost[next_idx] <= g_next:
+                continue
+
+            g_cost[next_idx] = g_next
+            parent[next_idx] = idx
+            mark[next_idx] = open_mark
+            next_pos = divmod(next_idx >> 2, cols)
+            f_cost = g_next + heuristic(next_pos, end_pos)
+            heapq.heappush(open_list, (f_cost, push_count, next_idx))
+            push_count += 1
+            if tracer is not None:
+                tracer("push", next_pos, next_idx & 3, g_next, f_cost, jump=steps)
+
+    return None
+
+
+def _reconstruct(compiled, idx, g_cost, parent, end_cell):
+    """Expand the jump-point chain back into one position per move."""
+    cols = compiled.cols
+    offsets = compiled.offsets_view
+    targets = compiled.targets_view
+
+    jump_points = []
+    while idx != -1:
+        jump_points.append(idx)
+        idx = parent[idx]
+    jump_points.reverse()
+
+    path = [divmod(jump_points[0] >> 2, cols)]
+    for here, there in zip(jump_points, jump_points[1:]):
+        steps_needed = g_cost[there] - g_cost[here]
+        for k in range(offsets[here], offsets[here + 1]):
+            first = targets[k]
+            if _jump(first, end_cell, offsets, targets) == (there, steps_needed):
+                break
+        else:
+            raise RuntimeError(
+                f"No forced walk of {steps_needed} moves leads from jump point"
+                f" {compiled.state_of(here)} to {compiled.state_of(there)}."
+            )
+        idx = first
+        path.append(divmod(idx >> 2, cols))
+        while idx != there:
+            idx = targets[offsets[idx]]
+            path.append(divmod(idx >> 2, cols))
+    return path
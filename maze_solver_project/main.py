@@ -1,6 +1,21 @@
-from maze_solver import solve_maze_a_star, is_valid_move, DIRECTION_NAMES
-from visualization import visualize_maze
-from mazes.default_maze import DEFAULT_MAZE
+import argparse
+import os
+import sys
+
+from heuristics import HEURISTICS
+from maze_solver import (
+    COMPILED_ENGINES,
+    DIRECTION_NAMES,
+    is_valid_move,
+    solve_maze_a_star,
+)
+from mazes import load_maze, maze_names
+
+# Wider mazes are not printed before asking for coordinates.
+MAX_PRINTED_COLS = 80
+
+# "landmark" (ALT) is built from the loaded maze before solving.
+HEURISTIC_NAMES = sorted(HEURISTICS) + ["landmark"]
 
 
 def get_user_input(prompt, maze_rows, maze_cols):
@@ -35,8 +50,149 @@ def get_start_direction_input():
             print("Invalid input. Please enter a number.")
 
 
-def main():
-    maze = DEFAULT_MAZE
+def print_search_stats(result):
+    print("\nSearch statistics:")
+    print(f"  Path cost: {result.cost}")
+    if result.bound is not None and result.bound > 1:
+        print(f"  Suboptimality bound: {result.bound:.3f}")
+    print(
+        f"  Pushed: {result.pushed}, popped: {result.popped},"
+        f" skipped as duplicates: {result.duplicates}"
+    )
+    print(f"  Peak open-list size: {result.peak_open}")
+    if result.expanded_forward is not None:
+        print(
+            f"  Expanded forward: {result.expanded_forward},"
+            f" backward: {result.expanded_backward}"
+        )
+    phases = ", ".join(
+        f"{name} {seconds * 1000:.2f} ms"
+        for name, seconds in result.phase_times.items()
+    )
+    print(f"  Phase times: {phases}")
+    if result.final_direction is not None:
+        print(f"  Final facing direction: {DIRECTION_NAMES[result.final_direction]}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="A* maze solver with movement constraints."
+    )
+    parser.add_argument(
+        "--maze", default="default", help="name of a maze in mazes/ (see --list-mazes)"
+    )
+    parser.add_argument(
+        "--list-mazes", action="store_true", help="print the maze names and exit"
+    )
+    parser.add_argument(
+        "--cache", metavar="PATH", help="reuse solutions stored in this SQLite file"
+    )
+    parser.add_argument(
+        "--cache-mb", type=float, default=64, help="size cap of the solution cache"
+    )
+    parser.add_argument(
+        "--image",
+        metavar="PATH",
+        help="write the solution to a PNG or PPM file instead of plotting it",
+    )
+    parser.add_argument(
+        "--scale", type=int, default=1, help="pixels per maze cell with --image"
+    )
+    parser.add_argument(
+        "--stats", action="store_true", help="print search counters after solving"
+    )
+    parser.add_argument(
+        "--weight",
+        type=float,
+        help="weighted A*: a path at most this many times the shortest",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="anytime search: improve the path until optimal or out of time",
+    )
+
+    batch = parser.add_argument_group(
+        "batch mode", "solve queries from a file without prompts or plots"
+    )
+    batch.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="CSV or JSONL queries ('-' for stdin); results go to stdout as JSONL",
+    )
+    batch.add_argument("--format", choices=("csv", "jsonl"), help="default: sniffed")
+    batch.add_argument("--engine", choices=COMPILED_ENGINES, default="array")
+    batch.add_argument("--workers", type=int, default=1)
+    batch.add_argument("--chunk-size", type=int, default=64)
+    batch.add_argument(
+        "--heuristic", choices=HEURISTIC_NAMES, help="default: euclidean"
+    )
+    batch.add_argument(
+        "--no-path", action="store_true", help="report path lengths only"
+    )
+    args = parser.parse_args(argv)
+    if args.stats and args.cache:
+        parser.error("--stats needs a search to count; it cannot be used with --cache")
+    if args.weight is not None and args.weight < 1:
+        parser.error(f"--weight must be at least 1, got {args.weight:g}")
+    if args.time_budget is not None and args.time_budget < 0:
+        parser.error(f"--time-budget cannot be negative, got {args.time_budget:g}")
+    return args
+
+
+def batch_main(args, maze):
+    from batch_cli import run_batch
+
+    heuristic = args.heuristic
+    if heuristic == "landmark":
+        from heuristics import LandmarkHeuristic
+
+        heuristic = LandmarkHeuristic(maze)
+
+    cache = None
+    if args.cache:
+        from solution_cache import SolutionCache
+
+        cache = SolutionCache(args.cache, int(args.cache_mb * 1024 * 1024))
+    source = sys.stdin if args.batch == "-" else open(args.batch, newline="")
+    try:
+        run_batch(
+            maze,
+            source,
+            fmt=args.format,
+            engine=args.engine,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            heuristic=heuristic,
+            cache=cache,
+            with_path=not args.no_path,
+        )
+    except BrokenPipeError:
+        # The reader (e.g. ``head``) stopped early; exit without a traceback.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if cache is not None:
+            cache.close()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.list_mazes:
+        print("\n".join(maze_names()))
+        return
+    try:
+        maze = load_maze(args.maze)
+    except ValueError as error:
+        print(error)
+        return
+    if args.batch:
+        batch_main(args, maze)
+        return
+
     rows = len(maze)
     cols = len(maze[0])
 
@@ -49,13 +205,14 @@ def main():
         "Enter coordinates as 'row,col' (e.g., '1,1'). Type 'q' to quit at any prompt."
     )
 
-    print("\nCurrent Maze Layout:")
-    for r_idx, row in enumerate(maze):
-        print(f"{r_idx:2d} {' '.join(map(str, row))}")
-    print(
-        "  " + " ".join([str(c_idx % 10) for c_idx in range(cols)])
-    )
-    print("-" * 30)
+    if cols <= MAX_PRINTED_COLS:
+        print("\nCurrent Maze Layout:")
+        for r_idx, row in enumerate(maze):
+            print(f"{r_idx:2d} {' '.join(map(str, row))}")
+        print(
+            "  " + " ".join([str(c_idx % 10) for c_idx in range(cols)])
+        )
+        print("-" * 30)
 
     start_point = None
     while start_point is None:
@@ -98,12 +255,54 @@ def main():
     print(
         f"\nSolving maze from {start_point} (facing {DIRECTION_NAMES[start_direction]}) to {end_point}..."
     )
-    found_path = solve_maze_a_star(
-        maze, start_point, start_direction, end_point, verbose=True
-    )
+    # The cache stores shortest paths only.
+    optimal = args.weight in (None, 1) and args.time_budget is None
+    if args.cache and optimal:
+        from solution_cache import SolutionCache
+
+        cache = SolutionCache(args.cache, int(args.cache_mb * 1024 * 1024))
+        found_path = cache.solve(
+            maze, start_point, start_direction, end_point, verbose=True
+        )
+        if cache.hits:
+            print("Served from the solution cache.")
+        cache.close()
+    elif args.stats:
+        result = solve_maze_a_star(
+            maze,
+            start_point,
+            start_direction,
+            end_point,
+            verbose=True,
+            with_stats=True,
+            weight=args.weight,
+            time_budget=args.time_budget,
+        )
+        found_path = result.path
+        print_search_stats(result)
+    else:
+        found_path = solve_maze_a_star(
+            maze,
+            start_point,
+            start_direction,
+            end_point,
+            verbose=True,
+            weight=args.weight,
+            time_budget=args.time_budget,
+        )
 
-    if found_path:
+    if found_path and args.image:
+        from raster import render, save_image
+
+        save_image(
+            args.image,
+            render(maze, found_path, start_point, end_point, scale=args.scale),
+        )
+        print(f"\nPath Found! Solution image written to {args.image}.")
+    elif found_path:
         print("\nPath Found! Visualizing the solution...")
+        from visualization import visualize_maze
+
         visualize_maze(maze, found_path, start_point, end_point)
     else:
         print("\nNo path found.")
@@ -1,5 +1,9 @@
 import heapq
 import math
+import time
+from array import array
+
+from heuristics import EuclideanHeuristic, WeightedHeuristic, get_heuristic
 
 
 class Node:
@@ -29,40 +33,131 @@ DIRECTIONS_MAP = {
 
 DIRECTION_NAMES = {0: "North", 1: "East", 2: "South", 3: "West"}
 
+# Every move leaves the agent facing the way it moved.
+_STEP_DIRECTIONS = {step: direction for direction, step in DIRECTIONS_MAP.items()}
+
 
 def euclidean_distance(pos1, pos2):
     return math.sqrt((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2)
 
 
 def is_valid_move(maze, pos):
-    rows, cols = len(maze), len(maze[0])
     r, c = pos
+    # Packed mazes answer directly instead of building a row object.
+    is_open = getattr(maze, "is_open", None)
+    if is_open is not None:
+        return 0 <= r < maze.rows and 0 <= c < maze.cols and is_open(r, c)
+    rows, cols = len(maze), len(maze[0])
     return 0 <= r < rows and 0 <= c < cols and maze[r][c] == 0
 
 
-def solve_maze_a_star(maze, start_pos, start_facing_direction, end_pos, verbose=True):
-    rows, cols = len(maze), len(maze[0])
+def solve_maze_a_star(
+    maze,
+    start_pos,
+    start_facing_direction,
+    end_pos,
+    verbose=True,
+    engine="node",
+    heuristic=None,
+    tracer=None,
+    with_stats=False,
+    weight=None,
+    time_budget=None,
+):
+    """Shortest path from ``start_pos`` to ``end_pos``, or None.
+
+    ``weight`` > 1 runs weighted A* (f = g + weight * h): fewer expansions,
+    and a path at most ``weight`` times longer than the shortest. With
+    ``time_budget`` (seconds) the search is anytime ARA* (see
+    ``anytime.py``): it finds a path with ``weight`` (default 3) and keeps
+    improving it until it is optimal or the budget runs out. Both need an
+    admissible heuristic; neither works with the bidirectional engine.
+
+    With ``with_stats`` a ``SearchResult`` carrying the path, the search
+    counters and the suboptimality ``bound`` is returned instead.
+    """
+    if weight is not None and weight < 1:
+        raise ValueError(f"weight must be at least 1, got {weight}.")
+    if with_stats:
+        return _solve_with_stats(
+            maze,
+            start_pos,
+            start_facing_direction,
+            end_pos,
+            verbose,
+            engine,
+            heuristic,
+            tracer,
+            weight,
+            time_budget,
+        )
+    heuristic = get_heuristic(heuristic)
+    if tracer is None and verbose:
+        from tracing import ConsoleTracer
+
+        tracer = ConsoleTracer()
+
+    if time_budget is not None:
+        return _solve_anytime(
+            maze,
+            start_pos,
+            start_facing_direction,
+            end_pos,
+            tracer,
+            heuristic,
+            engine,
+            weight,
+            time_budget,
+        )[0]
+    if weight is not None and weight != 1:
+        if engine == "bidirectional":
+            raise ValueError("The bidirectional engine does not support weight.")
+        heuristic = WeightedHeuristic(heuristic, weight)
+
+    if engine in COMPILED_ENGINES:
+        return _solve_compiled(
+            maze,
+            start_pos,
+            start_facing_direction,
+            end_pos,
+            tracer,
+            heuristic,
+            engine,
+        )
+    if engine != "node":
+        raise ValueError(
+            f"Unknown engine {engine!r}. Use 'node' or one of {COMPILED_ENGINES}."
+        )
 
     open_list = []
     initial_node = Node(
-        start_pos, start_facing_direction, 0, euclidean_distance(start_pos, end_pos)
+        start_pos, start_facing_direction, 0, heuristic(start_pos, end_pos)
     )
     heapq.heappush(open_list, initial_node)
 
     closed_list = set()
 
-    step_count = 0
-
     while open_list:
         current_node = heapq.heappop(open_list)
 
-        if verbose:
-            print(
-                f"Step {step_count}: Current Position: {current_node.position}, Facing: {DIRECTION_NAMES[current_node.direction]}"
+        if tracer is not None:
+            tracer(
+                "pop",
+                current_node.position,
+                current_node.direction,
+                current_node.g_cost,
+                current_node.f_cost,
             )
-        step_count += 1
 
         if current_node.position == end_pos:
+            if tracer is not None:
+                tracer(
+                    "goal",
+                    current_node.position,
+                    current_node.direction,
+                    current_node.g_cost,
+                    current_node.f_cost,
+                )
             path = []
             while current_node:
                 path.append(current_node.position)
@@ -70,6 +165,14 @@ def solve_maze_a_star(maze, start_pos, start_facing_direction, end_pos, verbose=
             return path[::-1]  # Reverse to get path from start to end
 
         if (current_node.position, current_node.direction) in closed_list:
+            if tracer is not None:
+                tracer(
+                    "closed_skip",
+                    current_node.position,
+                    current_node.direction,
+                    current_node.g_cost,
+                    current_node.f_cost,
+                )
             continue
         closed_list.add((current_node.position, current_node.direction))
 
@@ -77,12 +180,20 @@ def solve_maze_a_star(maze, start_pos, start_facing_direction, end_pos, verbose=
         next_pos_f = (current_node.position[0] + dr_f, current_node.position[1] + dc_f)
         if is_valid_move(maze, next_pos_f):
             g_cost_f = current_node.g_cost + 1
-            h_cost_f = euclidean_distance(next_pos_f, end_pos)
+            h_cost_f = heuristic(next_pos_f, end_pos)
             neighbor_f = Node(
                 next_pos_f, current_node.direction, g_cost_f, h_cost_f, current_node
             )
             if (neighbor_f.position, neighbor_f.direction) not in closed_list:
                 heapq.heappush(open_list, neighbor_f)
+                if tracer is not None:
+                    tracer(
+                        "push",
+                        neighbor_f.position,
+                        neighbor_f.direction,
+                        neighbor_f.g_cost,
+                        neighbor_f.f_cost,
+                    )
 
         next_direction_r = (current_node.direction + 1) % 4
         dr_r, dc_r = DIRECTIONS_MAP[next_direction_r]
@@ -91,12 +202,20 @@ def solve_maze_a_star(maze, start_pos, start_facing_direction, end_pos, verbose=
             g_cost_r = (
                 current_node.g_cost + 1
             )
-            h_cost_r = euclidean_distance(next_pos_r, end_pos)
+            h_cost_r = heuristic(next_pos_r, end_pos)
             neighbor_r = Node(
                 next_pos_r, next_direction_r, g_cost_r, h_cost_r, current_node
             )
             if (neighbor_r.position, neighbor_r.direction) not in closed_list:
                 heapq.heappush(open_list, neighbor_r)
+                if tracer is not None:
+                    tracer(
+                        "push",
+                        neighbor_r.position,
+                        neighbor_r.direction,
+                        neighbor_r.g_cost,
+                        neighbor_r.f_cost,
+                    )
 
         next_direction_l = (current_node.direction - 1 + 4) % 4
         dr_l, dc_l = DIRECTIONS_MAP[next_direction_l]
@@ -105,11 +224,483 @@ def solve_maze_a_star(maze, start_pos, start_facing_direction, end_pos, verbose=
             g_cost_l = (
                 current_node.g_cost + 1
             ) 
-            h_cost_l = euclidean_distance(next_pos_l, end_pos)
+            h_cost_l = heuristic(next_pos_l, end_pos)
             neighbor_l = Node(
                 next_pos_l, next_direction_l, g_cost_l, h_cost_l, current_node
             )
             if (neighbor_l.position, neighbor_l.direction) not in closed_list:
                 heapq.heappush(open_list, neighbor_l)
+                if tracer is not None:
+                    tracer(
+                        "push",
+                        neighbor_l.position,
+                        neighbor_l.direction,
+                        neighbor_l.g_cost,
+                        neighbor_l.f_cost,
+                    )
+
+    return None
+
+
+class SearchResult:
+    """A path plus the counters of the search that found it.
+
+    ``pushed`` includes the initial open states, ``duplicates`` counts pops
+    of states that were already closed, and ``peak_open`` is the largest
+    open-list size seen. ``phase_times`` holds seconds spent in ``setup``
+    (compiling the maze), ``search`` (up to the goal) and ``path`` (walking
+    back the parents); counting adds a tracer call per event, so the times
+    run higher than an uncounted solve. ``final_direction`` is the facing
+    direction on arrival, and ``bound`` the proven suboptimality factor:
+    the path costs at most ``bound`` times a shortest one. The bidirectional
+    engine also reports ``expanded_forward`` and ``expanded_backward``; they
+    are None for the one-directional engines.
+    """
+
+    def __init__(
+        self,
+        path,
+        engine,
+        pushed,
+        popped,
+        duplicates,
+        peak_open,
+        phase_times,
+        final_direction,
+        bound=1.0,
+        expanded_forward=None,
+        expanded_backward=None,
+    ):
+        self.path = path
+        self.engine = engine
+        self.pushed = pushed
+        self.popped = popped
+        self.duplicates = duplicates
+        self.peak_open = peak_open
+        self.phase_times = phase_times
+        self.final_direction = final_direction
+        self.bound = bound
+        self.expanded_forward = expanded_forward
+        self.expanded_backward = expanded_backward
+
+    @property
+    def found(self):
+        return self.path is not None
+
+    @property
+    def cost(self):
+        """Number of moves, or None without a path."""
+        return None if self.path is None else len(self.path) - 1
+
+    @property
+    def expanded(self):
+        return self.popped - self.duplicates
+
+    def as_dict(self):
+        return {
+            "engine": self.engine,
+            "found": self.found,
+            "cost": self.cost,
+            "pushed": self.pushed,
+            "popped": self.popped,
+            "duplicates": self.duplicates,
+            "expanded": self.expanded,
+            "peak_open": self.peak_open,
+            "phase_times": dict(self.phase_times),
+            "final_direction": self.final_direction,
+            "bound": self.bound,
+            "expanded_forward": self.expanded_forward,
+            "expanded_backward": self.expanded_backward,
+        }
+
+    def __repr__(self):
+        return (
+            f"SearchResult(cost={self.cost}, engine={self.engine!r},"
+            f" pushed={self.pushed}, popped={self.popped},"
+            f" duplicates={self.duplicates}, peak_open={self.peak_open},"
+            f" bound={self.bound:g})"
+        )
+
+
+class _StatsTracer:
+    """Counts search events, then forwards them to ``sink`` if there is one."""
+
+    def __init__(self, initial_open, sink=None):
+        self.pushed = initial_open
+        self.popped = 0
+        self.duplicates = 0
+        self.open_size = self.peak_open = initial_open
+        self.goal_time = None
+        # Expansions per ``side`` detail, for the bidirectional engine.
+        self.expanded_by_side = {}
+        self.sink = sink
+
+    def __call__(self, event, position, direction, g_cost, f_cost, **details):
+        side = details.get("side")
+        if side is not None and event in ("pop", "closed_skip"):
+            change = 1 if event == "pop" else -1
+            self.expanded_by_side[side] = self.expanded_by_side.get(side, 0) + change
+        if event == "pop":
+            self.popped += 1
+            self.open_size = details.get("open_size", self.open_size - 1)
+        elif event == "push":
+            self.pushed += 1
+            self.open_size = details.get("open_size", self.open_size + 1)
+            if self.open_size > self.peak_open:
+                self.peak_open = self.open_size
+        elif event == "closed_skip":
+            self.duplicates += 1
+        elif event == "goal":
+            self.goal_time = time.perf_counter()
+        if self.sink is not None:
+            self.sink(event, position, direction, g_cost, f_cost, **details)
+
+
+def _solve_with_stats(
+    maze,
+    start_pos,
+    start_facing_direction,
+    end_pos,
+    verbose,
+    engine,
+    heuristic,
+    tracer,
+    weight,
+    time_budget,
+):
+    if tracer is None and verbose:
+        from tracing import ConsoleTracer
+
+        tracer = ConsoleTracer()
+
+    begin = time.perf_counter()
+    # A raw grid goes straight to the array engine; the others need the
+    # successor table.
+    if engine in ("jps", "bidirectional") or time_budget is not None:
+        from compiled_maze import CompiledMaze
+
+        if not isinstance(maze, CompiledMaze):
+            maze = CompiledMaze(maze)
+    # The bidirectional search starts from the start state and all four
+    # goal states.
+    counter = _StatsTracer(5 if engine == "bidirectional" else 1, tracer)
+    searched = time.perf_counter()
+    if time_budget is not None:
+        path, bound = _solve_anytime(
+            maze,
+            start_pos,
+            start_facing_direction,
+            end_pos,
+            counter,
+            get_heuristic(heuristic),
+            engine,
+            weight,
+            time_budget - (searched - begin),
+        )
+    else:
+        path = solve_maze_a_star(
+            maze,
+            start_pos,
+            start_facing_direction,
+            end_pos,
+            verbose=False,
+            engine=engine,
+            heuristic=heuristic,
+            tracer=counter,
+            weight=weight,
+        )
+        bound = 1.0 if weight is None else float(weight)
+    done = time.perf_counter()
+    goal_time = done if counter.goal_time is None else counter.goal_time
+
+    expanded_forward = expanded_backward = None
+    if engine == "bidirectional":
+        expanded_forward = counter.expanded_by_side.get("forward", 0)
+        expanded_backward = counter.expanded_by_side.get("backward", 0)
+
+    if path is None or len(path) < 2:
+        final_direction = None if path is None else start_facing_direction
+    else:
+        (r0, c0), (r1, c1) = path[-2], path[-1]
+        final_direction = _STEP_DIRECTIONS[(r1 - r0, c1 - c0)]
+    return SearchResult(
+        path,
+        engine,
+        counter.pushed,
+        counter.popped,
+        counter.duplicates,
+        counter.peak_open,
+        {
+            "setup": searched - begin,
+            "search": goal_time - searched,
+            "path": done - goal_time,
+        },
+        final_direction,
+        None if path is None else bound,
+        expanded_forward,
+        expanded_backward,
+    )
+
+
+def _solve_anytime(
+    maze,
+    start_pos,
+    start_facing_direction,
+    end_pos,
+    tracer,
+    heuristic,
+    engine,
+    weight,
+    time_budget,
+):
+    """Best ``(path, bound)`` ARA* reaches within ``time_budget`` seconds."""
+    if engine not in ("node", "array"):
+        raise ValueError(f"The {engine} engine does not support time_budget.")
+    from anytime import iter_ara_star
+    from compiled_maze import CompiledMaze
+
+    deadline = time.perf_counter() + time_budget
+    compiled = maze if isinstance(maze, CompiledMaze) else CompiledMaze(maze)
+    path = bound = None
+    for path, bound in iter_ara_star(
+        compiled,
+        start_pos,
+        start_facing_direction,
+        end_pos,
+        heuristic,
+        3.0 if weight is None else weight,
+        deadline=deadline,
+        tracer=tracer,
+    ):
+        pass
+    return path, bound
+
+
+class SearchBuffers:
+    """Per-state buffers for the array engine, reusable across solves.
+
+    ``mark`` replaces clearing between searches: a state is untouched in the
+    current search when ``mark[idx] < 2 * generation``, open when it equals
+    ``2 * generation`` and closed when it equals ``2 * generation + 1``.
+    """
+
+    def __init__(self, n_states):
+        self.n_states = n_states
+        self.g_cost = array("i", [0]) * n_states
+        self.parent = array("i", [0]) * n_states
+        self.mark = array("i", [0]) * n_states
+        self.generation = 0
+        # States closed by the most recent search.
+        self.expanded = 0
+        self._reverse = None
+
+    @property
+    def reverse(self):
+        """Second buffer set for searches that also run backwards."""
+        if self._reverse is None:
+            self._reverse = SearchBuffers(self.n_states)
+        return self._reverse
+
+    def next_generation(self):
+        self.generation += 1
+        if 2 * self.generation + 1 > 2**31 - 1:
+            self.mark = array("i", [0]) * self.n_states
+            self.generation = 1
+        return self.generation
+
+
+# Engines that run on a CompiledMaze with SearchBuffers.
+COMPILED_ENGINES = ("array", "jps", "bidirectional")
+
+
+def _compiled_engine(engine):
+    if engine == "jps":
+        from jps import jump_point_search
+
+        return jump_point_search
+    if engine == "bidirectional":
+        from bidirectional import bidirectional_search
+
+        return bidirectional_search
+    if engine == "array":
+        return _array_search
+    raise ValueError(f"Unknown engine {engine!r}. Use one of {COMPILED_ENGINES}.")
+
+
+def _solve_compiled(
+    maze, start_pos, start_facing_direction, end_pos, tracer, heuristic, engine
+):
+    from compiled_maze import CompiledMaze
+
+    search = _compiled_engine(engine)
+    if not isinstance(maze, CompiledMaze):
+        if search is _array_search:
+            return _grid_search(
+                maze, start_pos, start_facing_direction, end_pos, tracer, heuristic
+            )
+        maze = CompiledMaze(maze)
+    compiled = maze
+    buffers = SearchBuffers(compiled.n_states)
+    return search(
+        compiled,
+        start_pos,
+        start_facing_direction,
+        end_pos,
+        buffers,
+        tracer,
+        heuristic,
+    )
+
+
+def _array_search(
+    compiled,
+    start_pos,
+    start_facing_direction,
+    end_pos,
+    buffers,
+    tracer=None,
+    heuristic=None,
+):
+    """A* over flat (r, c, dir) state indices: idx = (r * cols + c) * 4 + dir.
+
+    Returns a shortest path like the node engine; when several shortest paths
+    exist, ties are broken first-in-first-out and may pick a different one.
+    """
+    offsets = compiled.offsets_view
+    targets = compiled.targets_view
+
+    def successors(idx):
+        return targets[offsets[idx] : offsets[idx + 1]]
+
+    return _state_search(
+        compiled.cols,
+        successors,
+        compiled.state_index(start_pos, start_facing_direction),
+        end_pos,
+        buffers,
+        tracer,
+        heuristic,
+    )
+
+
+def _grid_search(
+    maze, start_pos, start_facing_direction, end_pos, tracer=None, heuristic=None
+):
+    """The array engine straight on a raw grid, for one-off solves.
+
+    Moves are worked out from the grid as states are expanded, so a single
+    query does not pay for a ``CompiledMaze`` successor table it would use
+    once. Paths match ``_array_search``; compile the maze when solving many
+    queries on it.
+    """
+    import numpy as np
+
+    from compiled_maze import step_mask
+
+    grid = np.ascontiguousarray(maze, dtype=np.uint8)
+    rows, cols = grid.shape
+    # Bit d of open_steps[cell] is set when the step in direction d is open.
+    can_step = step_mask(grid)
+    open_steps = np.zeros(rows * cols, dtype=np.uint8)
+    for d in range(4):
+        open_steps |= can_step[d].astype(np.uint8) << d
+    open_steps = open_steps.tobytes()
+    del grid, can_step
+
+    # moves[open_steps[cell] * 4 + dir] lists what to add to the state index
+    # ``cell * 4`` for each successor, in the CompiledMaze order.
+    deltas = [(dr * cols + dc) * 4 + d for d, (dr, dc) in DIRECTIONS_MAP.items()]
+    moves = [
+        tuple(
+            deltas[turn] for turn in (d, (d + 1) & 3, (d + 3) & 3) if bits >> turn & 1
+        )
+        for bits in range(16)
+        for d in range(4)
+    ]
+
+    def successors(idx):
+        return map((idx & ~3).__add__, moves[open_steps[idx >> 2] * 4 + (idx & 3)])
+
+    return _state_search(
+        cols,
+        successors,
+        (start_pos[0] * cols + start_pos[1]) * 4 + start_facing_direction,
+        end_pos,
+        SearchBuffers(rows * cols * 4),
+        tracer,
+        heuristic,
+    )
+
+
+def _state_search(cols, successors, start_idx, end_pos, buffers, tracer, heuristic):
+    """The array engine's A* loop; ``successors(idx)`` lists a state's moves."""
+    open_mark = 2 * buffers.next_generation()
+    closed_mark = open_mark + 1
+    g_cost = buffers.g_cost
+    parent = buffers.parent
+    mark = buffers.mark
+
+    heuristic = get_heuristic(heuristic)
+    # The default Euclidean estimate is inlined below; others are called.
+    if isinstance(heuristic, EuclideanHeuristic):
+        estimate = None
+    else:
+        estimate = heuristic
+
+    end_r, end_c = end_pos
+    end_cell = end_r * cols + end_c
+    sqrt = math.sqrt
+
+    g_cost[start_idx] = 0
+    parent[start_idx] = -1
+    mark[start_idx] = open_mark
+    open_list = [(heuristic(divmod(start_idx >> 2, cols), end_pos), 0, start_idx)]
+    push_count = 1
+
+    buffers.expanded = 0
+
+    while open_list:
+        f_popped, _, idx = heapq.heappop(open_list)
+
+        if tracer is not None:
+            position = divmod(idx >> 2, cols)
+            tracer("pop", position, idx & 3, g_cost[idx], f_popped)
+            if idx >> 2 == end_cell:
+                tracer("goal", position, idx & 3, g_cost[idx], f_popped)
+            elif mark[idx] == closed_mark:
+                tracer("closed_skip", position, idx & 3, g_cost[idx], f_popped)
+
+        if idx >> 2 == end_cell:
+            path = []
+            while idx != -1:
+                path.append(divmod(idx >> 2, cols))
+                idx = parent[idx]
+            return path[::-1]
+
+        if mark[idx] == closed_mark:
+            continue
+        mark[idx] = closed_mark
+        buffers.expanded += 1
+
+        g_next = g_cost[idx] + 1
+        for next_idx in successors(idx):
+            next_mark = mark[next_idx]
+            if next_mark == closed_mark:
+                continue
+            if next_mark == open_mark and g_cost[next_idx] <= g_next:
+                continue
+
+            g_cost[next_idx] = g_next
+            parent[next_idx] = idx
+            mark[next_idx] = open_mark
+            next_r, next_c = divmod(next_idx >> 2, cols)
+            if estimate is None:
+                f_cost = g_next + sqrt((next_r - end_r) ** 2 + (next_c - end_c) ** 2)
+            else:
+                f_cost = g_next + estimate((next_r, next_c), end_pos)
+            heapq.heappush(open_list, (f_cost, push_count, next_idx))
+            push_count += 1
+            if tracer is not None:
+                tracer("push", (next_r, next_c), next_idx & 3, g_next, f_cost)
 
     return None
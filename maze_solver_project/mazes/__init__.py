@@ -0,0 +1,91 @@
+"""Named mazes for the solvers.
+
+``load_maze(name)`` returns a registered maze: either a built-in grid or a
+packed maze file (see ``packed_maze``), memory-mapped on first use and
+shared by later loads. Every ``*.bits`` file in this directory is
+registered under its file name stem, and ``save_maze`` adds new ones.
+"""
+
+import os
+
+MAZE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MAZE_LOADERS = {}
+
+
+def register_maze(name, loader):
+    """Register ``loader()``, a zero-argument callable, under ``name``."""
+    MAZE_LOADERS[name] = loader
+
+
+def register_maze_file(name, path):
+    """Register the packed maze file at ``path`` under ``name``.
+
+    The file is mapped on the first load; later loads return the same
+    read-only ``PackedMaze``.
+    """
+    opened = []
+
+    def load_file():
+        if not opened:
+            from packed_maze import load
+
+            opened.append(load(path))
+        return opened[0]
+
+    register_maze(name, load_file)
+
+
+def _check_name(name):
+    # Both separators are refused on every platform, so a name saved on one
+    # system never turns into a path on another.
+    if not name or name in (".", "..") or "/" in name or "\\" in name:
+        raise ValueError(
+            f"Invalid maze name {name!r}. Use a plain name without path separators."
+        )
+
+
+def save_maze(name, maze, seed=None):
+    """Store ``maze`` as ``<name>.bits`` in this directory and register it.
+
+    The file is written beside the old one and then swapped in, so mazes
+    already loaded under ``name`` keep reading the previous grid.
+    """
+    from packed_maze import PackedMaze, pack
+
+    _check_name(name)
+    if not isinstance(maze, PackedMaze):
+        maze = pack(maze, seed)
+    path = os.path.join(MAZE_DIR, f"{name}.bits")
+    maze.save(path + ".tmp")
+    os.replace(path + ".tmp", path)
+    register_maze_file(name, path)
+    return path
+
+
+def maze_names():
+    return sorted(MAZE_LOADERS)
+
+
+def load_maze(name):
+    try:
+        loader = MAZE_LOADERS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown maze {name!r}. Use one of {sorted(MAZE_LOADERS)}."
+        ) from None
+    return loader()
+
+
+def _default_maze():
+    from mazes.default_maze import DEFAULT_MAZE
+
+    return DEFAULT_MAZE
+
+
+register_maze("default", _default_maze)
+for _file_name in sorted(os.listdir(MAZE_DIR)):
+    if _file_name.endswith(".bits"):
+        register_maze_file(
+            _file_name[: -len(".bits")], os.path.join(MAZE_DIR, _file_name)
+        )
@@ -0,0 +1,191 @@
+"""Compact one-bit-per-cell mazes, in memory and on disk.
+
+A file is a 64-byte header followed by the grid, one ``ceil(cols / 8)``-byte
+row after another, most significant bit first (bit set = wall). The header
+holds the dimensions, the generator seed and a BLAKE2b checksum of the grid
+bytes. Files are read through ``np.memmap`` without copying, and writing
+never holds more than a row in memory, so mazes far larger than RAM can be
+generated and solved.
+"""
+
+import hashlib
+import struct
+
+import numpy as np
+
+from generators import eller_rows
+
+MAGIC = b"MAZEBITS"
+VERSION = 2
+HEADER_SIZE = 64
+# magic, version, rows, cols, seed (-1 when unknown), checksum
+_HEADER = struct.Struct("<8sIQQq16s")
+_VERIFY_CHUNK = 1 << 20
+
+
+def row_stride(cols):
+    return (cols + 7) // 8
+
+
+def _checksum():
+    return hashlib.blake2b(digest_size=16)
+
+
+class PackedMaze:
+    """A bit-packed grid that behaves like the solvers' list-of-rows mazes.
+
+    ``len(maze)`` and ``maze[r][c]`` work, so ``solve_maze_a_star`` and
+    ``is_valid_move`` accept it directly; ``is_open`` is the cheaper
+    single-cell test. ``data`` is the ``(rows, ceil(cols / 8))`` uint8 byte
+    grid, which may be a read-only memory map. ``np.asarray(maze)`` unpacks
+    the whole grid (e.g. for ``CompiledMaze``) when it fits in memory.
+
+    Only ``engine="node"`` reads cells one at a time and so touches only
+    the pages it visits. The ``array``, ``jps`` and ``bidirectional``
+    engines unpack the whole grid to one byte per cell first, so they need
+    ``rows * cols`` bytes of memory.
+    """
+
+    def __init__(self, data, cols, seed=None, checksum=None):
+        self.data = data
+        self.rows = data.shape[0]
+        self.cols = cols
+        self.stride = row_stride(cols)
+        self.seed = seed
+        self._checksum = checksum
+        # Flat byte view: indexing it yields plain ints with no NumPy overhead.
+        self._bytes = memoryview(data.reshape(-1))
+
+    @property
+    def checksum(self):
+        if self._checksum is None:
+            digest = _checksum()
+            digest.update(self._bytes)
+            self._checksum = digest.digest()
+        return self._checksum
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, r):
+        if not 0 <= r < self.rows:
+            raise IndexError("row index out of range")
+        return _PackedRow(self, r)
+
+    def __array__(self, dtype=None, copy=None):
+        grid = np.unpackbits(self.data, axis=1, count=self.cols)
+        return grid if dtype is None else grid.astype(dtype, copy=False)
+
+    def is_open(self, r, c):
+        byte = self._bytes[r * self.stride + (c >> 3)]
+        return not (byte >> (7 - (c & 7))) & 1
+
+    def verify(self):
+        """Whether the grid bytes still match the stored checksum."""
+        digest = _checksum()
+        for start in range(0, len(self._bytes), _VERIFY_CHUNK):
+            digest.update(self._bytes[start : start + _VERIFY_CHUNK])
+        return self._checksum is None or digest.digest() == self._checksum
+
+    def save(self, path):
+        with open(path, "wb") as handle:
+            handle.write(_header(self.rows, self.cols, self.seed, self.checksum))
+            handle.write(self._bytes)
+
+
+class _PackedRow:
+    """One row of a ``PackedMaze``; cells read as 0 (path) or 1 (wall)."""
+
+    __slots__ = ("_bytes", "_base", "_cols")
+
+    def __init__(self, maze, r):
+        self._bytes = maze._bytes
+        self._base = r * maze.stride
+        self._cols = maze.cols
+
+    def __len__(self):
+        return self._cols
+
+    def __getitem__(self, c):
+        if not 0 <= c < self._cols:
+            raise IndexError("column index out of range")
+        return (self._bytes[self._base + (c >> 3)] >> (7 - (c & 7))) & 1
+
+
+def _header(rows, cols, seed, checksum):
+    header = _HEADER.pack(
+        MAGIC, VERSION, rows, cols, -1 if seed is None else seed, checksum
+    )
+    return header.ljust(HEADER_SIZE, b"\0")
+
+
+def pack(maze, seed=None):
+    """Pack a list-of-rows or NumPy maze (nonzero = wall) into a ``PackedMaze``."""
+    grid = np.asarray(maze)
+    if grid.ndim != 2:
+        raise ValueError(f"Expected a 2-D maze, got shape {grid.shape}.")
+    return PackedMaze(np.packbits(grid != 0, axis=1), grid.shape[1], seed)
+
+
+def load(path, verify=False):
+    """Open a packed maze file as a read-only, zero-copy memory map.
+
+    Nothing but the header is read until cells are accessed. ``verify``
+    checks the grid against the header checksum first (a full read).
+    """
+    with open(path, "rb") as handle:
+        header = handle.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE or header[:8] != MAGIC:
+        raise ValueError(f"{path} is not a packed maze file.")
+    _, version, rows, cols, seed, checksum = _HEADER.unpack_from(header)
+    if version != VERSION:
+        raise ValueError(f"Unsupported packed maze version {version}.")
+    data = np.memmap(
+        path,
+        dtype=np.uint8,
+        mode="r",
+        offset=HEADER_SIZE,
+        shape=(rows, row_stride(cols)),
+    )
+    maze = PackedMaze(data, cols, None if seed == -1 else seed, checksum)
+    if verify and not maze.verify():
+        raise ValueError(f"{path} is corrupt: checksum mismatch.")
+    return maze
+
+
+def write_rows(path, rows, cols, row_iter, seed=None):
+    """Pack the ``rows`` grid rows yielded by ``row_iter`` into ``path``.
+
+    The file is sized up front and filled through a writable memory map, so
+    only the row being packed is ever held in memory. The checksum is
+    accumulated as rows arrive and written into the header last.
+    """
+    stride = row_stride(cols)
+    with open(path, "wb") as handle:
+        handle.write(_header(rows, cols, seed, bytes(16)))
+        handle.truncate(HEADER_SIZE + rows * stride)
+
+    data = np.memmap(
+        path, dtype=np.uint8, mode="r+", offset=HEADER_SIZE, shape=(rows, stride)
+    )
+    digest = _checksum()
+    written = 0
+    for row in row_iter:
+        if written == rows:
+            raise ValueError(f"More than the declared {rows} rows were produced.")
+        packed = np.packbits(np.asarray(row, dtype=bool))
+        data[written] = packed
+        digest.update(packed)
+        written += 1
+    data.flush()
+    del data
+    if written != rows:
+        raise ValueError(f"Expected {rows} rows, got {written}.")
+
+    with open(path, "r+b") as handle:
+        handle.write(_header(rows, cols, seed, digest.digest()))
+
+
+def write_generated(path, rows, cols, seed=None):
+    """Stream a new Eller maze of ``rows`` x ``cols`` straight to ``path``."""
+    write_rows(path, rows, cols, eller_rows(rows, cols, seed), seed)
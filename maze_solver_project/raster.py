@@ -0,0 +1,119 @@
+"""Headless maze images without matplotlib.
+
+``render`` draws a maze and its path straight into a ``(rows * scale,
+cols * scale, 3)`` uint8 RGB array, one ``scale`` x ``scale`` block per cell,
+with the same colours as ``visualization.visualize_maze``. ``save_image``
+writes that array as PNG (zlib only) or binary PPM, and ``export_images``
+renders and writes many solved mazes across a process pool.
+"""
+
+import os
+import struct
+import zlib
+from multiprocessing import Pool
+
+import numpy as np
+
+OPEN = (255, 255, 255)
+WALL = (0, 0, 0)
+PATH = (220, 20, 20)
+START = (0, 160, 0)
+END = (0, 0, 255)
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def render(maze, path=None, start_pos=None, end_pos=None, scale=1):
+    """RGB image of ``maze`` (nonzero = wall) with ``path`` drawn over it.
+
+    ``maze`` may be a list of rows, a NumPy grid or a ``PackedMaze``. Path
+    entries are ``(r, c)`` or ``(r, c, direction)``; only the cell is drawn.
+    """
+    grid = np.asarray(maze)
+    palette = np.array([OPEN, WALL], dtype=np.uint8)
+    image = palette[(grid != 0).view(np.uint8)]
+    if path:
+        cells = np.asarray(path)[:, :2]
+        image[cells[:, 0], cells[:, 1]] = PATH
+    if start_pos is not None:
+        image[start_pos[0], start_pos[1]] = START
+    if end_pos is not None:
+        image[end_pos[0], end_pos[1]] = END
+    if scale > 1:
+        image = image.repeat(scale, axis=0).repeat(scale, axis=1)
+    return image
+
+
+def _png_chunk(tag, data):
+    return (
+        struct.pack(">I", len(data))
+        + tag
+        + data
+        + struct.pack(">I", zlib.crc32(tag + data))
+    )
+
+
+def write_png(filename, image, level=6):
+    """Write an RGB uint8 array as an 8-bit truecolour PNG."""
+    image = np.asarray(image, dtype=np.uint8)
+    height, width = image.shape[:2]
+    # Every scanline starts with filter type 0 (None).
+    raw = np.zeros((height, 1 + width * 3), dtype=np.uint8)
+    raw[:, 1:] = image.reshape(height, width * 3)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    with open(filename, "wb") as handle:
+        handle.write(_PNG_SIGNATURE)
+        handle.write(_png_chunk(b"IHDR", header))
+        handle.write(_png_chunk(b"IDAT", zlib.compress(raw.tobytes(), level)))
+        handle.write(_png_chunk(b"IEND", b""))
+
+
+def write_ppm(filename, image):
+    """Write an RGB uint8 array as a binary (P6) PPM."""
+    image = np.ascontiguousarray(image, dtype=np.uint8)
+    height, width = image.shape[:2]
+    with open(filename, "wb") as handle:
+        handle.write(f"P6\n{width} {height}\n255\n".encode("ascii"))
+        handle.write(image.tobytes())
+
+
+IMAGE_WRITERS = {".png": write_png, ".ppm": write_ppm}
+
+
+def save_image(filename, image):
+    """Write ``image`` in the format named by the file extension."""
+    extension = os.path.splitext(filename)[1].lower()
+    try:
+        writer = IMAGE_WRITERS[extension]
+    except KeyError:
+        raise ValueError(
+            f"Unknown image format {extension!r}. Use one of {sorted(IMAGE_WRITERS)}."
+        ) from None
+    writer(filename, image)
+
+
+def _export_one(job, scale):
+    filename, maze, path, start_pos, end_pos = job
+    save_image(filename, render(maze, path, start_pos, end_pos, scale))
+    return filename
+
+
+def _export_star(args):
+    return _export_one(*args)
+
+
+def export_images(jobs, workers=1, scale=1, chunk_size=16):
+    """Render and write ``(filename, maze, path, start_pos, end_pos)`` jobs.
+
+    Yields each filename once its file is written. With ``workers > 1`` the
+    jobs are pickled to a process pool in chunks and finish in completion
+    order; rendering and compression run in parallel.
+    """
+    if workers <= 1:
+        for job in jobs:
+            yield _export_one(job, scale)
+        return
+    with Pool(workers) as pool:
+        yield from pool.imap_unordered(
+            _export_star, ((job, scale) for job in jobs), chunk_size
+        )
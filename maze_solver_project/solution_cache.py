@@ -0,0 +1,194 @@
+import sqlite3
+from array import array
+
+from compiled_maze import CompiledMaze
+from maze_solver import solve_maze_a_star
+from packed_maze import PackedMaze, pack
+
+# Bytes charged per entry on top of its encoded path, so cached "no path"
+# results count towards the cap too.
+_ENTRY_OVERHEAD = 64
+_EVICT_BATCH = 256
+_KEY_COLUMNS = "maze, start_r, start_c, direction, end_r, end_c, engine"
+_WHERE_KEY = (
+    "maze = ? AND start_r = ? AND start_c = ? AND direction = ?"
+    " AND end_r = ? AND end_c = ? AND engine = ?"
+)
+
+
+def maze_hash(maze):
+    """Content hash of a maze, equal for lists, arrays, packed and compiled."""
+    if isinstance(maze, CompiledMaze):
+        maze = maze.grid
+    packed = maze if isinstance(maze, PackedMaze) else pack(maze)
+    return f"{packed.rows}x{packed.cols}-{packed.checksum.hex()}"
+
+
+def _encode(path):
+    if path is None:
+        return None
+    return array("i", [v for pos in path for v in pos]).tobytes()
+
+
+def _decode(blob):
+    if blob is None:
+        return None
+    flat = array("i")
+    flat.frombytes(blob)
+    return list(zip(flat[0::2], flat[1::2]))
+
+
+class SolutionCache:
+    """Persistent LRU cache of solved paths, stored in a SQLite file.
+
+    Entries are keyed by ``(maze hash, start, start direction, end, engine)``
+    and survive across processes, so repeated CLI or batch queries are
+    answered without searching. Unsolvable queries are cached as ``None``.
+    Once the stored entries exceed ``max_bytes`` the least recently used are
+    evicted; an entry larger than ``max_bytes`` on its own is not kept. The
+    byte count is read when the file is opened, so processes sharing a file
+    only see each other's writes after reopening it.
+    """
+
+    def __init__(self, path, max_bytes=64 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._db = sqlite3.connect(path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            f"""CREATE TABLE IF NOT EXISTS solutions (
+                maze TEXT NOT NULL,
+                start_r INTEGER NOT NULL,
+                start_c INTEGER NOT NULL,
+                direction INTEGER NOT NULL,
+                end_r INTEGER NOT NULL,
+                end_c INTEGER NOT NULL,
+                engine TEXT NOT NULL,
+                path BLOB,
+                size INTEGER NOT NULL,
+                last_used INTEGER NOT NULL,
+                PRIMARY KEY ({_KEY_COLUMNS})
+            ) WITHOUT ROWID"""
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS solutions_lru ON solutions (last_used)"
+        )
+        self.current_bytes, self._clock = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0), COALESCE(MAX(last_used), 0) FROM solutions"
+        ).fetchone()
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def _tick(self):
+        self._clock += 1
+        return self._clock
+
+    def lookup(self, maze_key, start_pos, start_facing_direction, end_pos, engine):
+        """Returns ``(True, path)`` on a hit and ``(False, None)`` on a miss."""
+        key = (maze_key, *start_pos, start_facing_direction, *end_pos, engine)
+        row = self._db.execute(
+            f"SELECT path FROM solutions WHERE {_WHERE_KEY}", key
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        self._db.execute(
+            f"UPDATE solutions SET last_used = ? WHERE {_WHERE_KEY}",
+            (self._tick(), *key),
+        )
+        return True, _decode(row[0])
+
+    def store(self, maze_key, start_pos, start_facing_direction, end_pos, engine, path):
+        blob = _encode(path)
+        size = _ENTRY_OVERHEAD + (0 if blob is None else len(blob))
+        if size > self.max_bytes:
+            return
+        key = (maze_key, *start_pos, start_facing_direction, *end_pos, engine)
+        db = self._db
+        with db:
+            db.execute("BEGIN")
+            old = db.execute(
+                f"SELECT size FROM solutions WHERE {_WHERE_KEY}", key
+            ).fetchone()
+            if old is not None:
+                self.current_bytes -= old[0]
+            db.execute(
+                "INSERT OR REPLACE INTO solutions"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (*key, blob, size, self._tick()),
+            )
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                oldest = db.execute(
+                    f"SELECT {_KEY_COLUMNS}, size FROM solutions"
+                    " ORDER BY last_used LIMIT ?",
+                    (_EVICT_BATCH,),
+                ).fetchall()
+                for *evicted, evicted_size in oldest:
+                    if self.current_bytes <= self.max_bytes:
+                        break
+                    db.execute(f"DELETE FROM solutions WHERE {_WHERE_KEY}", evicted)
+                    self.current_bytes -= evicted_size
+                    self.evictions += 1
+
+    def solve(
+        self,
+        maze,
+        start_pos,
+        start_facing_direction,
+        end_pos,
+        engine="node",
+        heuristic=None,
+        verbose=False,
+        maze_key=None,
+    ):
+        """Shortest path like ``solve_maze_a_star``, served from the cache.
+
+        Hashing the maze reads the whole grid; when solving many queries on
+        one maze, compute ``maze_hash(maze)`` once and pass it as
+        ``maze_key``. ``heuristic`` is not part of the key: every built-in
+        heuristic is admissible, so any cached path is a shortest one.
+        """
+        if maze_key is None:
+            maze_key = maze_hash(maze)
+        start_pos, end_pos = tuple(start_pos), tuple(end_pos)
+        hit, path = self.lookup(
+            maze_key, start_pos, start_facing_direction, end_pos, engine
+        )
+        if hit:
+            return path
+        path = solve_maze_a_star(
+            maze,
+            start_pos,
+            start_facing_direction,
+            end_pos,
+            verbose=verbose,
+            engine=engine,
+            heuristic=heuristic,
+        )
+        self.store(maze_key, start_pos, start_facing_direction, end_pos, engine, path)
+        return path
+
+    def stats(self):
+        return {
+            "entries": len(self),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        self._db.execute("DELETE FROM solutions")
+        self.current_bytes = 0
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,95 @@
+"""Search event sinks for the solvers' ``tracer`` argument.
+
+A tracer is any callable ``tracer(event, position, direction, g_cost,
+f_cost, **details)``. The engines only build and send events when a tracer
+is given, so an untraced solve pays a single ``is not None`` check per step.
+Events are:
+
+- ``"pop"``: a state was taken off the open list.
+- ``"push"``: a state was added to the open list.
+- ``"closed_skip"``: a popped state was already closed and is skipped.
+- ``"goal"``: the popped state is on the goal cell; the search ends.
+
+Engines that rebuild their open list, such as ARA*, add an ``open_size``
+detail to pops and pushes: the number of open states after the event.
+"""
+
+import random
+from collections import Counter, deque
+
+from maze_solver import DIRECTION_NAMES
+
+EVENTS = ("pop", "push", "closed_skip", "goal")
+
+
+class ConsoleTracer:
+    """Prints events; by default only pops, in the solver's classic format."""
+
+    def __init__(self, events=("pop",)):
+        self.events = frozenset(events)
+        self.step_count = 0
+
+    def __call__(self, event, position, direction, g_cost, f_cost, **details):
+        if event == "pop":
+            step = self.step_count
+            self.step_count += 1
+            if event in self.events:
+                print(
+                    f"Step {step}: Current Position: {position}, Facing: {DIRECTION_NAMES[direction]}"
+                )
+        elif event in self.events:
+            extra = "".join(f" {key}={value}" for key, value in details.items())
+            print(
+                f"{event.upper()}: Position: {position}, Facing: {DIRECTION_NAMES[direction]} g={g_cost} f={f_cost:.2f}{extra}"
+            )
+
+
+class RingBufferRecorder:
+    """Keeps the most recent ``capacity`` events and a count of every event."""
+
+    def __init__(self, capacity=10000):
+        self.buffer = deque(maxlen=capacity)
+        self.counts = Counter()
+
+    def __call__(self, event, position, direction, g_cost, f_cost, **details):
+        self.counts[event] += 1
+        self.buffer.append((event, position, direction, g_cost, f_cost))
+
+    def events(self, kind=None):
+        if kind is None:
+            return list(self.buffer)
+        return [record for record in self.buffer if record[0] == kind]
+
+    def clear(self):
+        self.buffer.clear()
+        self.counts.clear()
+
+
+class SampledTracer:
+    """Forwards roughly ``rate`` of the events it receives to ``sink``.
+
+    ``"goal"`` events are always forwarded. Sampling is seeded so repeated
+    runs forward the same events.
+    """
+
+    def __init__(self, sink, rate=0.01, seed=0):
+        if not 0 < rate <= 1:
+            raise ValueError("rate must be in (0, 1].")
+        self.sink = sink
+        self.rate = rate
+        self._random = random.Random(seed).random
+
+    def __call__(self, event, position, direction, g_cost, f_cost, **details):
+        if event == "goal" or self._random() < self.rate:
+            self.sink(event, position, direction, g_cost, f_cost, **details)
+
+
+class MultiTracer:
+    """Sends every event to each of several sinks."""
+
+    def __init__(self, *sinks):
+        self.sinks = sinks
+
+    def __call__(self, event, position, direction, g_cost, f_cost, **details):
+        for sink in self.sinks:
+            sink(event, position, direction, g_cost, f_cost, **details)
@@ -1,6 +1,18 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+# Longest figure side in inches; bigger mazes shrink to fit.
+MAX_FIGURE_INCHES = 12
+# Longer paths are drawn as a plain line; per-point markers would hide it.
+MAX_PATH_MARKERS = 200
+
+
+def figure_size(rows, cols):
+    """One inch per cell, scaled down so no side exceeds MAX_FIGURE_INCHES."""
+    scale = min(1.0, MAX_FIGURE_INCHES / max(rows, cols))
+    return cols * scale, rows * scale
+
+
 def visualize_maze(
     maze,
     path,
@@ -8,7 +20,7 @@ def visualize_maze(
     end_pos,
     title="A* Maze Solver Path with Movement Constraints",
 ):
-    fig, ax = plt.subplots(figsize=(len(maze[0]), len(maze)))
+    fig, ax = plt.subplots(figsize=figure_size(len(maze), len(maze[0])))
 
     maze_display = np.array(maze)
     ax.imshow(maze_display, cmap="binary", origin="upper")
@@ -17,7 +29,12 @@ def visualize_maze(
         path_rows = [p[0] for p in path]
         path_cols = [p[1] for p in path]
         ax.plot(
-            path_cols, path_rows, color="red", linewidth=2, marker="o", markersize=4
+            path_cols,
+            path_rows,
+            color="red",
+            linewidth=2,
+            marker="o" if len(path) <= MAX_PATH_MARKERS else None,
+            markersize=4,
         )
 
     ax.plot(
@@ -38,3 +55,46 @@ def visualize_maze(
     plt.legend()
     plt.tight_layout()
     plt.show()
+
+
+def visualize_heatmap(
+    values,
+    maze=None,
+    path=None,
+    title="A* Search Effort",
+    label="expansions",
+    cmap="inferno",
+    filename=None,
+):
+    """Draw a per-cell array (e.g. from ``heatmap.HeatmapRecorder``).
+
+    Walls of ``maze`` and NaN cells are drawn grey. The figure is written
+    to ``filename`` when given, otherwise shown.
+    """
+    data = np.ma.masked_invalid(np.asarray(values, dtype=float))
+    if maze is not None:
+        data = np.ma.masked_where(np.asarray(maze) != 0, data)
+    colormap = plt.get_cmap(cmap).copy()
+    colormap.set_bad("#404040")
+
+    fig, ax = plt.subplots(figsize=figure_size(*data.shape))
+    image = ax.imshow(data, cmap=colormap, origin="upper", interpolation="nearest")
+    fig.colorbar(image, ax=ax, label=label, shrink=0.8)
+
+    if path:
+        ax.plot(
+            [p[1] for p in path],
+            [p[0] for p in path],
+            color="cyan",
+            linewidth=1,
+        )
+
+    ax.set_xticks([])
+    ax.set_yticks([])
+    ax.set_title(title)
+    plt.tight_layout()
+    if filename:
+        fig.savefig(filename)
+        plt.close(fig)
+    else:
+        plt.show()
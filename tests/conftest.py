@@ -0,0 +1,8 @@
+import os
+import sys
+
+PROJECT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "maze_solver_project"
+)
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
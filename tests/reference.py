@@ -0,0 +1,101 @@
+"""Reference answers the engines are checked against.
+
+Written from the movement rules alone, without any solver code: from a
+state ``(r, c, facing)`` the agent moves one cell forward, right or left
+and ends up facing the way it moved.
+"""
+
+import random
+from collections import deque
+
+STEPS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def _is_open(maze, r, c):
+    return 0 <= r < len(maze) and 0 <= c < len(maze[0]) and maze[r][c] == 0
+
+
+def bfs_cost(maze, start_pos, start_facing_direction, end_pos):
+    """Fewest moves from start to end, or None when the end is unreachable."""
+    if start_pos == end_pos:
+        return 0
+    start = (start_pos[0], start_pos[1], start_facing_direction)
+    seen = {start}
+    queue = deque([(start, 0)])
+    while queue:
+        (r, c, facing), moves = queue.popleft()
+        for direction in (facing, (facing + 1) % 4, (facing + 3) % 4):
+            nr, nc = r + STEPS[direction][0], c + STEPS[direction][1]
+            if not _is_open(maze, nr, nc):
+                continue
+            if (nr, nc) == tuple(end_pos):
+                return moves + 1
+            state = (nr, nc, direction)
+            if state not in seen:
+                seen.add(state)
+                queue.append((state, moves + 1))
+    return None
+
+
+def assert_legal_path(maze, path, start_pos, start_facing_direction, end_pos):
+    """Fail unless ``path`` is a walk the movement rules allow."""
+    assert tuple(path[0][:2]) == tuple(start_pos)
+    assert tuple(path[-1][:2]) == tuple(end_pos)
+    facing = start_facing_direction
+    for (r0, c0), (r1, c1) in zip(
+        (step[:2] for step in path), (step[:2] for step in path[1:])
+    ):
+        assert _is_open(maze, r1, c1), f"({r1}, {c1}) is not open"
+        direction = STEPS.index((r1 - r0, c1 - c0))
+        assert direction != (facing + 2) % 4, f"reversed into ({r1}, {c1})"
+        facing = direction
+
+
+def dfs_maze(size, seed):
+    """Perfect maze: exactly one route between any two open cells."""
+    rng = random.Random(seed)
+    maze = [[1] * size for _ in range(size)]
+    maze[1][1] = 0
+    stack = [(1, 1)]
+    while stack:
+        r, c = stack[-1]
+        options = [
+            (r + dr, c + dc)
+            for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < r + dr < size - 1 and 0 < c + dc < size - 1 and maze[r + dr][c + dc]
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc = rng.choice(options)
+        maze[(r + nr) // 2][(c + nc) // 2] = 0
+        maze[nr][nc] = 0
+        stack.append((nr, nc))
+    return maze
+
+
+def open_maze(size, seed, density=0.3):
+    """Scattered walls: many routes and loops, some cells cut off."""
+    rng = random.Random(seed)
+    return [[int(rng.random() < density) for _ in range(size)] for _ in range(size)]
+
+
+def queries(maze, count, seed):
+    """Seeded ``(start_pos, start_facing_direction, end_pos)`` on open cells."""
+    rng = random.Random(seed)
+    cells = [
+        (r, c) for r in range(len(maze)) for c in range(len(maze[0])) if not maze[r][c]
+    ]
+    return [
+        (start_pos, rng.randrange(4), end_pos)
+        for start_pos, end_pos in (rng.sample(cells, 2) for _ in range(count))
+    ]
+
+
+def cases(count=12, size=15, n_queries=8):
+    """``(maze, queries)`` pairs over both maze kinds."""
+    result = []
+    for seed in range(count):
+        maze = dfs_maze(size, seed) if seed % 2 else open_maze(size, seed)
+        result.append((maze, queries(maze, n_queries, seed)))
+    return result
@@ -0,0 +1,149 @@
+import random
+
+import pytest
+
+import anytime
+from anytime import iter_ara_star
+from compiled_maze import CompiledMaze
+from generators import generate
+from heatmap import HeatmapRecorder
+from maze_solver import solve_maze_a_star
+from reference import assert_legal_path, bfs_cost, open_maze, queries
+from tracing import MultiTracer
+
+MAZE = open_maze(41, 7, density=0.25)
+QUERIES = queries(MAZE, 10, 7)
+
+
+def _braided_maze(size, seed, share=0.15):
+    """A Wilson maze with ``share`` of its corridor walls knocked through."""
+    grid = generate(size, size, "wilson", seed=seed)
+    maze = [[int(cell) for cell in row] for row in grid]
+    rng = random.Random(seed)
+    for r in range(1, size - 1):
+        for c in range(1, size - 1):
+            between = (not maze[r - 1][c] and not maze[r + 1][c]) or (
+                not maze[r][c - 1] and not maze[r][c + 1]
+            )
+            if maze[r][c] and between and rng.random() < share:
+                maze[r][c] = 0
+    return maze
+
+
+class _FakeClock:
+    """Stands in for ``time.perf_counter``, one tick per reading."""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+class _Recorder:
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event, position, direction, g_cost, f_cost, **details):
+        self.events.append((event, (position, direction), details.get("open_size")))
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_open_size_follows_the_open_list(query):
+    recorder = _Recorder()
+    for _ in iter_ara_star(CompiledMaze(MAZE), *query, tracer=recorder):
+        pass
+    events = recorder.events
+    open_states = {(query[0], query[1])}
+    for i, (event, state, open_size) in enumerate(events):
+        if event == "push":
+            open_states.add(state)
+        elif event == "pop":
+            stale = i + 1 < len(events) and events[i + 1][0] == "closed_skip"
+            if not stale:
+                open_states.discard(state)
+        else:
+            continue
+        assert open_size == len(open_states)
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_peak_open_counts_open_states(query):
+    recorder = _Recorder()
+    result = solve_maze_a_star(
+        MAZE, *query, verbose=False, with_stats=True, time_budget=10, tracer=recorder
+    )
+    sizes = [size for _, _, size in recorder.events if size is not None]
+    assert result.peak_open == max([1] + sizes)
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_heatmap_frontier_uses_open_size(query):
+    recorder = _Recorder()
+    heatmap = HeatmapRecorder(len(MAZE), len(MAZE[0]))
+    for _ in iter_ara_star(
+        CompiledMaze(MAZE), *query, tracer=MultiTracer(recorder, heatmap)
+    ):
+        pass
+    pops = [size for event, _, size in recorder.events if event == "pop"]
+    assert heatmap.frontier == pops
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_results_improve_within_their_bounds(query):
+    shortest = bfs_cost(MAZE, *query)
+    results = list(iter_ara_star(CompiledMaze(MAZE), *query))
+    if shortest is None:
+        assert results == []
+        return
+    costs = [len(path) - 1 for path, _ in results]
+    for (path, bound), cost in zip(results, costs):
+        assert_legal_path(MAZE, path, *query)
+        assert cost <= bound * shortest
+    assert costs[-1] == shortest and results[-1][1] == 1
+    # A path is only repeated to report a tighter bound at the end.
+    assert costs[:-1] == sorted(set(costs[:-1]), reverse=True)
+    assert len(results) < 2 or costs[-2] > costs[-1] or results[-2][1] > 1
+
+
+def test_timed_out_search_keeps_a_proven_bound(monkeypatch):
+    maze = _braided_maze(61, 3)
+    compiled = CompiledMaze(maze)
+    query = ((1, 1), 1, (59, 59))
+    shortest = bfs_cost(maze, *query)
+    # Deadline checks come once per 256 pops, so these cut the searches off
+    # at every point from the first completed one to the last.
+    for deadline in range(0, 30):
+        clock = _FakeClock()
+        monkeypatch.setattr(anytime.time, "perf_counter", clock)
+        results = list(iter_ara_star(compiled, *query, deadline=deadline))
+        assert results
+        for path, bound in results:
+            assert len(path) - 1 <= bound * shortest
+
+
+@pytest.mark.parametrize("budget", [0, 0.001, 0.01])
+def test_tight_time_budget(budget):
+    maze = _braided_maze(61, 3)
+    query = ((1, 1), 1, (59, 59))
+    result = solve_maze_a_star(
+        maze, *query, verbose=False, with_stats=True, time_budget=budget
+    )
+    assert_legal_path(maze, result.path, *query)
+    assert result.cost <= result.bound * bfs_cost(maze, *query)
+
+
+@pytest.mark.parametrize("engine", ["node", "array", "jps"])
+@pytest.mark.parametrize("weight", [1.5, 3])
+def test_weighted_path_within_weight(engine, weight):
+    for query in QUERIES:
+        path = solve_maze_a_star(
+            MAZE, *query, verbose=False, engine=engine, weight=weight
+        )
+        shortest = bfs_cost(MAZE, *query)
+        if shortest is None:
+            assert path is None
+        else:
+            assert_legal_path(MAZE, path, *query)
+            assert len(path) - 1 <= weight * shortest
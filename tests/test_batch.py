@@ -0,0 +1,34 @@
+import pytest
+
+from batch import iter_solve_many, solve_many
+from compiled_maze import CompiledMaze
+from reference import bfs_cost, cases
+
+CASES = cases(count=4, size=21, n_queries=20)
+
+
+def _costs(paths):
+    return [None if path is None else len(path) - 1 for path in paths]
+
+
+@pytest.mark.parametrize("engine", ["array", "jps", "bidirectional"])
+@pytest.mark.parametrize("maze, queries", CASES)
+def test_solve_many_matches_bfs(engine, maze, queries):
+    paths = solve_many(maze, queries, engine=engine)
+    assert _costs(paths) == [bfs_cost(maze, *query) for query in queries]
+
+
+@pytest.mark.parametrize("engine", ["array", "jps", "bidirectional"])
+def test_worker_pool_matches_serial(engine):
+    maze, queries = CASES[1]
+    serial = solve_many(maze, queries, engine=engine)
+    parallel = solve_many(
+        CompiledMaze(maze), queries, workers=2, chunk_size=3, engine=engine
+    )
+    assert parallel == serial
+
+
+def test_iter_solve_many_yields_every_index_once():
+    maze, queries = CASES[0]
+    indices = [i for i, _ in iter_solve_many(maze, queries, workers=2, chunk_size=4)]
+    assert sorted(indices) == list(range(len(queries)))
@@ -0,0 +1,104 @@
+import io
+import json
+
+import pytest
+
+from batch_cli import read_queries, run_batch
+from reference import bfs_cost, open_maze, queries
+from solution_cache import SolutionCache
+
+MAZE = open_maze(15, seed=7)
+
+
+def _lines():
+    lines = [
+        json.dumps({"start": list(s), "direction": d, "end": list(e), "id": i})
+        for i, (s, d, e) in enumerate(queries(MAZE, 30, seed=7))
+    ]
+    lines.insert(5, "not json")
+    lines.insert(12, json.dumps({"start": [-1, 0], "direction": 0, "end": [0, 0]}))
+    return lines
+
+
+def _run(lines, **options):
+    out = io.StringIO()
+    run_batch(MAZE, iter(lines), out=out, err=io.StringIO(), **options)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_results_come_back_in_input_order(workers):
+    records = _run(_lines(), workers=workers, chunk_size=2)
+    assert [record["index"] for record in records] == list(range(32))
+    assert "error" in records[5] and "error" in records[12]
+    for record in records:
+        if "error" not in record:
+            query = (tuple(record["start"]), record["direction"], tuple(record["end"]))
+            assert record["cost"] == bfs_cost(MAZE, *query)
+            if record["path"] is not None:
+                assert len(record["path"]) == record["cost"] + 1
+
+
+def test_cached_results_keep_their_place(tmp_path):
+    cache = SolutionCache(str(tmp_path / "cache.sqlite"))
+    lines = _lines()
+    first = _run(lines[:10], cache=cache)
+    again = _run(lines, cache=cache, workers=2, chunk_size=3)
+    cache.close()
+    assert [record["index"] for record in again] == list(range(32))
+    assert all(record.get("cached") for record in again[:10] if "error" not in record)
+    assert [r.get("cost") for r in again[:10]] == [r.get("cost") for r in first]
+
+
+def test_csv_and_direction_names():
+    lines = ["start_r,start_c,direction,end_r,end_c,id", "1,1,north,2,2,a"]
+    ((query_id, query, error),) = read_queries(lines)
+    assert (query_id, query, error) == ("a", ((1, 1), 0, (2, 2)), None)
+
+
+class _ReadAhead:
+    """Counts input lines read and records how far reading runs ahead of
+    the written results."""
+
+    def __init__(self, lines):
+        self.lines = lines
+        self.read = self.written = self.ahead = 0
+
+    def __iter__(self):
+        for line in self.lines:
+            self.read += 1
+            yield line
+
+    def write(self, text):
+        self.written += text.count("\n")
+        self.ahead = max(self.ahead, self.read - self.written)
+
+    def flush(self):
+        pass
+
+
+def test_parallel_input_is_read_in_a_bounded_window():
+    lines = [
+        json.dumps({"start": list(s), "direction": d, "end": list(e)})
+        for s, d, e in queries(MAZE, 50, seed=3) * 8
+    ]
+    source = _ReadAhead(lines)
+    counts = run_batch(
+        MAZE, source, workers=2, chunk_size=2, out=source, err=io.StringIO()
+    )
+    assert source.written == len(lines) == counts["solved"] + counts["unsolvable"]
+    # 4 * workers * chunk_size queries, plus the one read before blocking.
+    assert source.ahead <= 4 * 2 * 2 + 1
+
+
+def test_summary_counts_cached_results(tmp_path):
+    cache = SolutionCache(str(tmp_path / "cache.sqlite"))
+    lines = _lines()
+    _run(lines[:10], cache=cache)
+    err = io.StringIO()
+    counts = run_batch(MAZE, iter(lines), cache=cache, out=io.StringIO(), err=err)
+    cache.close()
+    # One of the first ten lines is malformed.
+    assert counts["cached"] == 9
+    solved = counts["solved"] + counts["unsolvable"]
+    assert err.getvalue().startswith(f"{solved + counts['invalid']} queries in ")
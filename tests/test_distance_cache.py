@@ -0,0 +1,82 @@
+import pytest
+
+from compiled_maze import CompiledMaze
+from distance_cache import GoalDistanceCache, goal_distance_field
+from reference import assert_legal_path, bfs_cost, cases, dfs_maze
+
+CASES = cases(count=6)
+
+
+@pytest.mark.parametrize("maze, queries", CASES)
+def test_paths_match_bfs(maze, queries):
+    compiled = CompiledMaze(maze)
+    cache = GoalDistanceCache()
+    for query in queries:
+        path = cache.solve(compiled, *query)
+        expected = bfs_cost(maze, *query)
+        if expected is None:
+            assert path is None
+        else:
+            assert len(path) - 1 == expected
+            assert_legal_path(maze, path, *query)
+
+
+@pytest.mark.parametrize("maze, queries", CASES)
+def test_field_holds_every_states_distance(maze, queries):
+    compiled = CompiledMaze(maze)
+    end_pos = queries[0][2]
+    dist = goal_distance_field(compiled, end_pos)
+    for r, row in enumerate(maze):
+        for c, cell in enumerate(row):
+            if cell or (r, c) == end_pos:
+                continue
+            for direction in range(4):
+                expected = bfs_cost(maze, (r, c), direction, end_pos)
+                idx = compiled.state_index((r, c), direction)
+                assert dist[idx] == (-1 if expected is None else expected)
+
+
+def test_hits_and_misses():
+    maze = dfs_maze(15, 1)
+    cache = GoalDistanceCache()
+    cache.solve(CompiledMaze(maze), (1, 1), 1, (13, 13))
+    # An equal grid compiled again shares the cached field.
+    cache.solve(CompiledMaze(maze), (13, 1), 0, (13, 13))
+    cache.solve(maze, (1, 1), 1, (1, 13))
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+    assert stats["bytes"] == 2 * CompiledMaze(maze).n_states * 4
+
+
+def test_least_recently_used_field_is_evicted():
+    compiled = CompiledMaze(dfs_maze(15, 2))
+    field_bytes = compiled.n_states * 4
+    cache = GoalDistanceCache(max_bytes=2 * field_bytes)
+    a, b, c = (1, 1), (1, 13), (13, 13)
+    cache.distance_field(compiled, a)
+    cache.distance_field(compiled, b)
+    cache.distance_field(compiled, a)
+    cache.distance_field(compiled, c)
+    assert (cache.evictions, len(cache)) == (1, 2)
+    assert cache.current_bytes == 2 * field_bytes
+
+    misses = cache.misses
+    cache.distance_field(compiled, a)
+    assert cache.misses == misses
+    cache.distance_field(compiled, b)
+    assert cache.misses == misses + 1
+
+
+def test_field_over_max_bytes_is_used_but_not_kept():
+    maze = dfs_maze(15, 3)
+    cache = GoalDistanceCache(max_bytes=100)
+    path = cache.solve(maze, (1, 1), 1, (13, 13))
+    assert len(path) - 1 == bfs_cost(maze, (1, 1), 1, (13, 13))
+    assert (len(cache), cache.current_bytes, cache.evictions) == (0, 0, 0)
+
+
+def test_clear():
+    cache = GoalDistanceCache()
+    cache.solve(dfs_maze(15, 4), (1, 1), 1, (13, 13))
+    cache.clear()
+    assert (len(cache), cache.current_bytes) == (0, 0)
@@ -0,0 +1,123 @@
+import pytest
+
+from bidirectional import bidirectional_search
+from compiled_maze import CompiledMaze
+from maze_solver import SearchBuffers, solve_maze_a_star
+from reference import STEPS, assert_legal_path, bfs_cost, cases, open_maze
+
+CASES = cases()
+
+
+@pytest.mark.parametrize("engine", ["node", "array", "jps", "bidirectional"])
+@pytest.mark.parametrize("maze, queries", CASES)
+def test_shortest_path_matches_bfs(engine, maze, queries):
+    for query in queries:
+        path = solve_maze_a_star(maze, *query, verbose=False, engine=engine)
+        expected = bfs_cost(maze, *query)
+        if expected is None:
+            assert path is None
+        else:
+            assert len(path) - 1 == expected
+            assert_legal_path(maze, path, *query)
+
+
+@pytest.mark.parametrize("maze, queries", CASES)
+def test_compiled_maze_gives_the_raw_grid_paths(maze, queries):
+    compiled = CompiledMaze(maze)
+    for query in queries:
+        assert solve_maze_a_star(
+            compiled, *query, verbose=False, engine="array"
+        ) == solve_maze_a_star(maze, *query, verbose=False, engine="array")
+
+
+def test_successor_table_follows_the_movement_rules():
+    maze = open_maze(9, seed=3)
+    compiled = CompiledMaze(maze)
+    for r in range(9):
+        for c in range(9):
+            for facing in range(4):
+                expected = set()
+                for direction in (facing, (facing + 1) % 4, (facing + 3) % 4):
+                    nr, nc = r + STEPS[direction][0], c + STEPS[direction][1]
+                    inside = 0 <= nr < 9 and 0 <= nc < 9
+                    if not maze[r][c] and inside and not maze[nr][nc]:
+                        expected.add(compiled.state_index((nr, nc), direction))
+                idx = compiled.state_index((r, c), facing)
+                assert set(compiled.successors(idx).tolist()) == expected
+
+
+def test_predecessor_table_reverses_the_successors():
+    maze = open_maze(9, seed=4)
+    compiled = CompiledMaze(maze)
+    rev_offsets, rev_sources = compiled.predecessor_table()
+    expected = {idx: set() for idx in range(compiled.n_states)}
+    for idx in range(compiled.n_states):
+        for target in compiled.successors(idx).tolist():
+            expected[target].add(idx)
+    for idx in range(compiled.n_states):
+        sources = rev_sources[rev_offsets[idx] : rev_offsets[idx + 1]].tolist()
+        assert sorted(sources) == sorted(expected[idx])
+        (r, c), _ = compiled.state_of(idx)
+        if maze[r][c]:
+            assert sources == []
+
+
+def _ring_maze():
+    """A closed 5x5 corridor loop plus one cell no move reaches."""
+    maze = [[1] * 9 for _ in range(7)]
+    for i in range(1, 6):
+        maze[1][i] = maze[5][i] = maze[i][1] = maze[i][5] = 0
+    maze[3][7] = 0
+    return maze
+
+
+@pytest.mark.parametrize("engine", ["array", "jps"])
+def test_closed_loop_without_exit(engine):
+    maze = _ring_maze()
+    for facing in range(4):
+        assert (
+            solve_maze_a_star(maze, (1, 3), facing, (3, 7), verbose=False, engine=engine)
+            is None
+        )
+    path = solve_maze_a_star(maze, (1, 1), 0, (5, 1), verbose=False, engine=engine)
+    assert len(path) - 1 == bfs_cost(maze, (1, 1), 0, (5, 1)) == 12
+
+
+@pytest.mark.parametrize("engine", ["node", "array", "jps", "bidirectional"])
+def test_start_on_the_goal(engine):
+    maze = [[0, 0], [0, 0]]
+    assert solve_maze_a_star(maze, (0, 0), 1, (0, 0), False, engine) == [(0, 0)]
+
+
+@pytest.mark.parametrize("maze, queries", CASES[:6])
+def test_bidirectional_expansion_counts(maze, queries):
+    compiled = CompiledMaze(maze)
+    buffers = SearchBuffers(compiled.n_states)
+    for query in queries:
+        result = solve_maze_a_star(
+            compiled, *query, verbose=False, engine="bidirectional", with_stats=True
+        )
+        bidirectional_search(compiled, *query, buffers)
+        assert result.expanded_forward == buffers.expanded_forward
+        assert result.expanded_backward == buffers.expanded_backward
+        assert result.expanded == buffers.expanded
+        assert result.expanded_forward + result.expanded_backward == result.expanded
+
+        one_way = solve_maze_a_star(maze, *query, verbose=False, with_stats=True)
+        assert one_way.expanded_forward is None and one_way.expanded_backward is None
+
+
+@pytest.mark.parametrize("maze, queries", CASES[:6])
+def test_bidirectional_search_stays_off_walls(maze, queries):
+    touched = []
+
+    def tracer(event, position, direction, g_cost, f_cost, **details):
+        if event in ("pop", "push"):
+            touched.append(position)
+
+    for query in queries:
+        solve_maze_a_star(
+            maze, *query, verbose=False, engine="bidirectional", tracer=tracer
+        )
+    assert touched
+    assert not [(r, c) for r, c in touched if maze[r][c]]
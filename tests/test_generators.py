@@ -0,0 +1,79 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+from generators import GENERATORS, eller_rows, generate
+
+ALGORITHMS = sorted(GENERATORS)
+
+
+def _assert_perfect(grid):
+    """Every path cell is reachable and the open cells form a tree."""
+    rows, cols = grid.shape
+    assert grid[0].all() and grid[-1].all() and grid[:, 0].all() and grid[:, -1].all()
+    assert not grid[1::2, 1::2].any()
+    open_cells = {(r, c) for r in range(rows) for c in range(cols) if grid[r, c] == 0}
+    edges = sum(
+        ((r + 1, c) in open_cells) + ((r, c + 1) in open_cells)
+        for r, c in open_cells
+    )
+    # A connected graph with one edge fewer than its vertices has no cycle.
+    assert edges == len(open_cells) - 1
+
+    start = min(open_cells)
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        r, c = queue.popleft()
+        for nxt in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if nxt in open_cells and nxt not in seen:
+                seen.add(nxt)
+                queue.append(nxt)
+    assert seen == open_cells
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("seed", range(3))
+def test_mazes_are_perfect(algorithm, seed):
+    grid = generate(21, 31, algorithm, seed=seed)
+    assert grid.dtype == np.uint8 and grid.shape == (21, 31)
+    _assert_perfect(grid)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_same_seed_same_maze(algorithm):
+    first = generate(25, 25, algorithm, seed=11)
+    assert np.array_equal(first, generate(25, 25, algorithm, seed=11))
+    assert not np.array_equal(first, generate(25, 25, algorithm, seed=12))
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_batches_are_seeded_and_perfect(algorithm):
+    batch = generate(11, 15, algorithm, seed=5, count=6)
+    assert batch.dtype == np.uint8 and batch.shape == (6, 11, 15)
+    assert np.array_equal(batch, generate(11, 15, algorithm, seed=5, count=6))
+    for grid in batch:
+        _assert_perfect(grid)
+    # Mazes in one batch are drawn independently.
+    assert len({grid.tobytes() for grid in batch}) > 1
+
+
+def test_eller_rows_stream_a_perfect_maze():
+    rows = list(eller_rows(17, 23, seed=4))
+    assert all(row.dtype == np.uint8 and row.shape == (23,) for row in rows)
+    grid = np.stack(rows)
+    assert grid.shape == (17, 23)
+    _assert_perfect(grid)
+    assert np.array_equal(grid, np.stack(list(eller_rows(17, 23, seed=4))))
+
+
+@pytest.mark.parametrize("size", [(4, 5), (5, 4), (1, 5)])
+def test_rejects_even_or_tiny_sizes(size):
+    with pytest.raises(ValueError):
+        generate(*size)
+
+
+def test_rejects_unknown_algorithm():
+    with pytest.raises(ValueError, match="Unknown algorithm"):
+        generate(5, 5, "prim")
@@ -0,0 +1,38 @@
+import pytest
+
+from heuristics import HEURISTICS, LandmarkHeuristic, get_heuristic
+from maze_solver import solve_maze_a_star
+from reference import bfs_cost, cases
+
+CASES = cases(count=6, size=17)
+
+
+def _heuristics(maze):
+    return list(HEURISTICS.values()) + [LandmarkHeuristic(maze, count=3)]
+
+
+@pytest.mark.parametrize("maze, queries", CASES)
+def test_estimates_never_exceed_the_true_cost(maze, queries):
+    for heuristic in _heuristics(maze):
+        for start_pos, _, end_pos in queries:
+            for facing in range(4):
+                cost = bfs_cost(maze, start_pos, facing, end_pos)
+                if cost is not None:
+                    assert heuristic(start_pos, end_pos) <= cost, heuristic.name
+
+
+@pytest.mark.parametrize("engine", ["node", "array", "jps"])
+@pytest.mark.parametrize("maze, queries", CASES)
+def test_every_heuristic_keeps_paths_shortest(engine, maze, queries):
+    for heuristic in _heuristics(maze):
+        for query in queries:
+            path = solve_maze_a_star(
+                maze, *query, verbose=False, engine=engine, heuristic=heuristic
+            )
+            expected = bfs_cost(maze, *query)
+            assert (None if path is None else len(path) - 1) == expected
+
+
+def test_unknown_heuristic_name():
+    with pytest.raises(ValueError, match="Unknown heuristic"):
+        get_heuristic("chebyshev")
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from incremental import IncrementalPlanner
+from reference import assert_legal_path, bfs_cost, open_maze, queries
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_replanning_after_edits_matches_bfs(seed):
+    maze = open_maze(13, seed, density=0.25)
+    start_pos, facing, end_pos = queries(maze, 1, seed)[0]
+    original = [row[:] for row in maze]
+    planner = IncrementalPlanner(maze, start_pos, facing, end_pos)
+    rng = random.Random(seed)
+    for _ in range(25):
+        path = planner.plan()
+        expected = bfs_cost(planner.maze, start_pos, facing, end_pos)
+        if expected is None:
+            assert path is None
+        else:
+            assert len(path) - 1 == expected
+            assert_legal_path(planner.maze, path, start_pos, facing, end_pos)
+        # Toggle a cell, often one on the current path.
+        if path and len(path) > 2 and rng.random() < 0.5:
+            r, c = rng.choice(path[1:-1])
+        else:
+            r, c = rng.randrange(13), rng.randrange(13)
+            if (r, c) in (start_pos, end_pos):
+                continue
+        planner.set_cell(r, c, 1 - planner.maze[r][c])
+    assert maze == original
+
+
+@pytest.mark.parametrize("cell", [(-1, 0), (0, -1), (5, 0), (0, 5)])
+def test_set_cell_outside_the_maze(cell):
+    planner = IncrementalPlanner([[0] * 5 for _ in range(5)], (0, 0), 1, (4, 4))
+    with pytest.raises(IndexError):
+        planner.set_cell(*cell, 1)
+    assert planner.maze == [[0] * 5 for _ in range(5)]
+
+
+def test_set_cell_on_the_start_cell():
+    planner = IncrementalPlanner([[0] * 5 for _ in range(5)], (0, 0), 1, (4, 4))
+    with pytest.raises(ValueError):
+        planner.set_cell(0, 0, 1)
+    assert planner.maze[0][0] == 0
+    assert len(planner.plan()) - 1 == 8
@@ -0,0 +1,19 @@
+import pytest
+
+from main import parse_args
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["--weight", "0.5"], ["--weight", "-2"], ["--time-budget", "-1"]],
+)
+def test_rejects_out_of_range_search_options(argv, capsys):
+    with pytest.raises(SystemExit) as error:
+        parse_args(argv)
+    assert error.value.code == 2
+    assert argv[0] in capsys.readouterr().err
+
+
+def test_accepts_boundary_search_options():
+    args = parse_args(["--weight", "1", "--time-budget", "0"])
+    assert (args.weight, args.time_budget) == (1, 0)
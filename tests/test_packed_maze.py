@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from maze_solver import solve_maze_a_star
+from packed_maze import load, pack, write_generated, write_rows
+from reference import bfs_cost, open_maze, queries
+
+
+@pytest.mark.parametrize("cols", [1, 7, 8, 13])
+def test_save_and_load_round_trip(tmp_path, cols):
+    maze = [row[:cols] for row in open_maze(16, seed=cols)[:11]]
+    path = tmp_path / "maze.bits"
+    pack(maze, seed=5).save(path)
+    loaded = load(path, verify=True)
+    assert loaded.seed == 5
+    assert np.array_equal(np.asarray(loaded), maze)
+    assert [[loaded[r][c] for c in range(cols)] for r in range(11)] == maze
+
+
+def test_write_rows_matches_pack(tmp_path):
+    maze = open_maze(12, seed=1)
+    path = tmp_path / "maze.bits"
+    write_rows(path, 12, 12, iter(maze))
+    loaded = load(path, verify=True)
+    assert loaded.checksum == pack(maze).checksum
+    assert np.array_equal(np.asarray(loaded), maze)
+
+
+def test_corruption_is_detected(tmp_path):
+    path = tmp_path / "maze.bits"
+    write_generated(path, 21, 21, seed=3)
+    load(path, verify=True)
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0x01
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="corrupt"):
+        load(path, verify=True)
+
+
+@pytest.mark.parametrize("engine", ["node", "array"])
+def test_packed_mazes_solve_like_lists(engine):
+    maze = open_maze(15, seed=2)
+    packed = pack(maze)
+    for query in queries(maze, 10, seed=2):
+        path = solve_maze_a_star(packed, *query, verbose=False, engine=engine)
+        assert (None if path is None else len(path) - 1) == bfs_cost(maze, *query)
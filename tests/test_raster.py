@@ -0,0 +1,111 @@
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+import raster
+from maze_solver import solve_maze_a_star
+from packed_maze import pack
+from reference import dfs_maze
+
+MAZE = dfs_maze(11, 3)
+START, END = (1, 1), (9, 9)
+PATH = solve_maze_a_star(MAZE, START, 1, END, verbose=False)
+
+
+def _read_png(filename):
+    with open(filename, "rb") as handle:
+        data = handle.read()
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    chunks = []
+    position = 8
+    while position < len(data):
+        (length,) = struct.unpack(">I", data[position : position + 4])
+        tag = data[position + 4 : position + 8]
+        body = data[position + 8 : position + 8 + length]
+        crc = data[position + 8 + length : position + 12 + length]
+        assert crc == struct.pack(">I", zlib.crc32(tag + body))
+        chunks.append((tag, body))
+        position += 12 + length
+    assert [tag for tag, _ in chunks] == [b"IHDR", b"IDAT", b"IEND"]
+    width, height, depth, color_type, _, _, interlace = struct.unpack(
+        ">IIBBBBB", chunks[0][1]
+    )
+    assert (depth, color_type, interlace) == (8, 2, 0)
+    raw = np.frombuffer(zlib.decompress(chunks[1][1]), dtype=np.uint8)
+    raw = raw.reshape(height, 1 + width * 3)
+    assert not raw[:, 0].any()
+    return raw[:, 1:].reshape(height, width, 3)
+
+
+def _read_ppm(filename):
+    with open(filename, "rb") as handle:
+        data = handle.read()
+    magic, size, depth, pixels = data.split(b"\n", 3)
+    width, height = map(int, size.split())
+    assert (magic, depth) == (b"P6", b"255")
+    return np.frombuffer(pixels, dtype=np.uint8).reshape(height, width, 3)
+
+
+READERS = {".png": _read_png, ".ppm": _read_ppm}
+
+
+@pytest.mark.parametrize("scale", [1, 3])
+def test_render_colours_and_size(scale):
+    image = raster.render(MAZE, PATH, START, END, scale=scale)
+    assert image.dtype == np.uint8
+    assert image.shape == (11 * scale, 11 * scale, 3)
+    on_path = set(PATH)
+    for r, row in enumerate(MAZE):
+        for c, cell in enumerate(row):
+            if (r, c) == START:
+                colour = raster.START
+            elif (r, c) == END:
+                colour = raster.END
+            elif (r, c) in on_path:
+                colour = raster.PATH
+            else:
+                colour = raster.WALL if cell else raster.OPEN
+            block = image[r * scale : (r + 1) * scale, c * scale : (c + 1) * scale]
+            assert (block == colour).all()
+
+
+def test_render_accepts_packed_mazes_and_directed_paths():
+    directed = [(r, c, 0) for r, c in PATH]
+    expected = raster.render(MAZE, PATH, START, END)
+    assert np.array_equal(raster.render(pack(MAZE), directed, START, END), expected)
+
+
+@pytest.mark.parametrize("extension", [".png", ".ppm", ".PNG"])
+def test_saved_images_round_trip(tmp_path, extension):
+    image = raster.render(MAZE, PATH, START, END, scale=2)
+    filename = str(tmp_path / f"maze{extension}")
+    raster.save_image(filename, image)
+    assert np.array_equal(READERS[extension.lower()](filename), image)
+
+
+def test_non_square_images_keep_width_and_height(tmp_path):
+    image = np.zeros((3, 5, 3), dtype=np.uint8)
+    image[0, 4] = (1, 2, 3)
+    for extension, read in READERS.items():
+        filename = str(tmp_path / f"wide{extension}")
+        raster.save_image(filename, image)
+        assert np.array_equal(read(filename), image)
+
+
+def test_unknown_image_format(tmp_path):
+    with pytest.raises(ValueError, match="Unknown image format"):
+        raster.save_image(str(tmp_path / "maze.gif"), np.zeros((1, 1, 3), np.uint8))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_export_images(tmp_path, workers):
+    jobs = [
+        (str(tmp_path / f"{i}.png"), MAZE, PATH, START, END) for i in range(4)
+    ]
+    written = list(raster.export_images(jobs, workers=workers, scale=2))
+    assert sorted(written) == sorted(job[0] for job in jobs)
+    expected = raster.render(MAZE, PATH, START, END, scale=2)
+    for filename in written:
+        assert np.array_equal(_read_png(filename), expected)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+import mazes
+from reference import bfs_cost, open_maze, queries
+from solution_cache import SolutionCache, maze_hash
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(mazes, "MAZE_DIR", str(tmp_path))
+    monkeypatch.setattr(mazes, "MAZE_LOADERS", dict(mazes.MAZE_LOADERS))
+    return tmp_path
+
+
+def test_saved_maze_loads_once(store):
+    maze = open_maze(9, seed=1)
+    mazes.save_maze("small", maze, seed=1)
+    loaded = mazes.load_maze("small")
+    assert loaded is mazes.load_maze("small")
+    assert np.array_equal(np.asarray(loaded), maze)
+    assert "small" in mazes.maze_names()
+
+
+def test_resaving_keeps_loaded_mazes_readable(store):
+    mazes.save_maze("small", open_maze(9, seed=1))
+    old = mazes.load_maze("small")
+    before = np.asarray(old).copy()
+    replacement = open_maze(9, seed=2)
+    mazes.save_maze("small", replacement)
+    assert np.array_equal(np.asarray(old), before)
+    assert np.array_equal(np.asarray(mazes.load_maze("small")), replacement)
+
+
+@pytest.mark.parametrize("name", ["", ".", "..", "../x", "a/b", "a\\b"])
+def test_names_must_not_be_paths(store, name):
+    with pytest.raises(ValueError, match="Invalid maze name"):
+        mazes.save_maze(name, [[0]])
+    assert not (store.parent / "x.bits").exists()
+
+
+def test_unknown_maze():
+    with pytest.raises(ValueError, match="Unknown maze"):
+        mazes.load_maze("no such maze")
+
+
+def test_cache_serves_shortest_paths(tmp_path):
+    maze = open_maze(13, seed=4)
+    qs = queries(maze, 8, seed=4)
+    cache = SolutionCache(str(tmp_path / "cache.sqlite"))
+    first = [cache.solve(maze, *query) for query in qs]
+    assert cache.misses == len(qs) and cache.hits == 0
+    cache.close()
+
+    cache = SolutionCache(str(tmp_path / "cache.sqlite"))
+    again = [cache.solve(np.array(maze), *query) for query in qs]
+    assert cache.hits == len(qs)
+    assert again == [None if path is None else list(path) for path in first]
+    for query, path in zip(qs, again):
+        assert (None if path is None else len(path) - 1) == bfs_cost(maze, *query)
+    cache.close()
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    maze = open_maze(13, seed=5)
+    key = maze_hash(maze)
+    cache = SolutionCache(str(tmp_path / "cache.sqlite"), max_bytes=3 * 64)
+    for end in ((0, 1), (0, 2), (0, 3)):
+        cache.store(key, (0, 0), 1, end, "node", None)
+    cache.lookup(key, (0, 0), 1, (0, 1), "node")
+    cache.store(key, (0, 0), 1, (0, 4), "node", None)
+    assert cache.evictions == 1
+    assert cache.lookup(key, (0, 0), 1, (0, 1), "node")[0]
+    assert not cache.lookup(key, (0, 0), 1, (0, 2), "node")[0]
+    assert cache.current_bytes <= cache.max_bytes
+    cache.close()
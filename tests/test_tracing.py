@@ -0,0 +1,147 @@
+import pytest
+
+from maze_solver import DIRECTION_NAMES, solve_maze_a_star
+from reference import bfs_cost, open_maze, queries
+from tracing import (
+    EVENTS,
+    ConsoleTracer,
+    MultiTracer,
+    RingBufferRecorder,
+    SampledTracer,
+)
+
+ENGINES = ["node", "array", "jps", "bidirectional"]
+MAZE = open_maze(13, 5, density=0.25)
+QUERY = next(q for q in queries(MAZE, 20, 5) if (bfs_cost(MAZE, *q) or 0) > 6)
+
+
+class _Recorder:
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event, position, direction, g_cost, f_cost, **details):
+        self.events.append((event, position, direction, g_cost, f_cost, details))
+
+
+def _trace(engine, **options):
+    recorder = _Recorder()
+    result = solve_maze_a_star(
+        MAZE, *QUERY, verbose=False, engine=engine, tracer=recorder, **options
+    )
+    return result, recorder.events
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_event_sequence(engine):
+    path, events = _trace(engine)
+    start_pos, facing, end_pos = QUERY
+    assert {event for event, *_ in events} <= set(EVENTS)
+    assert [event for event, *_ in events].count("goal") == 1
+    goal, position, direction, g_cost, f_cost, details = events[-1]
+    assert goal == "goal" and g_cost == f_cost == len(path) - 1
+    if engine != "bidirectional":
+        # The goal is reported for the pop that reached it.
+        assert events[-2][:5] == ("pop", position, direction, g_cost, f_cost)
+        assert position == end_pos
+
+    pushed = {(start_pos, facing)}
+    if engine == "bidirectional":
+        pushed |= {(end_pos, d) for d in range(4)}
+    for i, (event, position, direction, g_cost, f_cost, details) in enumerate(events):
+        assert direction in DIRECTION_NAMES
+        if event == "push":
+            pushed.add((position, direction))
+        elif event == "pop":
+            assert (position, direction) in pushed
+        elif event == "closed_skip":
+            # Always right after the stale pop it skips.
+            assert events[i - 1][:5] == ("pop", position, direction, g_cost, f_cost)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_event_fields(engine):
+    _, events = _trace(engine)
+    # Pops expand in key order, per side for the bidirectional engine; a
+    # push costs one move (or its jump length) more than the state expanded.
+    last_key = {}
+    expanded_g = {}
+    for event, position, direction, g_cost, f_cost, details in events[:-1]:
+        side = details.get("side")
+        if engine == "bidirectional":
+            assert side in ("forward", "backward")
+        else:
+            assert side is None and f_cost >= g_cost
+        if event == "pop":
+            assert f_cost >= last_key.get(side, f_cost) - 1e-9
+            last_key[side] = f_cost
+            expanded_g[side] = g_cost
+        elif event == "push" and side in expanded_g:
+            step = details["jump"] if engine == "jps" else 1
+            assert g_cost == expanded_g[side] + step
+    if engine == "jps":
+        assert all(
+            details["jump"] >= 1 for event, *_, details in events if event == "push"
+        )
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_events_agree_with_search_stats(engine):
+    result, events = _trace(engine, with_stats=True)
+    counts = {event: 0 for event in EVENTS}
+    for event, *_ in events:
+        counts[event] += 1
+    initial = 5 if engine == "bidirectional" else 1
+    assert result.pushed == counts["push"] + initial
+    assert result.popped == counts["pop"]
+    assert result.duplicates == counts["closed_skip"]
+
+
+def test_console_tracer(capsys):
+    tracer = ConsoleTracer()
+    tracer("pop", (1, 2), 1, 0, 3.0)
+    tracer("push", (1, 3), 1, 1, 3.0)
+    tracer("pop", (1, 3), 1, 1, 3.0)
+    assert capsys.readouterr().out.splitlines() == [
+        "Step 0: Current Position: (1, 2), Facing: East",
+        "Step 1: Current Position: (1, 3), Facing: East",
+    ]
+    ConsoleTracer(events=("push",))("push", (2, 2), 2, 4, 5.5, side="forward")
+    assert capsys.readouterr().out == (
+        "PUSH: Position: (2, 2), Facing: South g=4 f=5.50 side=forward\n"
+    )
+
+
+def test_ring_buffer_keeps_the_latest_events():
+    recorder = RingBufferRecorder(capacity=10)
+    _, events = _trace("array")
+    for event, position, direction, g_cost, f_cost, details in events:
+        recorder(event, position, direction, g_cost, f_cost, **details)
+    assert recorder.events() == [record[:5] for record in events[-10:]]
+    assert recorder.events("goal") == [events[-1][:5]]
+    assert sum(recorder.counts.values()) == len(events)
+    recorder.clear()
+    assert recorder.events() == [] and not recorder.counts
+
+
+def test_sampled_tracer():
+    _, events = _trace("node")
+    runs = []
+    for _ in range(2):
+        recorder = RingBufferRecorder()
+        sampler = SampledTracer(recorder, rate=0.3, seed=4)
+        for event, position, direction, g_cost, f_cost, details in events:
+            sampler(event, position, direction, g_cost, f_cost, **details)
+        runs.append(recorder.events())
+    assert runs[0] == runs[1]
+    assert 0 < len(runs[0]) < len(events)
+    assert runs[0][-1] == events[-1][:5]
+    with pytest.raises(ValueError):
+        SampledTracer(recorder, rate=0)
+
+
+def test_multi_tracer_forwards_everything():
+    first, second = _Recorder(), _Recorder()
+    solve_maze_a_star(
+        MAZE, *QUERY, verbose=False, engine="jps", tracer=MultiTracer(first, second)
+    )
+    assert first.events == second.events == _trace("jps")[1]